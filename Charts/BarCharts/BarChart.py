@@ -0,0 +1,371 @@
+__version__ = "1.0.0"
+__author__ = "Michael Saracen"
+
+import sys
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QMargins, QPoint, QPointF, QRect, Signal
+from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPen, Qt
+from PySide6.QtWidgets import QApplication, QWidget
+
+from BarCharts._Bar import _Bar
+from BarCharts._CubeItemData import _CubeItemData
+from utils import add_shadow
+from utils.cache import BrushCache, TextCache
+
+
+class BarChart(QWidget):
+    """
+    Zeichnet beliebig viele Balken als Cubes in einem einzigen ``paintEvent``.\n
+    Im Gegensatz zu ``CubeItem`` ist ein Balken kein eigenes Widget, sondern ein Datensatz (``_Bar``).
+    Hover und Klick werden über einen Index der x-Bereiche (``bisect``) aufgelöst.
+    """
+    __CUBE_RATIO: float = 0.35
+    __FLAT_PITCH: float = 16.0
+    __MARGINS: QMargins = QMargins(8, 8, 8, 8)
+    __SLOT_FILL: float = 0.9
+
+    itemClicked: Signal = Signal(int)
+
+    __bars: List[_Bar]
+    __base_color: QColor
+    __drawn: List[int]
+    __flat: bool
+    __font: QFont
+    __hovered: Optional[int]
+    __layout_dirty: bool
+    __lefts: List[int]
+    __max_value: float
+    __rights: List[int]
+
+    def __init__(self, parent: QWidget=None):
+        super().__init__(parent=parent)
+        self.setMinimumSize(200, 200)
+        self.setMouseTracking(True)
+
+        self.__bars = list()
+        self.__base_color = QColor(6, 120, 182)
+        self.__drawn = list()
+        self.__flat = False
+        self.__font = TextCache.shared().font("Roboto", 11, 600)
+        self.__hovered = None
+        self.__layout_dirty = True
+        self.__lefts = list()
+        self.__max_value = 0.0
+        self.__rights = list()
+
+        add_shadow(self)
+
+    def bar_at(self, pos: QPointF) -> Optional[int]:
+        """
+        Gibt den Index des Balkens unter ``pos`` wieder oder ``None``.
+        :param pos:
+        :return: Optional[int]
+        """
+        self.__ensure_layout()
+        point: QPoint = QPointF(pos).toPoint()
+        i: int = bisect_right(self.__lefts, point.x()) - 1
+        if i < 0:
+            return None
+
+        index: int = self.__drawn[i]
+        bar: _Bar = self.__bars[index]
+        if not bar.bounds.contains(point):
+            return None
+        if bar.front is not None and not any(
+                polygon.containsPoint(point, Qt.FillRule.OddEvenFill) for polygon in (bar.front, bar.side, bar.top)):
+            return None
+        return index
+
+    @property
+    def bar_colors(self) -> List[QColor]:
+        return [bar.color for bar in self.__bars]
+
+    @bar_colors.setter
+    def bar_colors(self, colors: List[QColor]) -> None:
+        for color, bar in zip(colors, self.__bars):
+            if color.isValid():
+                bar.color = color
+        self.update()
+
+    @property
+    def bar_count(self) -> int:
+        return len(self.__bars)
+
+    @property
+    def entries(self) -> Dict[str, float]:
+        """
+        Gibt ein Dictionary ``Dict[str, float]`` mit den Einträgen des **BarCharts** wieder.
+        :return: Dict[str, float]
+        """
+        return {bar.label: bar.value for bar in self.__bars}
+
+    def leaveEvent(self, event, /):
+        self.__set_hovered(None)
+        super().leaveEvent(event)
+
+    def mouseMoveEvent(self, event, /):
+        self.__set_hovered(self.bar_at(event.position()))
+        super().mouseMoveEvent(event)
+
+    def mousePressEvent(self, event, /):
+        index: Optional[int] = self.bar_at(event.position())
+        if index is not None:
+            self.itemClicked.emit(index)
+        super().mousePressEvent(event)
+
+    def paintEvent(self, event, /):
+        """
+        Zeichnet alle Balken, die in ``event.rect()`` liegen.
+        """
+        self.__ensure_layout()
+        dirty: QRect = event.rect()
+
+        painter: QPainter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(dirty, Qt.GlobalColor.white)
+
+        first: int = bisect_left(self.__rights, dirty.left())
+        last: int = bisect_right(self.__lefts, dirty.right())
+        visible: List[int] = self.__drawn[first:last]
+
+        if self.__flat:
+            painter.setPen(Qt.PenStyle.NoPen)
+            for index in visible:
+                bar: _Bar = self.__bars[index]
+                painter.setBrush(BrushCache.shared().bounding_gradient(self.__color_of(index)))
+                painter.drawRect(bar.bounds)
+            return
+
+        for index in visible:
+            bar: _Bar = self.__bars[index]
+            front, side, top, pen = self.__faces(self.__color_of(index))
+            painter.setPen(pen)
+            painter.setBrush(front)
+            painter.drawPolygon(bar.front)
+            painter.setBrush(side)
+            painter.drawPolygon(bar.side)
+            painter.setBrush(top)
+            painter.drawPolygon(bar.top)
+
+        self.__draw_labels(painter, visible)
+
+    def resizeEvent(self, event, /):
+        self.__layout_dirty = True
+        super().resizeEvent(event)
+
+    def set_entries(self, entries: Dict[str, float], colors: Optional[List[QColor]]=None) -> None:
+        """
+        Setzt die Einträge für das BarChart. Übergeben wird ein Dictionary: ``Dict[str, float]``.\n
+        Die Reihenfolge der Balken entspricht der Reihenfolge des Dictionaries.
+        Werden keine gültigen Werte übergeben, wird ein ``ValueError`` geworfen.
+        :param entries:
+        :param colors: Farben der Balken. Fehlende Farben werden mit der Standardfarbe aufgefüllt.
+        :return:
+        """
+        if not entries:
+            raise ValueError("Es konnten keine Einträge gesetzt werden. Überprüfe diese.")
+
+        colors = colors or []
+        self.__bars = [
+            _Bar(label, value, colors[i] if i < len(colors) else self.__base_color)
+            for i, (label, value) in enumerate(entries.items())
+        ]
+        self.__hovered = None
+        self.__layout_dirty = True
+        self.update()
+
+    def set_value(self, index: int, value: float) -> None:
+        """
+        Setzt den Wert eines einzelnen Balkens.\n
+        Ändert sich dadurch das Maximum nicht, wird nur dieser Balken neu berechnet und gezeichnet.
+        Teilen sich mehrere Balken eine Pixelspalte, wird nur für diese Spalte der höchste Balken neu bestimmt.
+        :param index:
+        :param value:
+        :return:
+        """
+        bar: _Bar = self.__bars[index]
+        if bar.value == value:
+            return
+        old_value: float = bar.value
+        bar.value = value
+
+        if self.__layout_dirty or value > self.__max_value or old_value >= self.__max_value:
+            self.__layout_dirty = True
+            self.update()
+            return
+
+        area: QRect = self.__area()
+        pitch: float = area.width() / len(self.__bars)
+        position: int = index
+        if pitch < 1:
+            # Bei weniger als einem Pixel pro Balken gehört zu jeder Pixelspalte genau ein Eintrag in ``__drawn``
+            position = int(index * pitch)
+            drawn: int = self.__drawn[position]
+            winner: int = self.__column_winner(position, pitch)
+            if winner == drawn != index:
+                # Der geänderte Balken bleibt verdeckt
+                return
+            old_bounds: QRect = QRect(self.__bars[drawn].bounds)
+            self.__drawn[position] = index = winner
+            bar = self.__bars[index]
+        else:
+            old_bounds = QRect(bar.bounds)
+
+        self.__place(bar, area.left() + int(index * pitch), self.__slot_width(), area)
+        self.__lefts[position] = bar.bounds.left()
+        self.__rights[position] = bar.bounds.right()
+        self.update(old_bounds.united(bar.bounds).adjusted(-2, -2, 2, 2))
+
+    def __area(self) -> QRect:
+        return self.rect().marginsRemoved(BarChart.__MARGINS)
+
+    def __column_winner(self, column: int, pitch: float) -> int:
+        """
+        Gibt den Index des höchsten Balkens in der Pixelspalte ``column`` wieder, bei gleichen Werten den ersten,
+        wie in ``__ensure_layout``.
+        :param column:
+        :param pitch:
+        :return: int
+        """
+        i: int = max(0, int(column / pitch) - 1)
+        while int(i * pitch) < column:
+            i += 1
+        best: int = i
+        while i < len(self.__bars) and int(i * pitch) == column:
+            if self.__bars[i].value > self.__bars[best].value:
+                best = i
+            i += 1
+        return best
+
+    def __color_of(self, index: int) -> QColor:
+        color: QColor = self.__bars[index].color
+        return color.lighter(150) if index == self.__hovered else color
+
+    def __draw_labels(self, painter: QPainter, visible: List[int]) -> None:
+        cache: TextCache = TextCache.shared()
+        _, text_height = cache.measure(painter, self.__font, "")
+        for index in visible:
+            bar: _Bar = self.__bars[index]
+            r: QRect = bar.label_rect
+            if r.width() < text_height:
+                continue
+
+            painter.save()
+            painter.setClipRect(r)
+            painter.setPen(QPen(self.__color_of(index).darker(200)))
+            painter.translate(r.center().x(), r.bottom() + 8)
+            painter.rotate(-90)
+            cache.draw_at(painter, self.__font, 8, text_height // 4, bar.label)
+            painter.restore()
+
+    def __ensure_layout(self) -> None:
+        """
+        Berechnet die Geometrie aller Balken und den Index der x-Bereiche neu, falls nötig.\n
+        Ist ein Balken schmaler als ``__FLAT_PITCH``, wird nur die Front als Rechteck gezeichnet.
+        Ist er schmaler als ein Pixel, wird pro Pixelspalte nur der höchste Balken gezeichnet.
+        :return:
+        """
+        if not self.__layout_dirty:
+            return
+        self.__layout_dirty = False
+        self.__drawn = list()
+        self.__lefts = list()
+        self.__rights = list()
+        if not self.__bars:
+            return
+
+        area: QRect = self.__area()
+        pitch: float = area.width() / len(self.__bars)
+        self.__flat = pitch < BarChart.__FLAT_PITCH
+        self.__max_value = max(bar.value for bar in self.__bars)
+
+        if pitch >= 1:
+            drawn: List[int] = list(range(len(self.__bars)))
+        else:
+            columns: Dict[int, int] = dict()
+            for i, bar in enumerate(self.__bars):
+                column: int = int(i * pitch)
+                best: Optional[int] = columns.get(column)
+                if best is None or bar.value > self.__bars[best].value:
+                    columns[column] = i
+            drawn = [columns[column] for column in sorted(columns)]
+
+        slot_width: int = self.__slot_width()
+        for i in drawn:
+            bar: _Bar = self.__bars[i]
+            self.__place(bar, area.left() + int(i * pitch), slot_width, area)
+            self.__lefts.append(bar.bounds.left())
+            self.__rights.append(bar.bounds.right())
+        self.__drawn = drawn
+
+    def __faces(self, color: QColor) -> Tuple[QBrush, QBrush, QBrush, QPen]:
+        """
+        Gibt die Brushes für Front, Seite und Deckel sowie den Rahmen eines Cubes in ``color`` wieder.
+        Sie kommen aus dem ``BrushCache``, die Verläufe sind im ``ObjectBoundingMode`` und werden so mit allen
+        Cubes gleicher Farbe geteilt, auch über mehrere Widgets hinweg.
+        :param color:
+        :return: Tuple[QBrush, QBrush, QBrush, QPen]
+        """
+        brushes: BrushCache = BrushCache.shared()
+        return (
+            brushes.bounding_gradient(color),
+            brushes.bounding_gradient(color, 50),
+            brushes.bounding_gradient(color, 200),
+            brushes.outline_pen(color, 3)
+        )
+
+    def __place(self, bar: _Bar, left: int, slot_width: int, area: QRect) -> None:
+        """
+        Berechnet die Geometrie eines Balkens mit linker Kante ``left``.
+        :param bar:
+        :param left:
+        :param slot_width:
+        :param area:
+        :return:
+        """
+        cube_width: int = max(1, int(slot_width * BarChart.__CUBE_RATIO))
+        depth: int = slot_width - cube_width
+        ratio: float = bar.value / self.__max_value if self.__max_value > 0 else 0.0
+        height: int = max(depth + 4, int(area.height() * ratio))
+        top: int = area.bottom() + 1 - height
+
+        if self.__flat:
+            bar.bounds = QRect(left, top, slot_width, height)
+            bar.front = bar.side = bar.top = None
+            bar.label_rect = QRect()
+            return
+
+        data: _CubeItemData = _CubeItemData(x=2, y=2, width=cube_width, height=height, depth=depth)
+        bar.front = data.front.translated(left, top)
+        bar.side = data.side.translated(left, top)
+        bar.top = data.top.translated(left, top)
+        bar.bounds = bar.front.boundingRect().united(bar.side.boundingRect()).united(bar.top.boundingRect())
+        bar.label_rect = bar.front.boundingRect().marginsRemoved(BarChart.__MARGINS)
+
+    def __set_hovered(self, index: Optional[int]) -> None:
+        if index == self.__hovered:
+            return
+        for i in (self.__hovered, index):
+            if i is not None:
+                self.update(self.__bars[i].bounds.adjusted(-2, -2, 2, 2))
+        self.__hovered = index
+
+    def __slot_width(self) -> int:
+        if not self.__bars:
+            return 0
+        pitch: float = self.__area().width() / len(self.__bars)
+        return max(1, int(pitch * BarChart.__SLOT_FILL))
+
+
+if __name__ == '__main__':
+    import random
+
+    app: QApplication = QApplication(sys.argv)
+    w: BarChart = BarChart()
+    w.resize(1200, 600)
+    w.set_entries({f"Bar - {i}": random.uniform(10, 100) for i in range(10000)})
+    w.show()
+
+    app.exec()
@@ -2,24 +2,31 @@ __version__ = "1.0.0"
 __author__ = "Michael Saracen"
 
 import sys
+from typing import Callable, Optional, Tuple
 
-from PySide6.QtCore import Property, QRect, QMargins, Signal
-from PySide6.QtGui import QPainter, QColor, QPolygon, Qt, QPen, QFont, QPainterPath
+from PySide6.QtCore import Property, QRect, Signal, QThreadPool
+from PySide6.QtGui import QPainter, QColor, Qt, QPen, QFont
 from PySide6.QtWidgets import QWidget, QApplication
 
+from BarCharts._CubeGeometry import _CubeGeometry
 from BarCharts._CubeItemData import _CubeItemData
-from utils import linear_gradient, font_metrics, add_shadow
+from utils import add_shadow
 from utils.animations import Behavior
+from utils.cache import BrushCache, LayerCache, TextCache
 
 
 class CubeItem(QWidget):
     itemClicked: Signal = Signal()
+    valueChanged: Signal = Signal(float)
 
     _base_color: QColor
     _click_color: QColor
     _color_fallback: QColor
     _color_hover: QColor
+    _geometry: Optional[_CubeGeometry]
     _label_name: str
+    _layers: Optional[LayerCache]
+    _level: float
     _value: float
 
     def __init__(self, parent: QWidget=None):
@@ -31,6 +38,9 @@ class CubeItem(QWidget):
         self._color_hover = self._base_color.lighter(150)
         self._click_color = self._base_color.lighter(200)
         self._color_fallback = self._base_color
+        self._geometry = None
+        self._layers = None
+        self._level = 1.0
         self._value = 0.0
 
         add_shadow(self)
@@ -54,56 +64,94 @@ class CubeItem(QWidget):
 
     def paintEvent(self, event, /):
         """
-        Zeichnet das CubeItem, einschließlich aller Seitenflächen, der Beschriftung und des Fortschrittstextes.
+        Zeichnet das CubeItem, einschließlich aller Seitenflächen, der Beschriftung und des Fortschrittstextes.\n
+        Mit ``background_rendering`` kommen Seitenflächen und Beschriftung aus der Ebene ``faces``.
         """
         painter: QPainter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.fillRect(event.rect(), Qt.GlobalColor.white)
 
-        front: QPolygon = self.cube_item_data.front
-        self._draw_shape(painter, front)
+        geometry: _CubeGeometry = self.cube_geometry
+        if self._layers is None:
+            self._draw_faces(painter, geometry, self._base_color, self._label_name)
+        else:
+            self._layers.draw(painter, "faces",
+                              lambda p: self._draw_faces(p, geometry, self._base_color, self._label_name),
+                              event.rect(), self._prepare_faces)
 
-        clip_path: QPainterPath = QPainterPath()
-        clip_path.addRect(front.boundingRect().marginsRemoved(QMargins(8,8,8,8)))
-        painter.setClipPath(clip_path)
+    def _draw_faces(self, painter: QPainter, geometry: _CubeGeometry, color: QColor, label: str) -> None:
+        self._draw_shape(painter, geometry, color)
 
-        self._draw_label(painter, front)
+        painter.setClipRect(geometry.label_rect)
+
+        self._draw_label(painter, geometry, color, label)
 
         painter.setClipping(False)
 
-    def _draw_label(self, painter: QPainter, front: QPolygon):
-        painter.setFont(QFont("Roboto", 11, 600))
-        painter.setPen(QPen(self._base_color.darker(200)))
-        text_width, text_height = font_metrics(painter, self._label_name)
+    def _draw_label(self, painter: QPainter, geometry: _CubeGeometry, color: QColor, label: str):
+        cache: TextCache = TextCache.shared()
+        font: QFont = cache.font("Roboto", 11, 600)
+        painter.setPen(QPen(color.darker(200)))
+        text_width, text_height = cache.measure(painter, font, label)
         painter.save()
 
-        r: QRect = front.boundingRect()
+        r: QRect = geometry.front_rect
         painter.translate(r.center().x(), r.bottom())
         painter.rotate(-90)
-        painter.drawText(8,text_height//4, self._label_name)
+        cache.draw_at(painter, font, 8,text_height//4, label)
         painter.restore()
 
-    def _draw_shape(self, painter: QPainter, front: QPolygon):
-        painter.setPen(QPen(
-            QColor.fromHsv(
-                self._base_color.hue(),
-                self._base_color.saturation(),
-                self._base_color.value(),
-                40).lighter(200),
-            3)
-        )
-
+    def _draw_shape(self, painter: QPainter, geometry: _CubeGeometry, color: QColor):
+        # Zwischenfarben einer Animation teilen sich die Brushes einer gerundeten Palette
+        quantise: bool = color not in (self._color_fallback, self._color_hover, self._click_color)
+        brushes: BrushCache = BrushCache.shared()
+        painter.setPen(brushes.outline_pen(color, 3, quantise))
 
-        linear_gradient(painter, self._base_color, front.boundingRect())
-        painter.drawPolygon(front)
+        painter.setBrush(brushes.linear_gradient(color, geometry.front_rect, 100, quantise))
+        painter.drawPolygon(geometry.front)
 
-        side: QPolygon = self.cube_item_data.side
-        linear_gradient(painter, self._base_color.darker(200), front.boundingRect())
-        painter.drawPolygon(side)
+        painter.setBrush(brushes.linear_gradient(color, geometry.front_rect, 50, quantise))
+        painter.drawPolygon(geometry.side)
         #
-        top: QPolygon = self.cube_item_data.top
-        linear_gradient(painter, self._base_color.lighter(200), top.boundingRect())
-        painter.drawPolygon(top)
+        painter.setBrush(brushes.linear_gradient(color, geometry.top_rect, 200, quantise))
+        painter.drawPolygon(geometry.top)
+
+    def _prepare_faces(self) -> Tuple[Callable[[QPainter], None], None]:
+        """
+        Momentaufnahme der Ebene ``faces`` für das Zeichnen im Hintergrund (siehe ``LayerCache.draw``).
+        :return: Tuple[Callable[[QPainter], None], None]
+        """
+        geometry: _CubeGeometry = self.cube_geometry
+        color: QColor = QColor(self._base_color)
+        label: str = self._label_name
+        return lambda painter: self._draw_faces(painter, geometry, color, label), None
+
+    def _bar_height(self, level: float) -> int:
+        return max(self.cube_depth + 4, round(self.height() * level))
+
+    def _build_geometry(self) -> _CubeGeometry:
+        # Der Cube steht unten im Widget, bei einem Füllstand unter 1 bleibt oben Platz
+        data: _CubeItemData = self.cube_item_data
+        return _CubeGeometry(self.size(), data, self.height() - data.height)
+
+    @property
+    def background_rendering(self) -> bool:
+        """
+        Zeichnet Seitenflächen und Beschriftung nach einer Farbänderung auf dem ``QThreadPool.globalInstance()``.
+        Bis die neue Ebene fertig ist, bleibt die bisherige sichtbar.
+        :return: bool
+        """
+        return self._layers is not None
+
+    @background_rendering.setter
+    def background_rendering(self, enabled: bool) -> None:
+        if enabled and self._layers is None:
+            self._layers = LayerCache(self)
+            self._layers.set_thread_pool(QThreadPool.globalInstance())
+        elif not enabled and self._layers is not None:
+            self._layers.set_thread_pool(None)
+            self._layers = None
+        self.update()
 
     def get_base_color(self) -> QColor:
         return self._base_color
@@ -111,15 +159,63 @@ class CubeItem(QWidget):
     def set_base_color(self, clr: QColor) -> None:
         if self._base_color != clr:
             self._base_color = clr
+            if self._layers is not None:
+                self._layers.invalidate("faces", deferred=True)
             self.update()
 
+    def get_level(self) -> float:
+        return self._level
+
+    def set_level(self, level: float) -> None:
+        """
+        Setzt den Füllstand des Cubes zwischen 0 und 1. Bei 1 füllt er die volle Höhe des Widgets aus.\n
+        Neu gezeichnet wird nur, wenn sich die Höhe in Pixeln ändert, und nur der Bereich des alten und neuen Cubes.
+        :param level:
+        :return:
+        """
+        level = min(1.0, max(0.0, level))
+        if self._level == level:
+            return
+        previous: int = self._bar_height(self._level)
+        self._level = level
+        if self._bar_height(level) == previous:
+            return
+
+        dirty: QRect = self.cube_geometry.bounds
+        self._geometry = None
+        if self._layers is not None:
+            self._layers.invalidate("faces")
+        self.update(dirty.united(self.cube_geometry.bounds).adjusted(-2, -2, 2, 2))
+
+    def get_value(self) -> float:
+        return self._value
+
+    def set_value(self, value: float) -> None:
+        # Der Wert selbst wird nicht gezeichnet, die Höhe kommt aus ``level`` (z.B. über ``utils.series.LiveSeries``)
+        if self._value != value:
+            self._value = value
+            self.valueChanged.emit(value)
+
     @property
     def cube_depth(self):
         return int(self.rect().width() - self.cube_width)
 
+    @property
+    def cube_geometry(self) -> _CubeGeometry:
+        """
+        Gibt die gecachte Geometrie des Cubes wieder.
+        Diese wird in ``resizeEvent`` aufgebaut und nur bei einer Änderung der Größe oder des Füllstands
+        neu berechnet.
+        :return: _CubeGeometry
+        """
+        if self._geometry is None or self._geometry.size != self.size():
+            self._geometry = self._build_geometry()
+        return self._geometry
+
     @property
     def cube_item_data(self) -> _CubeItemData:
-        return _CubeItemData(x=2, y=2, width=self.cube_width, height=self.rect().height(), depth=self.cube_depth)
+        return _CubeItemData(x=2, y=2, width=self.cube_width, height=self._bar_height(self._level),
+                             depth=self.cube_depth)
 
     @property
     def cube_width(self) -> int:
@@ -129,9 +225,12 @@ class CubeItem(QWidget):
         if  self.cube_depth + 4 > self.height():
             self.resize(event.oldSize())
             return
+        self._geometry = self._build_geometry()
         super().resizeEvent(event)
 
     base_color = Property(QColor, fget=get_base_color, fset=set_base_color)
+    level = Property(float, fget=get_level, fset=set_level)
+    value = Property(float, fget=get_value, fset=set_value, notify=valueChanged)
 
 
 
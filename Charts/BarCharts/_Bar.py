@@ -0,0 +1,33 @@
+from typing import Optional
+
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QColor, QPolygon
+
+
+class _Bar:
+    """
+    Datensatz eines Balkens im ``BarChart``.\n
+    Die Geometrie (``bounds``, ``front``, ``side``, ``top``, ``label_rect``) wird erst beim Layout gesetzt
+    und nur für Balken, die auch gezeichnet werden.
+    Im flachen Modus bleiben die Polygone ``None`` und nur ``bounds`` wird gezeichnet.
+    """
+    __slots__ = ("bounds", "color", "front", "label", "label_rect", "side", "top", "value")
+
+    bounds: Optional[QRect]
+    color: QColor
+    front: Optional[QPolygon]
+    label: str
+    label_rect: Optional[QRect]
+    side: Optional[QPolygon]
+    top: Optional[QPolygon]
+    value: float
+
+    def __init__(self, label: str, value: float, color: QColor):
+        self.bounds = None
+        self.color = color
+        self.front = None
+        self.label = label
+        self.label_rect = None
+        self.side = None
+        self.top = None
+        self.value = value
@@ -0,0 +1,40 @@
+from PySide6.QtCore import QRect, QMargins, QSize
+from PySide6.QtGui import QPolygon
+
+from BarCharts._CubeItemData import _CubeItemData
+
+
+class _CubeGeometry:
+    """
+    Vorberechnete Geometrie eines Cubes.\n
+    Die Polygone und ihre ``boundingRect``'s werden einmalig pro Größe und Füllstand erzeugt und
+    beim Zeichnen nur noch gelesen. ``offset`` verschiebt den Cube nach unten, z.B. wenn er nicht die volle
+    Höhe des Widgets einnimmt.
+    """
+    __slots__ = ("size", "offset", "front", "side", "top", "front_rect", "side_rect", "top_rect", "label_rect",
+                 "bounds")
+
+    __LABEL_MARGINS: QMargins = QMargins(8, 8, 8, 8)
+
+    size: QSize
+    offset: int
+    front: QPolygon
+    side: QPolygon
+    top: QPolygon
+    front_rect: QRect
+    side_rect: QRect
+    top_rect: QRect
+    label_rect: QRect
+    bounds: QRect
+
+    def __init__(self, size: QSize, data: _CubeItemData, offset: int=0):
+        self.size = QSize(size)
+        self.offset = offset
+        self.front = data.front.translated(0, offset)
+        self.side = data.side.translated(0, offset)
+        self.top = data.top.translated(0, offset)
+        self.front_rect = self.front.boundingRect()
+        self.side_rect = self.side.boundingRect()
+        self.top_rect = self.top.boundingRect()
+        self.label_rect = self.front_rect.marginsRemoved(_CubeGeometry.__LABEL_MARGINS)
+        self.bounds = self.front_rect.united(self.side_rect).united(self.top_rect)
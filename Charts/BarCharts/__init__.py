@@ -1 +1,2 @@
-from .CubeItem import CubeItem
+from .BarChart import BarChart
+from .CubeItem import CubeItem
\ No newline at end of file
@@ -2,16 +2,27 @@ __version__ = "1.0.0"
 __author__ = "Michael Saracen"
 
 
+import heapq
+import math
 import warnings
-from typing import Dict, List, Optional
+from itertools import chain
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Set, Tuple
 
-from PySide6.QtCore import QRect, Property, Signal, QPropertyAnimation, QByteArray, QEasingCurve
+from PySide6.QtCore import QRect, QRectF, QPointF, Property, Signal, QEasingCurve, QThreadPool
 from PySide6.QtGui import QPainter, Qt, QColor, QPainterPath, QFont, QPen
 from PySide6.QtWidgets import QWidget
 
 from DonutCharts.SortType import SortType
-from DonutCharts._PieSlice import PieSlice
-from utils import sort_by_type, percentages_from_values, add_shadow, font_metrics, longest_name
+from DonutCharts._EntryStore import _EntryStore
+from DonutCharts._HitIndex import _HitIndex
+from DonutCharts._Legend import _Legend, _LegendRow
+from DonutCharts._PieLayout import _PieLayout
+from DonutCharts._PieSlice import PieSlice, _SliceGeometry, _SliceState
+from DonutCharts._SortIndex import _SortIndex
+from utils import add_shadow
+from utils.animations import AnimationEngine, Tween
+from utils.cache import LayerCache, TextCache
 
 
 class PieChart(QWidget):
@@ -19,15 +30,39 @@ class PieChart(QWidget):
     __MAX_TITLE_CHARS: int = 24
 
     rotationChanged: Signal = Signal(float)
+    sliceClicked: Signal = Signal(str)
+    sliceEntered: Signal = Signal(str)
+    sliceLeaved: Signal = Signal(str)
+    sortProgressChanged: Signal = Signal(float)
 
-    __entries: Dict[str, float]
-    __percentages: Dict[str, float]
+    __animated: Dict[int, PieSlice]
+    __animating: List[PieSlice]
+    __hit_index: Optional[_HitIndex]
+    __index: _SortIndex
+    __layers: LayerCache
+    __layout: Optional[_PieLayout]
+    __legend: Optional[_Legend]
+    __legend_offset: int
+    __lod_depth: int
+    __lod_threshold: float
+    __ordered: bool
+    __other: Optional[PieSlice]
+    __ring_exclusion: Set[int]
     __rotation: float
-    __rotation_animation: QPropertyAnimation
+    __rotation_animation: Tween
     __show_info: bool
+    __slice_map: Dict[str, PieSlice]
     __slices: list[PieSlice]
+    __spin_base: Optional[float]
+    __sort_animation: Tween
+    __sort_from: Optional[Dict[int, float]]
+    __sort_progress: float
+    __sort_type: SortType
     __title: str
+    __store: _EntryStore
     __title_color: QColor
+    __visible: Optional[List[PieSlice]]
+    __visible_total: float
 
     def __init__(self, parent: QWidget=None):
         super().__init__(parent=parent)
@@ -36,84 +71,290 @@ class PieChart(QWidget):
         # Defaults
         self.hovered_slice: Optional[PieSlice] = None
 
-        self.__entries: Dict[str, float] = dict()
-        self.__percentages = dict()
+        self.__animated = dict()
+        self.__animating = list()
+        self.__hit_index = None
+        self.__index = _SortIndex(self.__value_of)
+        self.__layers = LayerCache(self)
+        self.__layout = None
+        self.__legend = None
+        self.__legend_offset = 0
+        self.__lod_depth = 0
+        self.__lod_threshold = 0.0
+        self.__ordered = True
+        self.__other = None
+        self.__ring_exclusion = set()
         self.__rotation = 0.0
 
-        self.__rotation_animation: QPropertyAnimation = QPropertyAnimation(self, QByteArray(b"rotation"))
-        self.__rotation_animation.setStartValue(0.0)
-        self.__rotation_animation.setEndValue(-360.0)
-        self.__rotation_animation.setDuration(11300)
-        self.__rotation_animation.setEasingCurve(QEasingCurve.Type.InOutBack)
+        self.__rotation_animation = Tween(self, "rotation", duration=11300, easing=QEasingCurve.Type.InOutBack)
         self.__show_info = True
         self.__slice_info = dict()
+        self.__slice_map = dict()
         self.__slices = list()
+        self.__spin_base = None
+        self.__sort_animation = Tween(self, "sort_progress", duration=400, easing=QEasingCurve.Type.InOutCubic)
+        self.__sort_animation.set_range(0.0, 1.0)
+        self.__sort_from = None
+        self.__sort_progress = 1.0
+        self.__sort_type = SortType.HighestValue
         self.__title = "PieChart - Example"
+        self.__store = _EntryStore()
         self.__title_color = QColor(30, 34, 39)
+        self.__visible = None
+        self.__visible_total = 0.0
 
         add_shadow(self)
 
     def mousePressEvent(self, event, /):
-        for pie in self.__slices:
-            if pie.contains(event.pos()):
-                d: dict[str, float] = {pie.text: self.__percentages.get(pie.text)}
-                pie.clicked.emit(d)
-                self.__slice_info = d
-                self.update()
-                break
+        pie: Optional[PieSlice] = self.slice_at(event.position())
+        if pie is not None and pie is self.__other:
+            self.expand_other()
+        elif pie is None and self.__lod_depth and self.__hole_contains(event.position()):
+            self.collapse_other()
+        elif pie is not None:
+            self.sliceClicked.emit(pie.text)
+            self.__slice_info = {pie.text: self.percentages.get(pie.text, 0.0)}
+            self.__layers.invalidate("info")
+            self.update()
 
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event, /):
-        hovered = None
-
-        for pie in self.__slices:
-            if pie.contains(event.pos()):
-                hovered = pie
-                break
+        hovered: Optional[PieSlice] = self.slice_at(event.position())
 
         if hovered is not self.hovered_slice:
             if self.hovered_slice is not None:
-                self.hovered_slice.leaved.emit()
+                self.hovered_slice.on_leave()
+                self.sliceLeaved.emit(self.hovered_slice.text)
 
             if hovered is not None:
-                hovered.entered.emit()
+                # Nur ``PieSlices`` in ``__animated`` haben eine Hover-Animation
+                self.__animated[id(hovered)] = hovered
+                hovered.on_entered()
+                self.sliceEntered.emit(hovered.text)
 
             self.hovered_slice = hovered
 
         super().mouseMoveEvent(event)
 
+    def wheelEvent(self, event, /):
+        legend: Optional[_Legend] = self.__legend
+        if legend is not None and legend.hidden and legend.bounds.contains(event.position().toPoint()):
+            # Nach oben scrollen blättert zu den weiter oben einsortierten Einträgen
+            self.scroll_legend(1 if event.angleDelta().y() > 0 else -1)
+            event.accept()
+            return
+        super().wheelEvent(event)
+
     def paintEvent(self, event, /):
+        """
+        Setzt das PieChart aus gecachten Ebenen zusammen.\n
+        Title, Legende, Info und der Ring aller ruhenden ``PieSlices`` kommen aus dem ``LayerCache``.
+        Pro Frame werden nur die gerade animierten ``PieSlices`` darüber gezeichnet.
+        Alles, was außerhalb von ``event.rect()`` liegt, wird übersprungen.\n
+        Während ``animate_rotation`` wird der Ring nur einmal gezeichnet und pro Frame gedreht (``__draw_spin``).\n
+        Mit ``background_rendering`` werden Ring und Legende nach einer Datenänderung im Hintergrund neu gezeichnet.
+        """
         rect: QRect = self.rect()
+        dirty: QRect = event.rect()
         painter: QPainter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         #painter.fillRect(rect, Qt.GlobalColor.white)
 
-        self.__draw_title(painter)
+        self.__layers.draw(painter, "title", self.__draw_title, dirty)
 
-        hole_rect: QRect = self.__draw_clip(painter, rect)
-        self.__draw_slices(painter)
-        painter.setClipping(False)
+        for key, pie in list(self.__animated.items()):
+            if not pie.is_animating:
+                pie.release_animation()
+                del self.__animated[key]
+        self.__animating = list(self.__animated.values())
+        animating: Set[int] = {id(pie) for pie in self.__animating}
+        spinning: bool = self.__rotation_animation.running and not animating
+        if spinning != (self.__spin_base is not None):
+            # Beim Wechsel wird das Layout für die aktuelle Rotation neu aufgebaut
+            self.__spin_base = self.__rotation if spinning else None
+            self.__hit_index = None
+            self.__layout = None
+            self.__layers.invalidate("ring", "spin")
+
+        if spinning:
+            hole_rect: QRect = self.__draw_spin(painter, rect)
+        else:
+            if animating != self.__ring_exclusion:
+                self.__ring_exclusion = animating
+                self.__layers.invalidate("ring")
+            self.__layers.draw(painter, "ring", self.__draw_ring, dirty, self.__prepare_ring)
+
+            hole_rect: QRect = self.__draw_clip(painter, rect)
+            if animating:
+                self.__draw_slices(painter, animating, dirty=dirty)
+            painter.setClipping(False)
 
-        painter.setBrush(QColor("transparent"))
-        painter.setPen(QPen(QColor(0,0,0,30), 1))
-        painter.drawEllipse(hole_rect)
-        self.__draw_legend(painter, rect)
+        if hole_rect.intersects(dirty):
+            painter.setBrush(QColor("transparent"))
+            painter.setPen(QPen(QColor(0,0,0,30), 1))
+            painter.drawEllipse(hole_rect)
+        self.__layers.draw(painter, "legend", lambda p: PieChart.__draw_legend(p, *self.__layout_legend(rect)), dirty,
+                           lambda: self.__prepare_legend(rect))
 
         if self.__slice_info and self.__show_info:
-            self.__draw_info(painter, rect)
+            self.__layers.draw(painter, "info", lambda p: self.__draw_info(p, rect), dirty)
+
+    def resizeEvent(self, event, /):
+        # Die Zusammenfassung kleiner ``PieSlices`` hängt von der Größe in Pixeln ab
+        self.__visible = None
+        self.__hit_index = None
+        self.__layout = None
+        self.__layers.invalidate()
+        super().resizeEvent(event)
+
+    def slice_at(self, pos: QPointF) -> Optional[PieSlice]:
+        """
+        Gibt den ``PieSlice`` unter ``pos`` wieder oder ``None``.\n
+        Ruhende ``PieSlices`` werden über den Winkel-Index gefunden. Nur ``PieSlices``, die gerade
+        durch ihre Hover-Animation verschoben sind, werden per ``PieSlice.contains`` geprüft.\n
+        Beim animierten Umsortieren überlappen sich die Keile oder lassen Lücken, der Winkel-Index gilt dann
+        nicht. Bis zum Ende der Animation wird gegen die zuletzt gezeichneten Keile geprüft, von oben nach unten.
+        :param pos:
+        :return: Optional[PieSlice]
+        """
+        if self.__sort_from is not None:
+            if self.__hole_contains(pos):
+                return None
+            for pie in chain(reversed(self.__animating), reversed(self.__build_visible())):
+                if pie.contains(QPointF(pos) - pie.offset_vector()):
+                    return pie
+            return None
 
-    def __draw_clip(self, painter: QPainter, rect: QRect, /) -> QRect:
+        index: _HitIndex = self.__build_hit_index()
+        for pie in self.__animating:
+            if pie.offset.isNull():
+                continue
+            shifted: QPointF = QPointF(pos) - pie.offset_vector()
+            if pie.contains(shifted) and index.index_at(shifted) is not None:
+                return pie
+
+        i: Optional[int] = index.index_at(QPointF(pos))
+        if i is None:
+            return None
+        return self.__build_visible()[i]
+
+    def __build_hit_index(self) -> _HitIndex:
+        if self.__hit_index is None:
+            rect: QRectF = QRectF(self.pie_rect)
+            layout: _PieLayout = self.__build_layout()
+            self.__hit_index = _HitIndex(
+                layout.spans if self.__visible_total else (),
+                rect.center(),
+                self.pie_size * 0.1 / 2,
+                rect.width() / 2,
+                self.__rotation
+            )
+        return self.__hit_index
+
+    def __build_legend(self) -> _Legend:
+        """
+        Gibt die ``_Legend`` wieder und baut sie nach einer Änderung der Einträge neu auf.
+        Die Scrollposition bleibt dabei erhalten.
+        :return: _Legend
+        """
+        if self.__legend is None:
+            self.__legend = _Legend(self.percentages, self.__index.order(SortType.NameLength), self.__legend_offset)
+        return self.__legend
+
+    def __build_visible(self) -> List[PieSlice]:
+        """
+        Gibt die gezeichneten ``PieSlices`` wieder. Ohne ``lod_threshold`` sind das alle ``PieSlices``,
+        sonst die großen plus ein zusammengefasster ``PieSlice`` für den Rest (siehe ``__fold``).
+        :return: List[PieSlice]
+        """
+        if self.__visible is None:
+            self.__visible, self.__visible_total = self.__fold()
+        return self.__visible
+
+    def __fold(self) -> Tuple[List[PieSlice], float]:
+        """
+        Fasst alle ``PieSlices``, deren Bogen am Außenrand kürzer als ``lod_threshold`` Pixel ist, zu einem
+        ``PieSlice`` zusammen. Behalten werden höchstens so viele, wie bei dieser Bogenlänge auf den Umfang
+        passen, ausgewählt per ``heapq.nlargest``. Die Reihenfolge der behaltenen ``PieSlices`` bleibt erhalten.\n
+        Bei ``lod_depth`` > 0 wird stattdessen der Inhalt des zusammengefassten ``PieSlice`` der vorherigen
+        Stufe auf den ganzen Ring verteilt.
+        :return: Tuple[List[PieSlice], float] Die ``PieSlices`` und ihre Summe
+        """
+        if self.__lod_threshold <= 0 or not self.__store.total:
+            self.__lod_depth = 0
+            return self.__slices, self.__store.total
+
+        circumference: float = math.pi * self.pie_size
+        capacity: int = max(2, int(circumference / self.__lod_threshold))
+        pool: List[PieSlice] = self.__slices
+        # Die Werte in der Reihenfolge von ``pool``, direkt aus dem ``_EntryStore``
+        values: List[float] = self.__store.values.tolist()
+        pool_total: float = self.__store.total
+        depth: int = 0
+        while True:
+            min_value: float = pool_total * self.__lod_threshold / circumference
+            largest: List[int] = heapq.nlargest(capacity - 1, range(len(pool)), key=values.__getitem__)
+            # Sind alle ``PieSlices`` zu klein, werden trotzdem die größten behalten, damit jede Stufe kleiner wird
+            keep: Set[int] = {i for i in largest if values[i] >= min_value} or set(largest)
+            kept: List[PieSlice] = [pie for i, pie in enumerate(pool) if i in keep]
+            if len(pool) - len(kept) < 2:
+                self.__lod_depth = depth
+                return pool, pool_total
+
+            rest: List[PieSlice] = [pie for i, pie in enumerate(pool) if i not in keep]
+            rest_values: List[float] = [value for i, value in enumerate(values) if i not in keep]
+            rest_total: float = sum(rest_values)
+            if depth == self.__lod_depth:
+                break
+            pool, values, pool_total = rest, rest_values, rest_total
+            depth += 1
+
+        other: PieSlice = self.__other_slice(len(rest), rest_total, len(kept))
+        return kept + [other], pool_total
+
+    def __build_layout(self) -> _PieLayout:
+        """
+        Gibt das ``_PieLayout`` der ``PieSlices`` wieder und baut es bei Bedarf neu auf.
+        Es wird bei Änderungen von Einträgen, Rotation und Größe verworfen.
+        Während ``animate_rotation`` bleibt es bei der Rotation ``__spin_base`` stehen.
+        :return: _PieLayout
+        """
+        if self.__layout is None:
+            visible: List[PieSlice] = self.__build_visible()
+            rotation: float = self.__rotation if self.__spin_base is None else self.__spin_base
+            values: List[float] = list()
+            if self.__visible_total:
+                # Ohne Zusammenfassung entspricht die Reihenfolge der ``PieSlices`` den Zeilen des ``_EntryStore``
+                values = self.__store.values.tolist() if visible is self.__slices else [pie.value for pie in visible]
+            self.__layout = _PieLayout(
+                values,
+                self.__visible_total,
+                rotation,
+                self.pie_rect.center(),
+                self.pie_size
+            )
+            if self.__sort_from is not None:
+                # Beim Umsortieren wandert jeder ``PieSlice`` von seinem alten Startwinkel zum neuen
+                starts: List[float] = [
+                    self.__sort_from[id(pie)] + rotation if id(pie) in self.__sort_from else start
+                    for pie, start in zip(visible, self.__layout.starts)
+                ]
+                self.__layout = _PieLayout.interpolated(starts, self.__layout, self.__sort_progress)
+        return self.__layout
+
+    def __draw_clip(self, painter: QPainter, rect: QRect, pie_size: Optional[float]=None, /) -> QRect:
         """
         Clip mittig vom PieChart
         :param painter:
         :param rect:
+        :param pie_size: Ohne Angabe ``pie_size``, im Worker-Thread die Größe aus der Momentaufnahme
         :return:
         """
         clip_path: QPainterPath = QPainterPath()
         clip_path.addRect(rect)
 
-        hole_size: int = self.pie_size * 0.1
+        hole_size: int = (self.pie_size if pie_size is None else pie_size) * 0.1
         hole_rect: QRect = QRect(
             rect.center().x() - hole_size // 2,
             rect.center().y() - hole_size // 2,
@@ -127,10 +368,11 @@ class PieChart(QWidget):
         painter.setClipPath(clip_path)
         return hole_rect
 
-    def __draw_info(self, painter: QPainter, rect: QRect):
-            painter.setFont(QFont("Roboto", self.height() * 0.025))
+    def __draw_info(self, painter: QPainter, rect: QRect) -> QRect:
+            cache: TextCache = TextCache.shared()
+            font: QFont = cache.font("Roboto", self.height() * 0.025)
             text: str = "".join(map(lambda item: f"{item[1]:.2f}% {item[0]}", self.__slice_info.items()))
-            text_width, text_height = font_metrics(painter, text)
+            text_width, text_height = cache.measure(painter, font, text)
             info_rect: QRect = QRect(
                 rect.right() - 32 - text_width,
                 16,
@@ -140,94 +382,300 @@ class PieChart(QWidget):
             painter.setBrush(QColor("white"))
             painter.setPen(QPen(QColor(30, 34, 39), 1))
             painter.drawRoundedRect(info_rect, 4 , 4)
-            painter.drawText(info_rect, Qt.AlignmentFlag.AlignCenter,  text)
+            cache.draw(painter, font, info_rect, Qt.AlignmentFlag.AlignCenter, text)
+            return info_rect.adjusted(-1, -1, 1, 1)
 
-    def __draw_legend(self, painter: QPainter, rect: QRect):
-        font_size: int = int(self.height() * 0.015)
-        painter.setFont(QFont("Roboto", font_size))
-
-        percentages: Dict[str, float] = sort_by_type(self.__percentages, SortType.NameLength)
-        longest: str = longest_name(percentages)
+    @staticmethod
+    def __draw_legend(painter: QPainter, font_size: int, rows: Tuple[_LegendRow, ...], bounds: QRect) -> QRect:
+        """
+        Zeichnet die Zeilen aus ``__layout_legend``. Liest nichts vom Widget und darf damit auch in einem
+        Worker-Thread laufen.
+        :param painter:
+        :param font_size:
+        :param rows:
+        :param bounds:
+        :return: QRect
+        """
+        if not rows:
+            return QRect()
+        cache: TextCache = TextCache.shared()
+        font: QFont = cache.font("Roboto", font_size)
 
-        text_width, text_height = font_metrics(painter, longest)
-        y = 16
-        for name, percent in percentages.items():
+        for row in rows:
             painter.setBrush(Qt.BrushStyle.NoBrush)
-            legend_text_rect: QRect = QRect(
-                rect.right() - text_width - 16,
-                rect.bottom() - text_height - 8 - y,
-                text_width,
-                text_height
-            )
             painter.setPen(QPen(QColor(30, 34, 39), 1))
-            painter.drawText(legend_text_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight, name)
+            cache.draw(
+                painter, font, row.text_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight, row.name)
+            if row.percent is None:
+                continue
 
-            bg_progress_rect: QRect = QRect(
-                legend_text_rect.left(),
-                legend_text_rect.bottom(),
-                legend_text_rect.width(),
-                font_size * 0.5
-            )
             painter.setPen(QPen(QColor(0, 0, 0, 20), 1))
-            painter.drawRoundedRect(bg_progress_rect, 1,1)
-
-            total_width = text_width - (text_width * (100 - percent) / 100)
-            progress_rect = QRect(
-                bg_progress_rect.right(),
-                bg_progress_rect.top(),
-                -total_width,
-                bg_progress_rect.height()
-            )
+            painter.drawRoundedRect(row.bar_rect, 1,1)
 
             painter.setBrush(QColor(0, 0, 0, 140))
-            painter.drawRect(progress_rect)
+            painter.drawRect(row.progress_rect)
+        return bounds.adjusted(-1, -1, 1, 1)
+
+    def __draw_ring(self, painter: QPainter, /):
+        """
+        Zeichnet alle ruhenden ``PieSlices`` (Ebene ``ring``).
+        :param painter:
+        :return:
+        """
+        self.__draw_clip(painter, self.rect())
+        self.__draw_slices(painter, exclude=self.__ring_exclusion)
+        painter.setClipping(False)
+
+    def __layout_legend(self, rect: QRect) -> Tuple[int, Tuple[_LegendRow, ...], QRect]:
+        """
+        Berechnet im GUI-Thread die sichtbaren Zeilen des ``_Legend`` für ``rect``. Reihenfolge und längster Name
+        werden einmal pro Datenänderung bestimmt, die Geometrie der Zeilen pro Größe und Scrollposition.
+        ``_Legend`` merkt sich dabei ``bounds`` und ``hidden`` für ``wheelEvent``.
+        :param rect:
+        :return: Tuple[int, Tuple[_LegendRow, ...], QRect] (Schriftgröße, Zeilen, Umriss)
+        """
+        legend: _Legend = self.__build_legend()
+        if not legend:
+            return 0, (), QRect()
+        font_size: int = int(self.height() * 0.015)
+        cache: TextCache = TextCache.shared()
+        text_width, text_height = cache.text_size(cache.font("Roboto", font_size), legend.longest)
+        rows: List[_LegendRow] = legend.layout(rect, text_width, text_height, font_size)
+        return font_size, tuple(rows), QRect(legend.bounds)
 
-            y += text_height + 16
+    def __prepare_legend(self, rect: QRect) -> Tuple[Callable[[QPainter], QRect], None]:
+        """
+        Momentaufnahme der Ebene ``legend`` für das Zeichnen im Hintergrund (siehe ``LayerCache.draw``).\n
+        Das Layout wird hier im GUI-Thread berechnet. Der Worker-Thread zeichnet nur die unveränderlichen Zeilen,
+        ``wheelEvent`` und ``scroll_legend`` können den ``_Legend`` also währenddessen ändern.
+        :param rect:
+        :return: Tuple[Callable[[QPainter], QRect], None]
+        """
+        snapshot: Tuple[int, Tuple[_LegendRow, ...], QRect] = self.__layout_legend(rect)
+        return lambda painter: PieChart.__draw_legend(painter, *snapshot), None
 
-    def __draw_slices(self, painter: QPainter, /):
+    def __prepare_ring(self) -> Tuple[Callable[[QPainter], None], Callable[[], None]]:
+        """
+        Momentaufnahme der Ebene ``ring`` für das Zeichnen im Hintergrund (siehe ``LayerCache.draw``).\n
+        Layout, Größe und die Werte der ruhenden ``PieSlices`` (``PieSlice.snapshot``) werden hier im GUI-Thread
+        festgehalten. Im Worker-Thread wird nur aus dieser Momentaufnahme gezeichnet, ``set_entries`` kann die
+        ``PieSlices`` also währenddessen ändern. Ihre Geometrie wird übernommen, sobald die Ebene zurück ist.
+        :return: Tuple[Callable[[QPainter], None], Callable[[], None]]
+        """
+        rect: QRect = self.rect()
+        pie_rect: QRect = self.pie_rect
+        pie_size: float = self.pie_size
+        layout: _PieLayout = self.__build_layout()
+        slices: List[Tuple[int, PieSlice, _SliceState]] = [
+            (i, pie, pie.snapshot(pie_rect, pie_size))
+            for i, pie in enumerate(self.__build_visible()) if id(pie) not in self.__ring_exclusion
+        ] if self.__visible_total else []
+        geometries: List[Tuple[PieSlice, _SliceGeometry]] = list()
+
+        def render(painter: QPainter) -> None:
+            self.__draw_clip(painter, rect, pie_size)
+            for i, pie_slice, state in slices:
+                geometries.append((pie_slice, pie_slice.draw(painter, layout, i, state=state)))
+            painter.setClipping(False)
+
+        def finish() -> None:
+            for pie_slice, geometry in geometries:
+                pie_slice.apply_geometry(geometry)
+
+        return render, finish
+
+    def __draw_spin(self, painter: QPainter, rect: QRect, /) -> QRect:
+        """
+        Schneller Weg für ``animate_rotation``: Keile und Beschriftungen werden einmal für die Rotation zu
+        Beginn (``__spin_base``) in die Ebene ``spin`` gezeichnet und pro Frame nur per Transformation gedreht.
+        Die Wert-Badges bleiben aufrecht und werden an den vorberechneten Mittelwinkeln platziert.
+        :param painter:
+        :param rect:
+        :return: Das Rect des Lochs
+        """
+        center: QPointF = QRectF(self.pie_rect).center()
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.translate(center)
+        # Qt dreht im Uhrzeigersinn, die Winkel der ``PieSlices`` zählen gegen den Uhrzeigersinn
+        painter.rotate(self.__spin_base - self.__rotation)
+        painter.translate(-center)
+        self.__layers.draw(painter, "spin", self.__draw_spin_layer)
+        painter.restore()
+
+        hole_rect: QRect = self.__draw_clip(painter, rect)
+        # Die Badges liegen außerhalb des Lochs, ohne Clip ist ``drawPixmap`` deutlich schneller
+        painter.setClipping(False)
+        if self.__visible_total:
+            layout: _PieLayout = self.__build_layout()
+            angle: float = self.__rotation - self.__spin_base
+            for i, pie_slice in enumerate(self.__build_visible()):
+                pie_slice.draw_badge(painter, layout, layout.rotated_badge_point(i, angle), sprite=True)
+        return hole_rect
+
+    def __draw_spin_layer(self, painter: QPainter, /) -> QRect:
+        self.__draw_clip(painter, self.rect())
+        if self.__visible_total:
+            layout: _PieLayout = self.__build_layout()
+            for i, pie_slice in enumerate(self.__build_visible()):
+                pie_slice.draw(painter, layout, i, badge=False)
+        painter.setClipping(False)
+        return self.pie_rect.adjusted(-2, -2, 2, 2)
+
+    def __draw_slices(self, painter: QPainter, only: Optional[Set[int]]=None, /,
+                      exclude: Optional[Set[int]]=None, dirty: Optional[QRect]=None):
         """
         Zeichnet die ``PieSlices`` und richtet diese aus.
         :param painter:
+        :param only: Zeichnet nur die ``PieSlices`` mit diesen ``id``'s
+        :param exclude: Überspringt die ``PieSlices`` mit diesen ``id``'s
+        :param dirty: Überspringt ``PieSlices``, die bereits gezeichnet wurden und außerhalb dieses Bereichs liegen
         :return:
         """
-        start_angle: float = 0.0 + self.__rotation
-        for i, percent in enumerate(self.__percentages.values()):
-            span_angle: float = percent * 3.6
-            pie_slice: PieSlice = self.__slices[i]
-            pie_slice.draw(painter, start_angle, span_angle)
-            start_angle += span_angle
+        layout: _PieLayout = self.__build_layout()
+        if not self.__visible_total:
+            return
+        for i, pie_slice in enumerate(self.__build_visible()):
+            if (only is None or id(pie_slice) in only) and not (exclude and id(pie_slice) in exclude):
+                damage: QRect = pie_slice.damage_rect()
+                if dirty is None or damage.isEmpty() or damage.intersects(dirty):
+                    pie_slice.draw(painter, layout, i)
 
-    def __draw_title(self, painter: QPainter, /):
+    def __draw_title(self, painter: QPainter, /) -> QRect:
         """
         Zeichnet den Title.
         :param painter:
-        :return:
+        :return: Der belegte Bereich
         """
         painter.save()
         size: int = int(self.height() * 0.055)
-        painter.setFont(QFont("Roboto", size, 800))
+        cache: TextCache = TextCache.shared()
+        font: QFont = cache.font("Roboto", size, 800)
         painter.translate(0,0)
         painter.rotate(-90)
         painter.setPen(QPen(self.title_color))
-        text_width, text_height = font_metrics(painter, self.__title)
-        painter.drawText(-text_width - 16,text_height - 8, self.__title)
+        text_width, text_height = cache.measure(painter, font, self.__title)
+        cache.draw_at(painter, font, -text_width - 16,text_height - 8, self.__title)
+        bounds: QRect = painter.transform().mapRect(
+            painter.fontMetrics().boundingRect(self.__title).translated(-text_width - 16, text_height - 8)
+        )
         painter.restore()
+        return bounds.adjusted(-2, -2, 2, 2)
+
+    def add_entry(self, name: str, value: float) -> None:
+        """
+        Fügt einen Eintrag hinzu. Er wird gemäß dem ``SortType`` aus ``set_entries`` einsortiert.\n
+        Existiert der Eintrag bereits, wird ein ``ValueError`` geworfen.
+        :param name:
+        :param value:
+        :return:
+        """
+        if name in self.__slice_map:
+            raise ValueError(f"Der Eintrag '{name}' existiert bereits.")
+        self.__add(name, value)
+        self.__data_changed()
+
+    def animate_rotation(self, angle: float=-360.0, duration: int=11300,
+                         easing: QEasingCurve.Type=QEasingCurve.Type.InOutBack) -> None:
+        """
+        Dreht das PieChart animiert um ``angle`` Grad, ausgehend von der aktuellen ``rotation``.\n
+        Die Animation läuft über die gemeinsame ``AnimationEngine``.
+        :param angle:
+        :param duration: in Millisekunden
+        :param easing:
+        :return:
+        """
+        engine: AnimationEngine = AnimationEngine.shared()
+        engine.stop(self.__rotation_animation)
+        self.__rotation_animation.duration = duration
+        self.__rotation_animation.easing = easing
+        self.__rotation_animation.set_range(self.__rotation, self.__rotation + angle)
+        engine.start(self.__rotation_animation)
+
+    def apply_delta(self, delta: Dict[str, Optional[float]]) -> None:
+        """
+        Übernimmt mehrere Änderungen auf einmal und zeichnet das PieChart nur einmal neu.\n
+        Bestehende Einträge werden aktualisiert, neue hinzugefügt, Einträge mit dem Wert ``None`` entfernt.
+        :param delta:
+        :return:
+        """
+        for name, value in delta.items():
+            pie: Optional[PieSlice] = self.__slice_map.get(name)
+            if value is None:
+                if pie is not None:
+                    self.__remove(pie)
+            elif pie is None:
+                self.__add(name, value)
+            else:
+                self.__set_value(pie, value)
+        if delta:
+            self.__data_changed()
 
     @property
-    def entries(self) -> Dict[str, float]:
+    def background_rendering(self) -> bool:
+        """
+        Zeichnet Ring und Legende nach einer Datenänderung auf dem ``QThreadPool.globalInstance()`` neu.
+        Bis die neuen Ebenen fertig sind, bleiben die bisherigen sichtbar, der GUI-Thread blendet sie nur ein.
+        :return: bool
         """
-        Gibt ein Dictionary ``Dict[str, float]`` mit den Einträgen des **PieCharts** wieder.
-        :return: Dict[str, float]
+        return self.__layers.thread_pool is not None
+
+    @background_rendering.setter
+    def background_rendering(self, enabled: bool) -> None:
+        self.__layers.set_thread_pool(QThreadPool.globalInstance() if enabled else None)
+
+    def collapse_other(self) -> None:
+        """
+        Kehrt nach ``expand_other`` eine Stufe zurück. Ein Klick in das Loch des PieCharts bewirkt dasselbe.
+        :return:
         """
-        return self.__entries
+        if self.__lod_depth:
+            self.__set_lod_depth(self.__lod_depth - 1)
 
     @property
-    def percentages(self) -> Dict[str, float]:
+    def entries(self) -> Mapping[str, float]:
         """
-        Gibt ein Dictionary mit Prozentwerten wieder
-        :return: Dict[str, float]
+        Gibt die Einträge des **PieCharts** als schreibgeschützte Sicht ``Mapping[str, float]`` wieder,
+        in der Reihenfolge der ``PieSlices``.
+        :return: Mapping[str, float]
         """
-        return self.__percentages
+        return self.__store.entries
+
+    def expand_other(self) -> None:
+        """
+        Verteilt die im zusammengefassten ``PieSlice`` enthaltenen Einträge auf den ganzen Ring.
+        Die nächste Stufe wird erst dabei berechnet. Ein Klick auf den ``PieSlice`` bewirkt dasselbe.
+        :return:
+        """
+        if self.__other is not None and any(pie is self.__other for pie in self.__build_visible()):
+            self.__set_lod_depth(self.__lod_depth + 1)
+
+    @property
+    def lod_threshold(self) -> float:
+        """
+        Mindestlänge des Bogens eines ``PieSlice`` am Außenrand in Pixeln. Kürzere ``PieSlices`` werden zu einem
+        ``PieSlice`` zusammengefasst, damit der Aufwand beim Zeichnen von der Größe des PieCharts und nicht von der
+        Anzahl der Einträge abhängt. ``0`` (Default) zeichnet alle ``PieSlices``.
+        :return: float
+        """
+        return self.__lod_threshold
+
+    @lod_threshold.setter
+    def lod_threshold(self, threshold: float) -> None:
+        threshold = max(0.0, threshold)
+        if threshold != self.__lod_threshold:
+            self.__lod_threshold = threshold
+            self.__lod_depth = 0
+            self.__fold_changed()
+
+    @property
+    def percentages(self) -> Mapping[str, float]:
+        """
+        Gibt die Prozentwerte als schreibgeschützte Sicht ``Mapping[str, float]`` wieder.
+        Die Prozentspalte wird erst beim Zugriff nach einer Änderung der Einträge neu berechnet.
+        :return: Mapping[str, float]
+        """
+        return self.__store.percentages if self.__store.total else MappingProxyType({})
 
     @property
     def pie_rect(self) -> QRect:
@@ -254,6 +702,19 @@ class PieChart(QWidget):
     def rotation(self) -> float:
         return self.__rotation
 
+    def shadow_path(self) -> QPainterPath:
+        """
+        Form des Schattens (``utils.add_shadow``): der Ring der ``PieSlices`` ohne das Loch.
+        :return: QPainterPath
+        """
+        rect: QRectF = QRectF(self.pie_rect)
+        hole_size: float = self.pie_size * 0.1
+        hole: QPainterPath = QPainterPath()
+        hole.addEllipse(rect.center(), hole_size / 2, hole_size / 2)
+        path: QPainterPath = QPainterPath()
+        path.addEllipse(rect)
+        return path.subtracted(hole)
+
     def set_entries(self, entries: Dict[str, float], sort_type: SortType=SortType.HighestValue) -> None:
         """
         Setzt die Einträge für das PieChart. Übergeben wird ein Dictionary: ``Dict[str, float]``. \n
@@ -269,23 +730,246 @@ class PieChart(QWidget):
         :param entries:
         :return:
         """
-        self.__entries = sort_by_type(entries, sort_type)
-        if self.__entries:
-            self.__percentages = percentages_from_values(self.__entries)
+        if entries:
+            # Bestehende ``PieSlices`` werden über ihren Namen wiederverwendet
+            previous: Dict[str, PieSlice] = self.__slice_map
+            self.__index = _SortIndex(self.__value_of, entries)
+            self.__ordered = True
+            self.__slice_map = dict()
+            self.__slices = list()
+            self.__sort_from = None
+            self.__sort_type = sort_type
+            self.__store = _EntryStore()
 
-            clr: QColor = QColor(30, 32, 39)
-            lighter: int = 75
-            for text, value in self.__entries.items():
-                pie: PieSlice = PieSlice(self, text, value)
-                pie.color = clr.lighter(lighter)
+            for text in self.__index.order(sort_type):
+                value: float = entries[text]
+                pie: Optional[PieSlice] = previous.pop(text, None)
+                if pie is None:
+                    pie = PieSlice(self, text)
+                pie.color = self.__slice_color(len(self.__slices))
                 self.__slices.append(pie)
-                lighter += 50
-            self.update()
+                self.__slice_map[text] = pie
+                self.__store.insert(len(self.__store), text, value)
+
+            for pie in previous.values():
+                self.__discard(pie)
+            self.__data_changed()
         else:
             raise ValueError("Es konnten keine Einträge gesetzt werden. Überprüfe diese.")
 
+    def remove_entry(self, name: str) -> None:
+        """
+        Entfernt einen Eintrag. Existiert dieser nicht, wird ein ``KeyError`` geworfen.
+        :param name:
+        :return:
+        """
+        self.__remove(self.__slice_map[name])
+        self.__data_changed()
+
+    def update_entry(self, name: str, value: float) -> None:
+        """
+        Setzt den Wert eines bestehenden Eintrags. Die Reihenfolge der ``PieSlices`` bleibt erhalten.\n
+        Existiert der Eintrag nicht, wird ein ``KeyError`` geworfen.
+        :param name:
+        :param value:
+        :return:
+        """
+        pie: PieSlice = self.__slice_map[name]
+        if pie.value == value:
+            return
+        self.__set_value(pie, value)
+        self.__data_changed()
+
+    def __add(self, name: str, value: float) -> None:
+        pie: PieSlice = PieSlice(self, name)
+        pie.color = self.__slice_color(len(self.__slices))
+        self.__slice_map[name] = pie
+        self.__index.add(name, value)
+        if self.__ordered:
+            position: int = self.__index.position(self.__sort_type, name)
+        else:
+            # Nach ``update_entry`` entspricht die Reihenfolge nicht mehr dem Index
+            position: int = len(self.__slices)
+            for i, other in enumerate(self.__slices):
+                if PieChart.__sorts_before(self.__sort_type, name, value, other):
+                    position = i
+                    break
+        self.__slices.insert(position, pie)
+        self.__store.insert(position, name, value)
+
+    def __set_value(self, pie: PieSlice, value: float) -> None:
+        self.__index.update(pie.text, value)
+        self.__store.set(pie.text, value)
+        if self.__sort_type in (SortType.LowestValue, SortType.HighestValue):
+            self.__ordered = False
+
+    def __data_changed(self) -> None:
+        """
+        Verwirft alles, was von den Einträgen abhängt, und zeichnet das PieChart neu.\n
+        Da jeder Wert über die Summe in alle Winkel eingeht, wird der ganze Ring neu gezeichnet.
+        :return:
+        """
+        self.__visible = None
+        self.__hit_index = None
+        self.__layout = None
+        if self.__legend is not None:
+            self.__legend_offset = self.__legend.offset
+            self.__legend = None
+        if self.__slice_info:
+            self.__slice_info = {name: self.percentages.get(name, 0.0) for name in self.__slice_info
+                                 if name in self.__slice_map}
+        self.__layers.invalidate(deferred=True)
+        self.update()
+
+    def __fold_changed(self) -> None:
+        """
+        Verwirft die gezeichneten ``PieSlices`` samt Layout und zeichnet den Ring neu.
+        :return:
+        """
+        if self.hovered_slice is not None:
+            self.sliceLeaved.emit(self.hovered_slice.text)
+            self.hovered_slice = None
+        # Das Layout ändert sich, laufende Hover-Animationen enden sofort
+        for pie in self.__animated.values():
+            pie.release_animation()
+        self.__animated.clear()
+        self.__animating = list()
+        self.__visible = None
+        self.__hit_index = None
+        self.__layout = None
+        self.__layers.invalidate("ring", "spin")
+        self.update()
+
+    def __discard(self, pie: PieSlice) -> None:
+        if pie is self.hovered_slice:
+            self.hovered_slice = None
+        self.__animating = [other for other in self.__animating if other is not pie]
+        self.__animated.pop(id(pie), None)
+        pie.release_animation()
+
+    def __remove(self, pie: PieSlice) -> None:
+        i: int = self.__slices.index(pie)
+        del self.__slices[i]
+        self.__index.remove(pie.text)
+        del self.__slice_map[pie.text]
+        self.__store.pop(i)
+        self.__discard(pie)
+
+    def __value_of(self, name: str) -> float:
+        return self.__store.entries[name]
+
+    def __hole_contains(self, pos: QPointF) -> bool:
+        center: QPointF = QRectF(self.pie_rect).center()
+        return math.hypot(pos.x() - center.x(), pos.y() - center.y()) < self.pie_size * 0.1 / 2
+
+    def __other_slice(self, count: int, value: float, index: int) -> PieSlice:
+        """
+        Gibt den ``PieSlice`` wieder, der ``count`` zusammengefasste Einträge mit der Summe ``value`` darstellt.
+        Er wird nur einmal erzeugt und gehört nicht zu den Einträgen.
+        :param count:
+        :param value:
+        :param index: Position im Ring, bestimmt die Farbe
+        :return: PieSlice
+        """
+        if self.__other is None:
+            self.__other = PieSlice(self, "", 0.0)
+        self.__other.text = f"Andere ({count})"
+        self.__other.value = value
+        color: QColor = self.__slice_color(index)
+        if self.__other.color != color:
+            self.__other.color = color
+        return self.__other
+
+    def __set_lod_depth(self, depth: int) -> None:
+        self.__lod_depth = depth
+        self.__fold_changed()
+
+    @staticmethod
+    def __slice_color(index: int) -> QColor:
+        return QColor(30, 32, 39).lighter(75 + 50 * index)
+
+    @staticmethod
+    def __sorts_before(sort_type: SortType, text: str, value: float, other: PieSlice) -> bool:
+        """
+        Gibt ``True`` wieder, wenn der Eintrag ``text`` mit ``value`` gemäß ``sort_type``
+        (wie ``utils.sort_by_type``) vor ``other`` steht.
+        :param sort_type:
+        :param text:
+        :param value:
+        :param other:
+        :return: bool
+        """
+        match sort_type:
+            case SortType.LowestValue:
+                return value < other.value
+            case SortType.HighestValue:
+                return value > other.value
+            case SortType.NameAsc:
+                return text < other.text
+            case SortType.NameDesc:
+                return text > other.text
+            case SortType.NameLength:
+                return (len(text), text) > (len(other.text), other.text)
+        return False
+
+    def scroll_legend(self, rows: int) -> None:
+        """
+        Blättert durch die Legende, wenn nicht alle Einträge Platz haben.
+        :param rows: Positive Werte zeigen weiter oben einsortierte Einträge
+        :return:
+        """
+        if self.__build_legend().scroll(rows):
+            self.__layers.invalidate("legend")
+            self.update()
+
     def set_rotation(self, rotation: float) -> None:
         self.__rotation = rotation % 360
+        self.__hit_index = None
+        if self.__spin_base is None:
+            self.__layout = None
+            self.__layers.invalidate("ring")
+        self.update()
+
+    def set_sort_type(self, sort_type: SortType, duration: int=400) -> None:
+        """
+        Sortiert die ``PieSlices`` nach ``sort_type`` um. Die Reihenfolge kommt aus dem vorberechneten Index,
+        es wird nicht neu sortiert. Die ``PieSlices`` bleiben erhalten und wandern animiert an ihre neue Position.
+        :param sort_type:
+        :param duration: in Millisekunden, ``0`` ohne Animation
+        :return:
+        """
+        if sort_type == self.__sort_type and self.__ordered:
+            return
+        previous: Dict[int, float] = dict()
+        if self.__visible_total:
+            layout: _PieLayout = self.__build_layout()
+            rotation: float = self.__rotation if self.__spin_base is None else self.__spin_base
+            previous = {id(pie): start - rotation for pie, start in zip(self.__build_visible(), layout.starts)}
+
+        order: List[str] = self.__index.order(sort_type)
+        self.__slices = [self.__slice_map[name] for name in order]
+        self.__store.reorder(order)
+        self.__sort_type = sort_type
+        self.__ordered = True
+
+        engine: AnimationEngine = AnimationEngine.shared()
+        engine.stop(self.__sort_animation)
+        self.__sort_from = None
+        if duration > 0 and previous:
+            self.__sort_from = previous
+            self.__sort_progress = 0.0
+            self.__sort_animation.duration = duration
+            engine.start(self.__sort_animation)
+        self.__data_changed()
+
+    def set_sort_progress(self, progress: float) -> None:
+        self.__sort_progress = progress
+        if progress >= 1.0:
+            self.__sort_from = None
+        self.__hit_index = None
+        self.__layout = None
+        self.__layers.invalidate("ring", "spin")
+        self.sortProgressChanged.emit(progress)
         self.update()
 
     def show_info(self, visible: bool) -> None:
@@ -295,6 +979,7 @@ class PieChart(QWidget):
         :return:
         """
         self.__show_info = visible
+        self.__layers.invalidate("info")
         self.update()
 
     @property
@@ -307,8 +992,16 @@ class PieChart(QWidget):
             if i >= len(self.__slices) :
                 break
             pie.color = color
+        self.__layers.invalidate("ring", "spin")
         self.update()
 
+    @property
+    def sort_type(self) -> SortType:
+        return self.__sort_type
+
+    def sort_progress(self) -> float:
+        return self.__sort_progress
+
     @property
     def title(self) -> str:
         return self.__title
@@ -337,6 +1030,7 @@ class PieChart(QWidget):
         if len(title) > PieChart.__MAX_TITLE_CHARS:
             self.__title = title[0:PieChart.__MAX_TITLE_CHARS]
 
+        self.__layers.invalidate("title")
         self.update()
 
     @property
@@ -357,7 +1051,9 @@ class PieChart(QWidget):
         """
         if color.isValid():
             self.__title_color = color
+            self.__layers.invalidate("title")
             self.update()
 
 
-    rotation = Property(float, fget=rotation, fset=set_rotation, notify=rotationChanged)
\ No newline at end of file
+    rotation = Property(float, fget=rotation, fset=set_rotation, notify=rotationChanged)
+    sort_progress = Property(float, fget=sort_progress, fset=set_sort_progress, notify=sortProgressChanged)
\ No newline at end of file
@@ -0,0 +1,130 @@
+import math
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class _ColumnView(Mapping):
+    """
+    Schreibgeschützte Sicht ``Name -> Wert`` auf eine Spalte des ``_EntryStore``, in der Reihenfolge der Zeilen.
+    """
+    __slots__ = ("_column", "_store")
+
+    def __init__(self, store: "_EntryStore", column: Callable[[], Sequence[float]]):
+        self._column = column
+        self._store = store
+
+    def __getitem__(self, name: str) -> float:
+        return self._column()[self._store.rows[name]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.names)
+
+    def __len__(self) -> int:
+        return len(self._store.names)
+
+    def __repr__(self) -> str:
+        return repr(dict(zip(self._store.names, self._column())))
+
+
+class _EntryStore:
+    """
+    Spaltenspeicher für die Einträge des ``PieCharts``.\n
+    Namen liegen (interniert) in einer Liste, Werte in einem ``array('d')``, die Reihenfolge entspricht der
+    Reihenfolge der ``PieSlices``. Die Prozentspalte wird erst beim Zugriff berechnet, mit numpy in einem Schritt.
+    Der Index ``Name -> Zeile`` wird nach dem Einfügen oder Entfernen ebenfalls erst beim Zugriff neu aufgebaut.
+    Die Werte stehen nur hier, ``PieSlice.value`` liest sie über ``PieChart.entries``.\n
+    ``entries`` und ``percentages`` sind schreibgeschützte Sichten auf die Spalten.
+    """
+    __slots__ = ("entries", "names", "percentages", "values", "_percents", "_rows", "_total")
+
+    entries: _ColumnView
+    names: List[str]
+    percentages: _ColumnView
+    values: array
+    _percents: Optional[array]
+    _rows: Optional[Dict[str, int]]
+    _total: Optional[float]
+
+    def __init__(self):
+        self.names = list()
+        self.values = array("d")
+        self._percents = None
+        self._rows = None
+        self._total = None
+        self.entries = _ColumnView(self, lambda: self.values)
+        self.percentages = _ColumnView(self, self.percents)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def rows(self) -> Dict[str, int]:
+        if self._rows is None:
+            self._rows = {name: row for row, name in enumerate(self.names)}
+        return self._rows
+
+    @property
+    def total(self) -> float:
+        """
+        Summe der Werte. Sie wird nach einer Änderung beim Zugriff per ``math.fsum`` neu berechnet, statt laufend
+        addiert zu werden, damit sich keine Rundungsfehler ansammeln. Sind alle Werte 0, ist auch die Summe 0.
+        :return: float
+        """
+        if self._total is None:
+            self._total = math.fsum(self.values)
+        return self._total
+
+    def insert(self, row: int, name: str, value: float) -> None:
+        self.names.insert(row, sys.intern(name))
+        self.values.insert(row, value)
+        self._percents = None
+        self._total = None
+        self._rows = None
+
+    def percents(self) -> array:
+        """
+        Gibt die Prozentspalte ``value / total * 100`` wieder.
+        :return: array
+        """
+        if self._percents is None:
+            if not self.total:
+                self._percents = array("d", bytes(len(self.values) * 8))
+            elif numpy is not None:
+                self._percents = array("d", (numpy.frombuffer(self.values, dtype=numpy.float64) / self.total * 100)
+                                       .tobytes())
+            else:
+                total: float = self.total
+                self._percents = array("d", (value / total * 100 for value in self.values))
+        return self._percents
+
+    def pop(self, row: int) -> float:
+        del self.names[row]
+        value: float = self.values.pop(row)
+        self._percents = None
+        self._rows = None
+        self._total = None
+        return value
+
+    def reorder(self, names: List[str]) -> None:
+        """
+        Ordnet die Zeilen in der Reihenfolge von ``names`` an.
+        :param names: Alle Namen des Speichers
+        :return:
+        """
+        rows: Dict[str, int] = self.rows
+        self.values = array("d", (self.values[rows[name]] for name in names))
+        self.names = [self.names[rows[name]] for name in names]
+        self._percents = None
+        self._rows = None
+
+    def set(self, name: str, value: float) -> None:
+        self.values[self.rows[name]] = value
+        self._percents = None
+        self._total = None
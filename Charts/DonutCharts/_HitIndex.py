@@ -0,0 +1,50 @@
+import math
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, List, Optional
+
+from PySide6.QtCore import QPointF
+
+
+class _HitIndex:
+    """
+    Winkel-Index für das Hit-Testing der ``PieSlices``.\n
+    Hält die kumulierten Startwinkel aller ``PieSlices``. Die Suche ist ein ``bisect`` auf den Winkel
+    des Punktes plus eine Prüfung des Radius gegen Loch (``inner``) und Außenkreis (``outer``).
+    """
+    __slots__ = ("center_x", "center_y", "inner", "outer", "rotation", "starts", "total")
+
+    center_x: float
+    center_y: float
+    inner: float
+    outer: float
+    rotation: float
+    starts: List[float]
+    total: float
+
+    def __init__(self, spans: Iterable[float], center: QPointF, inner: float, outer: float, rotation: float):
+        self.center_x = center.x()
+        self.center_y = center.y()
+        self.inner = inner
+        self.outer = outer
+        self.rotation = rotation
+        self.starts = list(accumulate(spans, initial=0.0))
+        self.total = self.starts.pop()
+
+    def index_at(self, pos: QPointF) -> Optional[int]:
+        """
+        Gibt den Index des ``PieSlice`` unter ``pos`` wieder oder ``None``.
+        :param pos:
+        :return: Optional[int]
+        """
+        dx: float = pos.x() - self.center_x
+        dy: float = pos.y() - self.center_y
+        radius: float = math.hypot(dx, dy)
+        if not self.starts or radius < self.inner or radius > self.outer:
+            return None
+
+        # Qt zählt Winkel gegen den Uhrzeigersinn, die y-Achse zeigt nach unten
+        angle: float = (math.degrees(math.atan2(-dy, dx)) - self.rotation) % 360.0
+        if angle >= self.total:
+            return None
+        return bisect_right(self.starts, angle) - 1
@@ -0,0 +1,115 @@
+from typing import List, Mapping, Optional, Tuple
+
+from PySide6.QtCore import QRect
+
+from utils import longest_name
+
+
+class _LegendRow:
+    __slots__ = ("name", "percent", "text_rect", "bar_rect", "progress_rect")
+
+    name: str
+    percent: Optional[float]
+    text_rect: QRect
+    bar_rect: Optional[QRect]
+    progress_rect: Optional[QRect]
+
+    def __init__(self, name: str, percent: Optional[float], text_rect: QRect, bar_rect: Optional[QRect]=None,
+                 progress_rect: Optional[QRect]=None):
+        self.name = name
+        self.percent = percent
+        self.text_rect = text_rect
+        self.bar_rect = bar_rect
+        self.progress_rect = progress_rect
+
+
+class _Legend:
+    """
+    Vorberechnete, virtualisierte Legende des ``PieCharts``.\n
+    Die Reihenfolge (``SortType.NameLength``) kommt aus dem ``_SortIndex`` des ``PieCharts``,
+    der längste Name wird einmal pro Datenänderung bestimmt.
+    ``layout`` berechnet nur die Zeilen, die von unten nach oben in den sichtbaren Bereich passen, und merkt
+    sich deren Geometrie. Passen nicht alle Einträge, zeigt die oberste Zeile ``+N weitere``; mit ``scroll``
+    wird durch die Einträge geblättert.
+    """
+    __slots__ = ("bounds", "entries", "hidden", "longest", "offset", "rows", "_key")
+
+    __SPACING: int = 16
+
+    bounds: QRect
+    entries: List[Tuple[str, float]]
+    hidden: int
+    longest: str
+    offset: int
+    rows: List[_LegendRow]
+    _key: Optional[Tuple]
+
+    def __init__(self, percentages: Mapping[str, float], order: List[str], offset: int=0):
+        self.bounds = QRect()
+        self.entries = [(name, percentages[name]) for name in order if name in percentages]
+        self.hidden = 0
+        self.longest = longest_name(percentages) if percentages else ""
+        self.offset = offset
+        self.rows = list()
+        self._key = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def layout(self, rect: QRect, text_width: int, text_height: int, font_size: int) -> List[_LegendRow]:
+        """
+        Berechnet die sichtbaren Zeilen für ``rect``. Bei unveränderten Eingaben wird die gemerkte
+        Geometrie zurückgegeben.
+        :param rect:
+        :param text_width: Breite des längsten Namens
+        :param text_height:
+        :param font_size:
+        :return: List[_LegendRow]
+        """
+        key: Tuple = (rect.x(), rect.y(), rect.width(), rect.height(), text_width, text_height, font_size, self.offset)
+        if key == self._key:
+            return self.rows
+        self._key = key
+        self.rows = list()
+        self.bounds = QRect()
+        if not self.entries:
+            self.hidden = 0
+            return self.rows
+
+        pitch: int = text_height + _Legend.__SPACING
+        first_top: int = rect.bottom() - text_height - 8 - _Legend.__SPACING
+        capacity: int = max(1, (first_top - rect.top() - _Legend.__SPACING) // pitch + 1)
+        fits: bool = len(self.entries) <= capacity
+        visible: int = len(self.entries) if fits else capacity - 1
+        self.offset = min(self.offset, len(self.entries) - visible)
+        self.hidden = len(self.entries) - visible
+
+        y: int = _Legend.__SPACING
+        for name, percent in self.entries[self.offset:self.offset + visible]:
+            text_rect: QRect = QRect(rect.right() - text_width - 16, rect.bottom() - text_height - 8 - y,
+                                     text_width, text_height)
+            bar_rect: QRect = QRect(text_rect.left(), text_rect.bottom(), text_rect.width(), font_size * 0.5)
+            total_width: float = text_width - (text_width * (100 - percent) / 100)
+            progress_rect: QRect = QRect(bar_rect.right(), bar_rect.top(), -total_width, bar_rect.height())
+            self.rows.append(_LegendRow(name, percent, text_rect, bar_rect, progress_rect))
+            self.bounds = self.bounds.united(text_rect).united(bar_rect)
+            y += pitch
+
+        if self.hidden:
+            text_rect: QRect = QRect(rect.right() - text_width - 16, rect.bottom() - text_height - 8 - y,
+                                     text_width, text_height)
+            self.rows.append(_LegendRow(f"+{self.hidden} weitere", None, text_rect))
+            self.bounds = self.bounds.united(text_rect)
+        return self.rows
+
+    def scroll(self, rows: int) -> bool:
+        """
+        Verschiebt die sichtbaren Einträge um ``rows``.
+        :param rows:
+        :return: bool ``True``, wenn sich die Auswahl geändert hat.
+        """
+        offset: int = max(0, min(self.offset + rows, self.hidden))
+        if offset == self.offset:
+            return False
+        self.offset = offset
+        return True
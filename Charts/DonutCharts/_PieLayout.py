@@ -0,0 +1,173 @@
+import math
+from typing import List, Sequence, Tuple
+
+from PySide6.QtCore import QPoint
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class _PieLayout:
+    """
+    Vorberechnetes Layout aller ``PieSlices``: Start-, Spann- und Mittelwinkel, die Richtung der Mittelachse,
+    die Ankerpunkte für Beschriftung und Wert-Badge sowie der vertikale Abstand der Kanten
+    (wie ``utils.vertical_slice_span``).\n
+    Wird einmal pro Änderung von Einträgen, Rotation oder Größe aufgebaut, mit numpy in einem Durchlauf,
+    sonst in einer Schleife. Beim Zeichnen werden nur noch die Listen gelesen.
+    """
+    __slots__ = ("center", "size", "starts", "spans", "middles", "cos", "sin", "label_x", "label_y", "badge_x",
+                 "badge_y", "vertical_spans")
+
+    __BADGE_DISTANCE: float = 1.15
+    __LABEL_DISTANCE: float = 0.5
+
+    center: QPoint
+    size: float
+    starts: List[float]
+    spans: List[float]
+    middles: List[float]
+    cos: List[float]
+    sin: List[float]
+    label_x: List[int]
+    label_y: List[int]
+    badge_x: List[int]
+    badge_y: List[int]
+    vertical_spans: List[float]
+
+    def __init__(self, values: Sequence[float], total: float, rotation: float, center: QPoint, size: float):
+        self.center = QPoint(center)
+        self.size = size
+        if numpy is not None:
+            self.__compute_vectorised(values, total, rotation)
+        else:
+            self.__compute(values, total, rotation)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def badge_point(self, index: int, offset: int) -> QPoint:
+        """
+        Ankerpunkt des Wert-Badges von ``index`` bei der Verschiebung ``offset``.
+        :param index:
+        :param offset:
+        :return: QPoint
+        """
+        if offset == 0:
+            return QPoint(self.badge_x[index], self.badge_y[index])
+        return self.point(index, self.size + offset, _PieLayout.__BADGE_DISTANCE)
+
+    def offset_delta(self, index: int, offset: int) -> Tuple[int, int]:
+        """
+        Verschiebung des Keils von ``index`` entlang seiner Mittelachse bei ``offset``.
+        :param index:
+        :param offset:
+        :return: Tuple[int, int]
+        """
+        if offset == 0:
+            return 0, 0
+        point: QPoint = self.point(index, offset, 1.0)
+        return point.x() - self.center.x(), point.y() - self.center.y()
+
+    def rotated_badge_point(self, index: int, angle: float) -> QPoint:
+        """
+        Ankerpunkt des Wert-Badges von ``index``, wenn der Ring um ``angle`` Grad weitergedreht ist.
+        :param index:
+        :param angle:
+        :return: QPoint
+        """
+        radians: float = math.radians(-(self.middles[index] + angle))
+        radius: float = self.size / 2 * _PieLayout.__BADGE_DISTANCE
+        return QPoint(int(self.center.x() + math.cos(radians) * radius),
+                      int(self.center.y() + math.sin(radians) * radius))
+
+    def label_point(self, index: int) -> QPoint:
+        return QPoint(self.label_x[index], self.label_y[index])
+
+    def point(self, index: int, size: float, distance: float) -> QPoint:
+        radius: float = size / 2 * distance
+        return QPoint(int(self.center.x() + self.cos[index] * radius),
+                      int(self.center.y() + self.sin[index] * radius))
+
+    @classmethod
+    def interpolated(cls, starts: Sequence[float], target: "_PieLayout", progress: float) -> "_PieLayout":
+        """
+        Layout zwischen den Startwinkeln ``starts`` und denen von ``target`` bei ``progress`` (0 bis 1),
+        z.B. beim animierten Umsortieren. Die Spannwinkel kommen aus ``target``.\n
+        Jeder Startwinkel nimmt den kürzeren Weg, ein ``PieSlice`` wandert also z.B. von 350° über 0° nach 10°,
+        statt fast einmal um den Ring zu laufen.
+        :param starts: Startwinkel in der Reihenfolge von ``target``
+        :param target:
+        :param progress:
+        :return: _PieLayout
+        """
+        layout: _PieLayout = cls.__new__(cls)
+        layout.center = QPoint(target.center)
+        layout.size = target.size
+        layout.__derive([a + ((b - a + 180) % 360 - 180) * progress for a, b in zip(starts, target.starts)],
+                        list(target.spans))
+        return layout
+
+    def __compute(self, values: Sequence[float], total: float, rotation: float) -> None:
+        starts: List[float] = list()
+        spans: List[float] = list()
+        start: float = 0.0 + rotation
+        for value in values:
+            span: float = value / total * 360
+            starts.append(start)
+            spans.append(span)
+            start += span
+        self.__derive(starts, spans)
+
+    def __derive(self, starts: List[float], spans: List[float]) -> None:
+        self.starts = starts
+        self.spans = spans
+        self.middles = list()
+        self.cos = list()
+        self.sin = list()
+        self.vertical_spans = list()
+        r: float = self.size / 2
+        label_radius: float = r * _PieLayout.__LABEL_DISTANCE
+        badge_radius: float = r * _PieLayout.__BADGE_DISTANCE
+        for start, span in zip(starts, spans):
+            middle: float = start + span / 2
+            radians: float = math.radians(-middle)
+            self.middles.append(middle)
+            self.cos.append(math.cos(radians))
+            self.sin.append(math.sin(radians))
+            self.vertical_spans.append(
+                abs(math.sin(math.radians(-(start + span))) * r - math.sin(math.radians(-start)) * r))
+
+        cx: int = self.center.x()
+        cy: int = self.center.y()
+        # ``QPoint(float, float)`` schneidet die Nachkommastellen ab, wie ``utils.point_on_circle``
+        self.label_x = [int(cx + c * label_radius) for c in self.cos]
+        self.label_y = [int(cy + s * label_radius) for s in self.sin]
+        self.badge_x = [int(cx + c * badge_radius) for c in self.cos]
+        self.badge_y = [int(cy + s * badge_radius) for s in self.sin]
+
+    def __compute_vectorised(self, values: Sequence[float], total: float, rotation: float) -> None:
+        spans: "numpy.ndarray" = numpy.asarray(values, dtype=float) / total * 360
+        # ``rotation`` vorne anhängen, damit die Summen in derselben Reihenfolge wie in der Schleife entstehen
+        starts: "numpy.ndarray" = numpy.cumsum(numpy.concatenate(((0.0 + rotation,), spans)))[:-1]
+        middles: "numpy.ndarray" = starts + spans / 2
+        radians: "numpy.ndarray" = numpy.radians(-middles)
+        cos: "numpy.ndarray" = numpy.cos(radians)
+        sin: "numpy.ndarray" = numpy.sin(radians)
+        r: float = self.size / 2
+        label_radius: float = r * _PieLayout.__LABEL_DISTANCE
+        badge_radius: float = r * _PieLayout.__BADGE_DISTANCE
+
+        self.starts = starts.tolist()
+        self.spans = spans.tolist()
+        self.middles = middles.tolist()
+        self.cos = cos.tolist()
+        self.sin = sin.tolist()
+        # ``astype(int)`` schneidet wie ``int()`` in Richtung 0 ab
+        self.label_x = (self.center.x() + cos * label_radius).astype(int).tolist()
+        self.label_y = (self.center.y() + sin * label_radius).astype(int).tolist()
+        self.badge_x = (self.center.x() + cos * badge_radius).astype(int).tolist()
+        self.badge_y = (self.center.y() + sin * badge_radius).astype(int).tolist()
+        self.vertical_spans = numpy.abs(
+            numpy.sin(numpy.radians(-(starts + spans))) * r - numpy.sin(numpy.radians(-starts)) * r).tolist()
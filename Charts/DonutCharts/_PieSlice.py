@@ -1,69 +1,211 @@
-from typing import Callable
+import math
+from typing import Callable, List, Optional, Tuple
 
-from PySide6.QtCore import QRect, QObject, QPoint, Slot, QAbstractAnimation, Signal, \
-    QPropertyAnimation, Property, QParallelAnimationGroup
-from PySide6.QtGui import QPainter, Qt, QColor, QPainterPath, QFont, QPen
+from PySide6.QtCore import QRect, QRectF, QPoint, QPointF, QAbstractAnimation
+from PySide6.QtGui import QPainter, Qt, QColor, QPainterPath, QFont, QPen, QPixmap
 
 from DonutCharts import PieChart
-from utils import point_on_circle, font_metrics
+from DonutCharts._PieLayout import _PieLayout
+from utils.cache import TextCache
+from utils.animations import AnimationEngine, Tween
+
+
+class _SliceGeometry:
+    __slots__ = ("badge_offset", "badge_rect", "label_rect", "middle_angle", "wedge", "wedge_key")
+
+    badge_offset: int
+    badge_rect: Optional[QRectF]
+    label_rect: QRectF
+    middle_angle: float
+    wedge: QPainterPath
+    wedge_key: Tuple[int, int, int, int, float, float]
+
+    def __init__(self, middle_angle: float, wedge_key: Tuple[int, int, int, int, float, float], wedge: QPainterPath,
+                 label_rect: QRectF, badge_rect: Optional[QRectF], badge_offset: int):
+        self.badge_offset = badge_offset
+        self.badge_rect = badge_rect
+        self.label_rect = label_rect
+        self.middle_angle = middle_angle
+        self.wedge = wedge
+        self.wedge_key = wedge_key
+
+
+class _SliceState:
+    """
+    Momentaufnahme der Werte, die ``PieSlice.draw`` liest. Sie wird im GUI-Thread mit ``PieSlice.snapshot``
+    erstellt und darf danach in einem Worker-Thread gelesen werden.
+    """
+    __slots__ = ("animation_color", "color", "offset_length", "pie_rect", "pie_size", "text", "value")
+
+    animation_color: QColor
+    color: QColor
+    offset_length: int
+    pie_rect: QRect
+    pie_size: float
+    text: str
+    value: float
+
+    def __init__(self, animation_color: QColor, color: QColor, offset_length: int, pie_rect: QRect,
+                 pie_size: float, text: str, value: float):
+        self.animation_color = animation_color
+        self.color = color
+        self.offset_length = offset_length
+        self.pie_rect = pie_rect
+        self.pie_size = pie_size
+        self.text = text
+        self.value = value
+
+
+class _HoverAnimation:
+    """
+    Farb- und Offset-``Tween`` eines ``PieSlice``. Sie werden erst beim Betreten vergeben und danach in einen
+    kleinen Pool zurückgelegt, da immer nur wenige ``PieSlices`` gleichzeitig animiert sind.
+    """
+    __slots__ = ("color", "offset")
+
+    __POOL_SIZE: int = 8
+    __pool: List["_HoverAnimation"] = list()
+
+    color: Tween
+    offset: Tween
+
+    def __init__(self, pie_slice: "PieSlice"):
+        self.color = Tween(pie_slice, "animation_color", duration=300)
+        self.offset = Tween(pie_slice, "offset", duration=100)
+        self.offset.set_range(QPoint(0, 0), QPoint(20, 20))
+
+    @classmethod
+    def acquire(cls, pie_slice: "PieSlice") -> "_HoverAnimation":
+        if not cls.__pool:
+            return cls(pie_slice)
+        animation: _HoverAnimation = cls.__pool.pop()
+        animation.color.target = pie_slice
+        animation.offset.target = pie_slice
+        return animation
 
-
-class PieSlice(QObject, QPainterPath):
-    clicked: Signal = Signal(dict)
-    entered: Signal = Signal()
-    leaved: Signal = Signal()
-    animationColorChanged: Signal = Signal(QColor)
-    offsetChanged: Signal = Signal(QPoint)
+    @property
+    def running(self) -> bool:
+        return self.color.running or self.offset.running
+
+    def release(self) -> None:
+        engine: AnimationEngine = AnimationEngine.shared()
+        engine.stop(self.color)
+        engine.stop(self.offset)
+        if len(_HoverAnimation.__pool) < _HoverAnimation.__POOL_SIZE:
+            _HoverAnimation.__pool.append(self)
+
+
+class PieSlice:
+    """
+    Schlanker Datensatz eines Eintrags im ``PieChart``.\n
+    Die Hover-Animation (``_HoverAnimation``) wird erst in ``on_entered`` vergeben und mit ``release_animation``
+    zurückgegeben, sobald der ``PieSlice`` wieder in Ruhelage ist. Die Signale für Klick und Hover sitzen am
+    ``PieChart`` (``sliceClicked``, ``sliceEntered``, ``sliceLeaved``) und übergeben den Namen des Eintrags.
+    """
+    __slots__ = ("__animation_color", "__badge_offset", "__badge_rect", "__badge_sprite", "__badge_sprite_key",
+                 "__badge_sprite_rect", "__color", "__hover", "__label_rect", "__middle_angle", "__offset",
+                 "__pie_chart", "__text", "__value", "__wedge", "__wedge_key", "__wedge_rect", "__weakref__")
+
+    __NO_COLOR: QColor = QColor()
+    __REST: QPoint = QPoint(0, 0)
 
     __animation_color: QColor
+    __badge_offset: int
+    __badge_rect: Optional[QRectF]
+    __badge_sprite: Optional[QPixmap]
+    __badge_sprite_key: Optional[Tuple[str, float, float]]
+    __badge_sprite_rect: Optional[QRect]
     __color: QColor
-    __hover_color: QColor
+    __hover: Optional[_HoverAnimation]
+    __label_rect: Optional[QRectF]
+    __middle_angle: float
     __offset: QPoint
     __pie_chart: "PieChart"
-    __parallel_animation: QParallelAnimationGroup
     __text: str
-    __value: float
-
-    def __init__(self, pie_chart: "PieChart", text: str, value: float):
-        QObject.__init__(self)
-        QPainterPath.__init__(self)
-
-        self.__animation_color = QColor()
-        self.__color = QColor()
-        self.__hover_color = QColor()
-        self.__offset = QPoint(0, 0)
-        self.__pie_chart: "PieChart" = pie_chart
+    __value: Optional[float]
+    __wedge: Optional[QPainterPath]
+    __wedge_key: Optional[Tuple[int, int, int, int, float, float]]
+    __wedge_rect: Optional[QRectF]
+
+    def __init__(self, pie_chart: "PieChart", text: str, value: Optional[float]=None):
+        self.__animation_color = PieSlice.__NO_COLOR
+        self.__badge_offset = 0
+        self.__badge_rect = None
+        self.__badge_sprite = None
+        self.__badge_sprite_key = None
+        self.__badge_sprite_rect = None
+        self.__color = PieSlice.__NO_COLOR
+        self.__hover = None
+        self.__label_rect = None
+        self.__middle_angle = 0.0
+        self.__offset = PieSlice.__REST
+        self.__pie_chart = pie_chart
         self.__text = text
         self.__value = value
+        self.__wedge = None
+        self.__wedge_key = None
+        self.__wedge_rect = None
 
-        color_animation: QPropertyAnimation = QPropertyAnimation(self, b"animation_color")
-        color_animation.setDuration(300)
-        offset_animation: QPropertyAnimation = QPropertyAnimation(self, b"offset")
-        offset_animation.setDuration(100)
-
-        self.__parallel_animation = QParallelAnimationGroup(self)
-
-        self.__parallel_animation.addAnimation(color_animation)
-        self.__parallel_animation.addAnimation(offset_animation)
-        self.__parallel_animation.animationAt(1).setStartValue(QPoint(0,0))
-        self.__parallel_animation.animationAt(1).setEndValue(QPoint(20, 20))
-
-        self.entered.connect(self.on_entered)
-        self.leaved.connect(self.on_leave)
-
-    @Slot()
     def on_entered(self):
-        self.__parallel_animation.setDirection(QAbstractAnimation.Direction.Forward)
-        self.__parallel_animation.start()
+        if self.__hover is None:
+            self.__hover = _HoverAnimation.acquire(self)
+            if self.__color.isValid():
+                self.__hover.color.set_range(self.__color, self.__color.lighter(300))
+        self.__start_animations(QAbstractAnimation.Direction.Forward)
 
-    @Slot()
     def on_leave(self):
-        self.__parallel_animation.setDirection(QAbstractAnimation.Direction.Backward)
-        self.__parallel_animation.start()
+        if self.__hover is not None:
+            self.__start_animations(QAbstractAnimation.Direction.Backward)
+
+    def release_animation(self) -> None:
+        """
+        Gibt die Hover-Animation an den Pool zurück und setzt den ``PieSlice`` in Ruhelage.
+        :return:
+        """
+        if self.__hover is not None:
+            self.__hover.release()
+            self.__hover = None
+        self.__animation_color = self.__color
+        self.__offset = PieSlice.__REST
 
+    @property
     def animation_color(self) -> QColor:
         return self.__animation_color
 
+    @animation_color.setter
+    def animation_color(self, color: QColor) -> None:
+        self.__animation_color = color
+        self.__update(self.damage_rect())
+
+    def contains(self, point: QPointF) -> bool:
+        """
+        Hit-Test gegen den zuletzt gezeichneten Keil.
+        :param point:
+        :return: bool
+        """
+        return self.__wedge is not None and self.__wedge.contains(point)
+
+    def damage_rect(self, offset_length: Optional[int]=None) -> QRect:
+        """
+        Gibt den Bereich wieder, den der ``PieSlice`` bei der Verschiebung ``offset_length`` belegt:
+        Keil, Beschriftung und Wert-Badge.\n
+        Ohne Angabe wird der aktuelle ``offset`` verwendet.
+        Wurde der ``PieSlice`` noch nie gezeichnet, wird ein leeres ``QRect`` zurückgegeben.
+        :param offset_length:
+        :return: QRect
+        """
+        if self.__badge_rect is None:
+            return QRect()
+        if offset_length is None:
+            offset_length = self.__offset.manhattanLength()
+
+        radians: float = math.radians(-self.__middle_angle)
+        direction: QPointF = QPointF(math.cos(radians), math.sin(radians))
+
+        wedge: QRectF = self.__wedge_rect.translated(direction * (offset_length / 2))
+        badge: QRectF = self.__badge_rect.translated(direction * ((offset_length - self.__badge_offset) / 2 * 1.15))
+        return wedge.united(badge).united(self.__label_rect).toAlignedRect().adjusted(-2, -2, 2, 2)
+
     @property
     def color(self):
         return self.__color
@@ -73,97 +215,254 @@ class PieSlice(QObject, QPainterPath):
         if color.isValid():
             self.__color = color
             self.__animation_color = color
-            self.__hover_color = color.lighter(300)
-            self.__parallel_animation.animationAt(0).setStartValue(self.__color)
-            self.__parallel_animation.animationAt(0).setEndValue(self.__hover_color)
+            if self.__hover is not None:
+                self.__hover.color.set_range(color, color.lighter(300))
 
+    @property
+    def is_animating(self) -> bool:
+        """
+        ``True``, solange die Hover-Animation läuft oder der ``PieSlice`` nicht in Ruhelage ist.
+        :return: bool
+        """
+        return self.__hover is not None and (self.__hover.running
+                                             or not self.__offset.isNull()
+                                             or self.__animation_color != self.__color)
+
+    @property
     def offset(self) -> QPoint:
         return self.__offset
 
-    def set_animation_color(self, color: QColor) -> None:
-        self.__animation_color = color
-        self.animationColorChanged.emit(color)
-        self.__pie_chart.update()
-
-    def set_offset(self, offset: QPoint) -> None:
+    @offset.setter
+    def offset(self, offset: QPoint) -> None:
+        damage: QRect = self.damage_rect()
         self.__offset = offset
-        self.offsetChanged.emit(offset)
-        self.__pie_chart.update()
+        self.__update(damage.united(self.damage_rect()))
+
+    def snapshot(self, pie_rect: QRect, pie_size: float) -> "_SliceState":
+        """
+        Momentaufnahme für ``draw`` mit ``state``, z.B. für das Zeichnen in einem Worker-Thread.
+        Muss im GUI-Thread aufgerufen werden.
+        :param pie_rect: ``PieChart.pie_rect``
+        :param pie_size: ``PieChart.pie_size``
+        :return: _SliceState
+        """
+        return _SliceState(QColor(self.__animation_color), QColor(self.__color), self.__offset.manhattanLength(),
+                           QRect(pie_rect), pie_size, self.__text, self.value)
+
+    def offset_vector(self) -> QPointF:
+        """
+        Gibt die Verschiebung des ``PieSlice`` durch ``offset`` entlang seiner Mittelachse wieder.
+        :return: QPointF
+        """
+        radians: float = math.radians(-self.__middle_angle)
+        radius: float = self.__offset.manhattanLength() / 2
+        return QPointF(math.cos(radians) * radius, math.sin(radians) * radius)
+
+    def __start_animations(self, direction: QAbstractAnimation.Direction) -> None:
+        engine: AnimationEngine = AnimationEngine.shared()
+        for animation in (self.__hover.color, self.__hover.offset):
+            if animation.start_value is not None:
+                engine.start(animation, direction)
+
+    def __update(self, damage: QRect) -> None:
+        if damage.isEmpty():
+            self.__pie_chart.update()
+        else:
+            self.__pie_chart.update(damage)
 
     @property
     def text(self) -> str:
         return self.__text
 
+    @text.setter
+    def text(self, text: str) -> None:
+        self.__text = text
+
     @property
     def value(self) -> float:
+        """
+        Der Wert steht im ``_EntryStore`` des ``PieCharts`` und wird über ``PieChart.entries`` gelesen.
+        Nur der zusammengefasste ``PieSlice`` (``lod_threshold``) gehört nicht zu den Einträgen und hält seinen
+        Wert selbst.
+        :return: float
+        """
+        if self.__value is None:
+            return self.__pie_chart.entries[self.__text]
         return self.__value
 
-    def draw(self, painter: QPainter, start_angle: float, span_angle: float):
-        rect: QRect = self.__pie_chart.pie_rect
-        center: QPoint = rect.center()
-        size: int = self.__pie_chart.pie_size
+    @value.setter
+    def value(self, value: float) -> None:
+        self.__value = value
 
-        middle_angle = start_angle + span_angle / 2  # Die Mitte des Slices
-        rotation = -middle_angle
+    def apply_geometry(self, geometry: "_SliceGeometry") -> None:
+        """
+        Übernimmt die Geometrie, die ``draw`` mit ``state`` berechnet hat. Muss im GUI-Thread aufgerufen
+        werden.
+        :param geometry:
+        :return:
+        """
+        self.__middle_angle = geometry.middle_angle
+        if geometry.wedge_key != self.__wedge_key:
+            self.__set_wedge(geometry.wedge_key, geometry.wedge)
+        self.__label_rect = geometry.label_rect
+        if geometry.badge_rect is not None:
+            self.__badge_offset = geometry.badge_offset
+            self.__badge_rect = geometry.badge_rect
+
+    def draw(self, painter: QPainter, layout: "_PieLayout", index: int, badge: bool=True,
+             state: Optional["_SliceState"]=None) -> Optional["_SliceGeometry"]:
+        """
+        Zeichnet den ``PieSlice`` an Position ``index`` des vorberechneten ``layout``.
+        :param painter:
+        :param layout:
+        :param index:
+        :param badge: Ohne Wert-Badge, z.B. wenn er beim Drehen aufrecht darüber gezeichnet wird
+        :param state: Zeichnet nur aus dieser Momentaufnahme (``snapshot``), ohne den ``PieSlice`` oder das
+            ``PieChart`` zu lesen oder zu verändern, z.B. in einem Worker-Thread. Die Geometrie wird
+            zurückgegeben und im GUI-Thread mit ``apply_geometry`` übernommen.
+        :return: Optional[_SliceGeometry] Die Geometrie bei ``state``
+        """
+        detached: bool = state is not None
+        if state is None:
+            state = self.snapshot(self.__pie_chart.pie_rect, self.__pie_chart.pie_size)
+        rect: QRect = state.pie_rect
+        start_angle: float = layout.starts[index]
+        span_angle: float = layout.spans[index]
+        middle_angle: float = layout.middles[index]
+        offset_length: int = state.offset_length
+        key: Tuple[int, int, int, int, float, float] = (
+            rect.x(), rect.y(), rect.width(), rect.height(), start_angle, span_angle)
+        wedge: QPainterPath = self.__build_wedge(key, rect, detached)
 
         painter.setPen(QPen(QColor(0, 0, 0, 30)))
-        self.__draw_pie(painter, center, rect, start_angle, span_angle, middle_angle)
+        self.__draw_pie(painter, wedge, layout.offset_delta(index, offset_length), state.animation_color)
 
-        painter.setFont(QFont("Roboto", size * 0.025))
+        font: QFont = TextCache.shared().font("Roboto", layout.size * 0.025)
+        label_rect: QRectF = QRectF()
         if span_angle > 10:
-            point: QPoint = point_on_circle(center, middle_angle, size, 0.5)
-            self.__draw_help(painter, self.__text, rotation, point, self.__draw_text)
-
-        point: QPoint = point_on_circle(center, middle_angle, size + self.__offset.manhattanLength(), 1.15)
-
-        self.__draw_help(painter, f"{self.__value:.2f}", 0, point, self.__draw_values)
-
-    def __draw_pie(self, painter: QPainter, center: QPoint, rect: QRect, start_angle: float, span_angle: float,
-                   middle_angle: float):
-        painter.setBrush(self.__animation_color)
-
-        offset_point = point_on_circle(center, middle_angle, self.__offset.manhattanLength(), 1.0)
-
-        # Offset als Vektor berechnen
-        dx = offset_point.x() - center.x()
-        dy = offset_point.y() - center.y()
+            label_rect = self.__draw_help(
+                painter, font, state.text, -middle_angle, layout.label_point(index), state, self.__draw_text)
+
+        badge_rect: Optional[QRectF] = None
+        if badge:
+            badge_rect = self.__draw_help(painter, font, f"{state.value:.2f}", 0,
+                                          layout.badge_point(index, offset_length), state, self.__draw_values)
+
+        geometry: _SliceGeometry = _SliceGeometry(middle_angle, key, wedge, label_rect, badge_rect, offset_length)
+        if detached:
+            return geometry
+        self.apply_geometry(geometry)
+        return None
+
+    def draw_badge(self, painter: QPainter, layout: "_PieLayout", point: QPoint, sprite: bool=False):
+        """
+        Zeichnet den Wert-Badge aufrecht an ``point``.
+        :param painter:
+        :param layout:
+        :param point:
+        :param sprite: Zeichnet eine gecachte ``QPixmap`` des Badges, z.B. für jeden Frame beim Drehen
+        :return:
+        """
+        text: str = f"{self.value:.2f}"
+        self.__badge_offset = self.__offset.manhattanLength()
+        if not sprite:
+            font: QFont = TextCache.shared().font("Roboto", layout.size * 0.025)
+            state: _SliceState = self.snapshot(self.__pie_chart.pie_rect, self.__pie_chart.pie_size)
+            self.__badge_rect = self.__draw_help(painter, font, text, 0, point, state, self.__draw_values)
+            return
+
+        dpr: float = painter.device().devicePixelRatioF()
+        key: Tuple[str, float, float] = (text, layout.size, dpr)
+        if key != self.__badge_sprite_key:
+            font: QFont = TextCache.shared().font("Roboto", layout.size * 0.025)
+            text_width, text_height = TextCache.shared().measure(painter, font, text)
+            # Gleiches Rechteck wie in ``__draw_values``, 1px Rand für das Antialiasing
+            value_rect: QRect = QRect(-(text_width + 32) // 2, -(text_height // 2), text_width + 32, text_height + 8)
+            sprite_rect: QRect = value_rect.adjusted(-1, -1, 1, 1)
+            pixmap: QPixmap = QPixmap(sprite_rect.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            sprite_painter: QPainter = QPainter(pixmap)
+            sprite_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            sprite_painter.translate(-sprite_rect.topLeft())
+            self.__draw_values(sprite_painter, font, text, text_width, text_height,
+                               self.snapshot(self.__pie_chart.pie_rect, self.__pie_chart.pie_size))
+            sprite_painter.end()
+            self.__badge_sprite = pixmap
+            self.__badge_sprite_key = key
+            self.__badge_sprite_rect = sprite_rect
+
+        target: QRect = self.__badge_sprite_rect.translated(point)
+        painter.drawPixmap(target.topLeft(), self.__badge_sprite)
+        self.__badge_rect = QRectF(target)
+
+    def __draw_pie(self, painter: QPainter, wedge: QPainterPath, delta: Tuple[int, int], color: QColor):
+        painter.setBrush(color)
+        dx, dy = delta
 
         painter.save()
         painter.translate(dx, dy)
-
-        # Path erstellen & zeichnen
-        self.clear()
-        self.moveTo(center)
-        self.arcTo(rect, start_angle, span_angle)
-        self.closeSubpath()
-        painter.drawPath(self)
-
+        painter.drawPath(wedge)
         painter.restore()
 
+    def __build_wedge(self, key: Tuple[int, int, int, int, float, float], rect: QRect,
+                      detached: bool=False) -> QPainterPath:
+        """
+        Gibt den Keil für ``key`` (``rect``, Start- und Spannwinkel) wieder. Er wird nur neu aufgebaut, wenn sich
+        das Layout geändert hat, nicht bei jedem Frame einer Farb- oder Hover-Animation.\n
+        Mit ``detached`` wird der Keil immer neu aufgebaut und nicht übernommen.
+        :param key:
+        :param rect:
+        :param detached:
+        :return: QPainterPath
+        """
+        if not detached and key == self.__wedge_key:
+            return self.__wedge
+        wedge: QPainterPath = QPainterPath()
+        wedge.moveTo(rect.center())
+        wedge.arcTo(rect, key[4], key[5])
+        wedge.closeSubpath()
+        if not detached:
+            self.__set_wedge(key, wedge)
+        return wedge
+
+    def __set_wedge(self, key: Tuple[int, int, int, int, float, float], wedge: QPainterPath) -> None:
+        self.__wedge = wedge
+        self.__wedge_key = key
+        self.__wedge_rect = wedge.boundingRect()
+
     # noinspection PyMethodMayBeStatic
-    def __draw_help(self, painter: QPainter, text: str, rotation: float, point: QPoint, cb: Callable[[QPainter, str, int, int], None]):
+    def __draw_help(self, painter: QPainter, font: QFont, text: str, rotation: float, point: QPoint,
+                    state: "_SliceState",
+                    cb: Callable[[QPainter, QFont, str, int, int, "_SliceState"], QRect]) -> QRectF:
         painter.save()
-        text_width, text_height = font_metrics(painter, text)
+        text_width, text_height = TextCache.shared().measure(painter, font, text)
         painter.translate(point)
         painter.rotate(rotation)
-        cb(painter, text, text_width, text_height)
+        drawn: QRectF = painter.transform().mapRect(QRectF(cb(painter, font, text, text_width, text_height, state)))
         painter.restore()
+        return drawn
 
     # noinspection PyMethodMayBeStatic
-    def __draw_text(self, painter: QPainter, text: str, text_width: int , text_height: int):
-        if self.color.value() > 105:
-            painter.setPen(QPen(self.color.darker(200)))
+    def __draw_text(self, painter: QPainter, font: QFont, text: str, text_width: int , text_height: int,
+                    state: "_SliceState"):
+        if state.color.value() > 105:
+            painter.setPen(QPen(state.color.darker(200)))
         else:
-            painter.setPen(QPen(self.color.lighter(150)))
+            painter.setPen(QPen(state.color.lighter(150)))
 
         text_rect = QRect(0, -(text_height / 2), text_width, text_height)
-        painter.drawText(text_rect, text)
+        TextCache.shared().draw(
+            painter, font, text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, text)
+        return text_rect
 
     # noinspection PyMethodMayBeStatic
-    def __draw_values(self, painter: QPainter, text: str, text_width: int, text_height: int):
+    def __draw_values(self, painter: QPainter, font: QFont, text: str, text_width: int, text_height: int,
+                      state: "_SliceState"):
+        # ``text_width`` und ``text_height`` sind mit der Schrift der Beschriftung gemessen
+        cache: TextCache = TextCache.shared()
         painter.setPen(QPen(QColor(208, 208, 208)))
         painter.setBrush(QColor(30, 34, 39))
-        painter.setFont(QFont("Roboto Mono", self.__pie_chart.pie_size * 0.02))
         value_rect: QRect = QRect(
             -(text_width +32) // 2,
             -(text_height // 2),
@@ -171,9 +470,7 @@ class PieSlice(QObject, QPainterPath):
             text_height + 8
         )
         painter.drawRoundedRect(value_rect, 4, 4)
-        painter.drawText(value_rect, Qt.AlignmentFlag.AlignCenter, text)
-
-
-    animation_color = Property(QColor, fget=animation_color, fset=set_animation_color, notify=animationColorChanged)
-    offset = Property(QPoint, fget=offset, fset=set_offset, notify=offsetChanged)
+        cache.draw(painter, cache.font("Roboto Mono", state.pie_size * 0.02), value_rect,
+                   Qt.AlignmentFlag.AlignCenter, text)
+        return value_rect
 
@@ -0,0 +1,133 @@
+from bisect import bisect_left
+from itertools import count
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from DonutCharts.SortType import SortType
+
+
+class _Order:
+    __slots__ = ("key", "keys", "names", "reverse")
+
+    key: Callable[[str, float, int], Tuple]
+    keys: List[Tuple]
+    names: List[str]
+    reverse: bool
+
+    def __init__(self, key: Callable[[str, float, int], Tuple], reverse: bool):
+        self.key = key
+        self.keys = list()
+        self.names = list()
+        self.reverse = reverse
+
+
+class _SortIndex:
+    """
+    Reihenfolge der Einträge für alle ``SortType``'s, wie ``utils.sort_by_type``.\n
+    Pro ``SortType`` wird eine aufsteigend sortierte Liste von Schlüsseln samt Namen gehalten und bei einzelnen
+    Änderungen per ``bisect`` angepasst, statt neu zu sortieren. Absteigende Reihenfolgen werden rückwärts gelesen.
+    Gleiche Werte behalten wie beim stabilen ``sorted`` die Reihenfolge, in der sie hinzugefügt wurden.\n
+    Die Werte selbst werden nicht kopiert, sondern über ``value_of`` gelesen (z.B. aus dem ``_EntryStore``).
+    """
+    __slots__ = ("_orders", "_sequence", "_sequences", "_value_of")
+
+    _orders: Dict[SortType, _Order]
+    _sequence: Iterator[int]
+    _sequences: Dict[str, int]
+    _value_of: Callable[[str], float]
+
+    def __init__(self, value_of: Callable[[str], float], entries: Dict[str, float]=None):
+        self._orders = {
+            SortType.LowestValue: _Order(lambda name, value, seq: (value, seq), False),
+            SortType.HighestValue: _Order(lambda name, value, seq: (value, -seq), True),
+            SortType.NameAsc: _Order(lambda name, value, seq: (name,), False),
+            SortType.NameDesc: _Order(lambda name, value, seq: (name,), True),
+            SortType.NameLength: _Order(lambda name, value, seq: (len(name), name), True),
+        }
+        self._sequence = count()
+        self._sequences = dict()
+        self._value_of = value_of
+        if entries:
+            for name in entries:
+                self._sequences[name] = next(self._sequence)
+            for order in self._orders.values():
+                pairs: List[Tuple[Tuple, str]] = sorted(
+                    (order.key(name, value, self._sequences[name]), name) for name, value in entries.items())
+                order.keys = [key for key, _ in pairs]
+                order.names = [name for _, name in pairs]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sequences
+
+    def __len__(self) -> int:
+        return len(self._sequences)
+
+    def add(self, name: str, value: float) -> None:
+        """
+        Fügt einen Eintrag hinzu. Er steht hinter allen Einträgen mit gleichem Wert.
+        :param name:
+        :param value:
+        :return:
+        """
+        self._sequences[name] = next(self._sequence)
+        for order in self._orders.values():
+            self.__insert(order, name, value)
+
+    def order(self, sort_type: SortType) -> List[str]:
+        """
+        Gibt die Namen in der Reihenfolge von ``sort_type`` wieder, ohne zu sortieren.
+        :param sort_type:
+        :return: List[str]
+        """
+        order: _Order = self._orders[sort_type]
+        return order.names[::-1] if order.reverse else list(order.names)
+
+    def position(self, sort_type: SortType, name: str) -> int:
+        """
+        Gibt die Position von ``name`` in der Reihenfolge von ``sort_type`` wieder.
+        :param sort_type:
+        :param name:
+        :return: int
+        """
+        order: _Order = self._orders[sort_type]
+        i: int = bisect_left(order.keys, self.__key(order, name, self._value_of(name)))
+        return len(order.keys) - 1 - i if order.reverse else i
+
+    def remove(self, name: str) -> None:
+        """
+        Entfernt einen Eintrag. Muss aufgerufen werden, solange ``value_of`` noch den Wert liefert.
+        :param name:
+        :return:
+        """
+        value: float = self._value_of(name)
+        for order in self._orders.values():
+            self.__delete(order, name, value)
+        del self._sequences[name]
+
+    def update(self, name: str, value: float) -> None:
+        """
+        Setzt den Wert eines Eintrags. Nur die Reihenfolgen nach Wert werden angepasst, die Position unter
+        gleichen Werten bleibt erhalten. Muss aufgerufen werden, solange ``value_of`` noch den alten Wert liefert.
+        :param name:
+        :param value:
+        :return:
+        """
+        previous: float = self._value_of(name)
+        if previous == value:
+            return
+        for order in (self._orders[SortType.LowestValue], self._orders[SortType.HighestValue]):
+            self.__delete(order, name, previous)
+            self.__insert(order, name, value)
+
+    def __delete(self, order: _Order, name: str, value: float) -> None:
+        i: int = bisect_left(order.keys, self.__key(order, name, value))
+        del order.keys[i]
+        del order.names[i]
+
+    def __insert(self, order: _Order, name: str, value: float) -> None:
+        key: Tuple = self.__key(order, name, value)
+        i: int = bisect_left(order.keys, key)
+        order.keys.insert(i, key)
+        order.names.insert(i, name)
+
+    def __key(self, order: _Order, name: str, value: float) -> Tuple:
+        return order.key(name, value, self._sequences[name])
@@ -0,0 +1,202 @@
+"""
+Rendert Charts ohne Display als PNG oder SVG, z.B. für nächtliche Reports.\n
+Jede Zeile der Eingabe (JSON Lines) beschreibt ein Chart:
+
+    {"type": "pie", "name": "umsatz", "entries": {"Bob": 1114, "Sven": 3214}, "sort_type": "HighestValue",
+     "title": "Umsatz 2024", "title_color": "#1e2227", "colors": ["#1e2027"], "size": [800, 800], "format": "svg"}
+
+``type`` ist ``pie`` (``PieChart``), ``bar`` (``BarChart``) oder ``cube`` (einzelnes ``CubeItem`` mit ``level``
+zwischen 0 und 1 als Füllstand und ``colors[0]`` als Grundfarbe). Außer ``entries`` sind alle Felder optional.
+``size`` darf nicht kleiner als die Mindestgröße des Widgets sein (z.B. 400x400 beim ``PieChart``).
+Die Arbeit wird auf einen Prozesspool verteilt, jeder Prozess hat seine eigene ``QApplication`` auf der
+``offscreen`` Plattform.
+
+    python batch_render.py specs.jsonl --output reports/ --workers 8
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+FORMATS: Tuple[str, ...] = ("png", "svg")
+DEFAULT_SIZE: Tuple[int, int] = (800, 800)
+
+_app = None
+
+
+def _init_worker() -> None:
+    """
+    Erstellt die ``QApplication`` des Prozesses. Qt wird erst hier importiert, damit der Hauptprozess ohne
+    ``QApplication`` auskommt.
+    :return:
+    """
+    global _app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    _app = QApplication.instance() or QApplication([sys.argv[0]])
+
+
+def _color(value: str):
+    from PySide6.QtGui import QColor
+    color: QColor = QColor(value)
+    if not color.isValid():
+        raise ValueError(f"Ungültige Farbe: '{value}'")
+    return color
+
+
+def _build(spec: Dict):
+    """
+    Erstellt das Widget für ``spec``.
+    :param spec:
+    :return: QWidget
+    """
+    from BarCharts import BarChart, CubeItem
+    from DonutCharts import PieChart
+    from DonutCharts.SortType import SortType
+
+    kind: str = spec.get("type", "pie")
+    colors: List = [_color(value) for value in spec.get("colors", [])]
+    if kind == "pie":
+        widget: PieChart = PieChart()
+        widget.set_entries(spec["entries"], SortType[spec.get("sort_type", "HighestValue")])
+        if colors:
+            widget.slice_colors = colors
+        if "title" in spec:
+            widget.title = spec["title"]
+        if "title_color" in spec:
+            widget.title_color = _color(spec["title_color"])
+        if "lod_threshold" in spec:
+            widget.lod_threshold = spec["lod_threshold"]
+    elif kind == "bar":
+        widget: BarChart = BarChart()
+        widget.set_entries(spec["entries"], colors)
+    elif kind == "cube":
+        if "value" in spec:
+            raise ValueError("'value' wird beim CubeItem nicht gezeichnet, für die Höhe 'level' (0 bis 1) verwenden")
+        widget: CubeItem = CubeItem()
+        widget.level = spec.get("level", widget.level)
+        if colors:
+            widget.base_color = colors[0]
+    else:
+        raise ValueError(f"Unbekannter Chart-Typ: '{kind}'")
+    return widget
+
+
+def _resize(widget, size) -> None:
+    """
+    Setzt die Größe von ``widget``. Größen, die das Widget nicht annimmt, werden abgelehnt, statt das Chart
+    abgeschnitten oder mit Rand zu rendern.
+    :param widget:
+    :param size: QSize
+    :return:
+    """
+    from BarCharts import CubeItem
+
+    minimum = widget.minimumSize()
+    if size.width() < minimum.width() or size.height() < minimum.height():
+        raise ValueError(f"Die Größe {size.width()}x{size.height()} ist kleiner als die Mindestgröße "
+                         f"{minimum.width()}x{minimum.height()}")
+    widget.resize(size)
+    # ``CubeItem.resizeEvent`` behält die alte Größe, wenn die Tiefe des Cubes nicht in die Höhe passt
+    if isinstance(widget, CubeItem) and widget.cube_depth + 4 > size.height():
+        raise ValueError(f"Die Größe {size.width()}x{size.height()} ist für ein CubeItem zu niedrig")
+
+
+def _render_spec(job: Tuple[int, str, str]) -> Tuple[int, Optional[str], Optional[str]]:
+    """
+    Rendert eine Zeile der Eingabe. Fehler werden zurückgegeben statt geworfen, damit ein fehlerhaftes
+    Chart nicht den ganzen Lauf abbricht.
+    :param job: (Zeilennummer, JSON, Ausgabeordner)
+    :return: Tuple[int, Optional[str], Optional[str]] (Zeilennummer, Datei, Fehler)
+    """
+    from PySide6.QtCore import QRect, QSize
+    from PySide6.QtGui import QImage, Qt
+    from PySide6.QtSvg import QSvgGenerator
+
+    number, line, output = job
+    try:
+        spec: Dict = json.loads(line)
+        file_format: str = spec.get("format", "png").lower()
+        if file_format not in FORMATS:
+            raise ValueError(f"Unbekanntes Format: '{file_format}'")
+        width, height = spec.get("size", DEFAULT_SIZE)
+        size: QSize = QSize(width, height)
+        path: str = os.path.join(output, f"{spec.get('name', f'chart-{number:06d}')}.{file_format}")
+
+        widget = _build(spec)
+        _resize(widget, size)
+        if file_format == "svg":
+            generator: QSvgGenerator = QSvgGenerator()
+            generator.setFileName(path)
+            generator.setSize(size)
+            generator.setViewBox(QRect(0, 0, width, height))
+            generator.setTitle(spec.get("title", ""))
+            widget.render(generator)
+        else:
+            image: QImage = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+            image.fill(Qt.GlobalColor.transparent)
+            widget.render(image)
+            if not image.save(path):
+                raise OSError(f"Konnte '{path}' nicht schreiben")
+        return number, path, None
+    except Exception as error:
+        return number, None, f"{type(error).__name__}: {error}"
+
+
+def _jobs(source, output: str) -> Iterator[Tuple[int, str, str]]:
+    for number, line in enumerate(source, start=1):
+        if line.strip():
+            yield number, line, output
+
+
+def render(source, output: str, workers: Optional[int]=None, chunk_size: int=8) -> Tuple[int, List[str], float]:
+    """
+    Rendert alle Charts aus ``source`` (Zeilen im JSON Lines Format) nach ``output``.
+    :param source: Iterierbare Zeilen, z.B. eine geöffnete Datei
+    :param output: Ausgabeordner
+    :param workers: Anzahl der Prozesse, ohne Angabe ``os.cpu_count()``
+    :param chunk_size: Charts pro Auftrag an einen Prozess
+    :return: Tuple[int, List[str], float] (Anzahl gerenderter Charts, Fehler, Sekunden)
+    """
+    os.makedirs(output, exist_ok=True)
+    rendered: int = 0
+    errors: List[str] = list()
+    start: float = time.perf_counter()
+    # ``spawn`` statt ``fork``: Qt ist nach einem ``fork`` nicht zuverlässig nutzbar
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as pool:
+        for number, path, error in pool.map(_render_spec, _jobs(source, output), chunksize=chunk_size):
+            if error is None:
+                rendered += 1
+            else:
+                errors.append(f"Zeile {number}: {error}")
+    return rendered, errors, time.perf_counter() - start
+
+
+def main():
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("specs", help="JSON Lines Datei, '-' für stdin")
+    parser.add_argument("--output", default="charts")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=8)
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.specs == "-":
+        rendered, errors, seconds = render(sys.stdin, args.output, args.workers, args.chunk_size)
+    else:
+        with open(args.specs, encoding="utf-8") as file:
+            rendered, errors, seconds = render(file, args.output, args.workers, args.chunk_size)
+
+    for error in errors:
+        print(error, file=sys.stderr)
+    print(f"{rendered} Charts in {seconds:.2f} s ({rendered / seconds if seconds else 0:.1f} Charts/s), "
+          f"{len(errors)} Fehler")
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
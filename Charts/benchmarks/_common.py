@@ -0,0 +1,41 @@
+import os
+import sys
+import time
+from typing import Callable
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QImage, Qt
+from PySide6.QtWidgets import QApplication
+
+
+def offscreen_app() -> QApplication:
+    """
+    Erstellt (einmalig) eine ``QApplication`` auf der ``offscreen`` Plattform,
+    damit die Benchmarks ohne Display laufen.
+    :return: QApplication
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+def image_for(size: QSize) -> QImage:
+    image: QImage = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    return image
+
+
+def time_per_call(fn: Callable[[], None], repeat: int, rounds: int=3) -> float:
+    """
+    Misst die Zeit pro Aufruf in Sekunden. Es wird der beste Wert aus ``rounds`` Durchläufen genommen.
+    :param fn:
+    :param repeat:
+    :param rounds:
+    :return: float
+    """
+    best: float = float("inf")
+    for _ in range(rounds):
+        start: float = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best
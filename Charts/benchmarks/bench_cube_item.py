@@ -0,0 +1,59 @@
+"""
+Vergleicht die Zeichenzeit eines ``CubeItem`` mit gecachter Geometrie gegenüber
+einem Neuaufbau der Geometrie bei jedem ``paintEvent``.
+
+    python -m benchmarks.bench_cube_item
+"""
+from benchmarks._common import offscreen_app, image_for, time_per_call
+
+app = offscreen_app()
+
+from PySide6.QtGui import QImage
+
+from BarCharts import CubeItem
+from BarCharts._CubeGeometry import _CubeGeometry
+
+
+class _UncachedCubeItem(CubeItem):
+    @property
+    def cube_geometry(self) -> _CubeGeometry:
+        return _CubeGeometry(self.size(), self.cube_item_data)
+
+
+def _legacy_geometry(cube: CubeItem) -> None:
+    # Zugriffsmuster des alten ``paintEvent``: drei ``_CubeItemData`` und vier ``boundingRect``'s pro Frame.
+    front = cube.cube_item_data.front
+    front.boundingRect()
+    front.boundingRect()
+    cube.cube_item_data.side
+    front.boundingRect()
+    cube.cube_item_data.top.boundingRect()
+
+
+def _cached_geometry(cube: CubeItem) -> None:
+    geometry: _CubeGeometry = cube.cube_geometry
+    geometry.front_rect
+    geometry.top_rect
+    geometry.label_rect
+
+
+def main(repeat: int=2000):
+    cube: CubeItem = CubeItem()
+    legacy: float = time_per_call(lambda: _legacy_geometry(cube), repeat * 10)
+    cached: float = time_per_call(lambda: _cached_geometry(cube), repeat * 10)
+    print(f"{'geometry':>10}: {legacy * 1e6:8.2f} µs -> {cached * 1e6:8.2f} µs / frame")
+
+    results = {}
+    for name, cls in (("uncached", _UncachedCubeItem), ("cached", CubeItem)):
+        cube: CubeItem = cls()
+        cube.setGraphicsEffect(None)
+        image: QImage = image_for(cube.size())
+        results[name] = time_per_call(lambda: cube.render(image), repeat)
+
+    for name, seconds in results.items():
+        print(f"{name:>10}: {seconds * 1e6:8.1f} µs / paint")
+    print(f"{'speedup':>10}: {results['uncached'] / results['cached']:8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
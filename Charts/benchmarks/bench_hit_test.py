@@ -0,0 +1,62 @@
+"""
+Vergleicht das Hit-Testing über ``QPainterPath.contains`` je ``PieSlice`` mit dem Winkel-Index ``_HitIndex``.
+
+    python -m benchmarks.bench_hit_test
+"""
+import random
+from typing import List, Optional
+
+from benchmarks._common import offscreen_app, time_per_call
+
+app = offscreen_app()
+
+from PySide6.QtCore import QRectF, QPointF
+from PySide6.QtGui import QPainterPath
+
+from DonutCharts._HitIndex import _HitIndex
+
+SIZE: float = 600.0
+ROTATION: float = 30.0
+
+
+def _wedges(spans: List[float], rect: QRectF) -> List[QPainterPath]:
+    paths: List[QPainterPath] = list()
+    start: float = ROTATION
+    for span in spans:
+        path: QPainterPath = QPainterPath()
+        path.moveTo(rect.center())
+        path.arcTo(rect, start, span)
+        path.closeSubpath()
+        paths.append(path)
+        start += span
+    return paths
+
+
+def _legacy(paths: List[QPainterPath], pos: QPointF) -> Optional[int]:
+    for i, path in enumerate(paths):
+        if path.contains(pos):
+            return i
+    return None
+
+
+def main(counts=(10, 1_000, 100_000)):
+    rng: random.Random = random.Random(7)
+    rect: QRectF = QRectF(0, 0, SIZE, SIZE)
+    print(f"{'slices':>8} {'contains-loop':>16} {'bisect':>12} {'speedup':>9}")
+    for n in counts:
+        values: List[float] = [rng.uniform(1, 100) for _ in range(n)]
+        total: float = sum(values)
+        spans: List[float] = [v / total * 360 for v in values]
+
+        paths: List[QPainterPath] = _wedges(spans, rect)
+        index: _HitIndex = _HitIndex(spans, rect.center(), SIZE * 0.05, SIZE / 2, ROTATION)
+        points: List[QPointF] = [QPointF(rng.uniform(0, SIZE), rng.uniform(0, SIZE)) for _ in range(64)]
+
+        legacy_points: List[QPointF] = points[:max(1, 6400 // n)]
+        legacy: float = time_per_call(lambda: [_legacy(paths, p) for p in legacy_points], 1, 1) / len(legacy_points)
+        fast: float = time_per_call(lambda: [index.index_at(p) for p in points], 100) / len(points)
+        print(f"{n:>8} {legacy * 1e6:>13.1f} µs {fast * 1e6:>9.2f} µs {legacy / fast:>8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+"""
+Headless Benchmark-Suite für ``PieChart``, ``PieSlice``, ``CubeItem`` und ``Behavior``.\n
+Läuft auf der Qt ``offscreen`` Plattform und schreibt die Ergebnisse als JSON, damit Commits verglichen
+werden können. Zusätzlich wird mit ``tracemalloc`` der Spitzenverbrauch pro Chart gemessen
+(nur Python-Allokationen, der Speicher der Qt-Objekte selbst ist nicht enthalten).
+
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --output after.json --compare before.json
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from benchmarks._common import offscreen_app, image_for, time_per_call
+
+app = offscreen_app()
+
+from PySide6.QtCore import QPoint, QPointF, QRect, QSize, qVersion
+from PySide6.QtGui import QColor, QImage, QRegion
+from PySide6.QtWidgets import QWidget
+
+from BarCharts import CubeItem
+from DonutCharts import PieChart
+from utils.animations import AnimationEngine, AnimationRegistry, Behavior
+
+COUNTS: List[int] = [5, 100, 1_000, 10_000, 100_000]
+BUDGET: float = 0.5
+SIZE: QSize = QSize(800, 800)
+
+
+def _entries(n: int, seed: int=7) -> Dict[str, float]:
+    rng: random.Random = random.Random(seed)
+    return {f"Entry - {i}": rng.uniform(1, 100) for i in range(n)}
+
+
+def _measure(fn: Callable[[], None], budget: float=BUDGET) -> float:
+    """
+    Misst die Zeit pro Aufruf. Die Anzahl der Wiederholungen wird aus einem ersten Aufruf so gewählt,
+    dass eine Messung etwa ``budget`` Sekunden dauert. Dauert schon der erste Aufruf länger, zählt nur dieser.
+    :param fn:
+    :param budget:
+    :return: float
+    """
+    start: float = time.perf_counter()
+    fn()
+    first: float = time.perf_counter() - start
+    if first >= budget:
+        return first
+    return time_per_call(fn, max(1, min(1_000, int(budget / 3 / max(first, 1e-6)))))
+
+
+def _render(widget: QWidget, image: QImage, region: Optional[QRegion]=None) -> None:
+    if region is None:
+        widget.render(image)
+    else:
+        widget.render(image, QPoint(), region)
+
+
+def bench_pie_chart(n: int) -> Dict[str, float]:
+    entries: Dict[str, float] = _entries(n)
+    chart: PieChart = PieChart()
+    chart.resize(SIZE)
+    results: Dict[str, float] = dict()
+
+    results["pie.set_entries"] = _measure(lambda: chart.set_entries(entries))
+
+    image: QImage = image_for(SIZE)
+    _render(chart, image)
+
+    def cold() -> None:
+        # ``set_rotation`` verwirft den Ring-Layer, der von der Anzahl der Einträge abhängt
+        chart.set_rotation(chart.rotation)
+        _render(chart, image)
+
+    results["pie.paint_full_cold"] = _measure(cold)
+    results["pie.paint_full_warm"] = _measure(lambda: _render(chart, image))
+
+    region: QRegion = QRegion(QRect(chart.pie_rect.center(), QSize(64, 64)))
+    results["pie.paint_partial"] = _measure(lambda: _render(chart, image, region))
+
+    rng: random.Random = random.Random(3)
+    points: List[QPointF] = [QPointF(rng.uniform(0, SIZE.width()), rng.uniform(0, SIZE.height()))
+                             for _ in range(256)]
+    chart.slice_at(points[0])
+    results["pie.slice_at"] = _measure(lambda: [chart.slice_at(p) for p in points]) / len(points)
+
+    chart.deleteLater()
+    return results
+
+
+def bench_cube_items(n: int) -> Dict[str, float]:
+    results: Dict[str, float] = dict()
+    parent: QWidget = QWidget()
+    cubes: List[CubeItem] = [CubeItem(parent) for _ in range(n)]
+
+    cube: CubeItem = CubeItem()
+    image: QImage = image_for(cube.size())
+    results["cube.paint"] = _measure(lambda: _render(cube, image))
+    cube.deleteLater()
+
+    colors: List[QColor] = [QColor(6, 120, 182), QColor(182, 60, 6)]
+    state: List[int] = [0]
+
+    def start_all() -> None:
+        state[0] ^= 1
+        for item in cubes:
+            Behavior(item, "base_color", end_value=colors[state[0]]).start()
+
+    results["behavior.start"] = _measure(start_all) / n
+    results["behavior.active_tweens"] = AnimationEngine.shared().active_count
+
+    registry: AnimationRegistry = AnimationRegistry.shared()
+    for item in cubes:
+        AnimationEngine.shared().stop(registry.tween(item, "base_color"))
+    parent.deleteLater()
+    return results
+
+
+def peak_memory(n: int) -> Dict[str, int]:
+    """
+    Spitzenverbrauch beim Aufbau und ersten Zeichnen eines ``PieChart`` mit ``n`` Einträgen.
+    :param n:
+    :return: Dict[str, int]
+    """
+    entries: Dict[str, float] = _entries(n)
+    tracemalloc.start()
+    chart: PieChart = PieChart()
+    chart.resize(SIZE)
+    chart.set_entries(entries)
+    _render(chart, image_for(SIZE))
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    chart.deleteLater()
+    return {"pie.retained_bytes": current, "pie.peak_bytes": peak}
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(counts: List[int]) -> Dict:
+    results: List[Dict] = list()
+    for n in counts:
+        measured: Dict[str, float] = dict()
+        for bench in (bench_pie_chart, bench_cube_items, peak_memory):
+            measured.update(bench(n))
+            app.processEvents()
+        for name, value in measured.items():
+            results.append({"name": name, "n": n, "value": value})
+            print(f"{name:>26} {n:>8}: {_format(name, value)}")
+
+    return {
+        "meta": {
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "qt": qVersion(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict) -> None:
+    """
+    Gibt das Verhältnis ``current / baseline`` je Messung aus. Werte über 1 sind langsamer bzw. größer.
+    :param current:
+    :param baseline:
+    :return:
+    """
+    before: Dict = {(r["name"], r["n"]): r["value"] for r in baseline["results"]}
+    print(f"\nverglichen mit {baseline['meta'].get('commit')}:")
+    for r in current["results"]:
+        old: Optional[float] = before.get((r["name"], r["n"]))
+        if old:
+            print(f"{r['name']:>26} {r['n']:>8}: {r['value'] / old:6.2f}x")
+
+
+def _format(name: str, value: float) -> str:
+    if name.endswith("_bytes"):
+        return f"{value / 1024:10.1f} KiB"
+    if name.endswith("_tweens"):
+        return f"{value:10.0f}"
+    return f"{value * 1e6:10.1f} µs"
+
+
+def main():
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--counts", type=int, nargs="+", default=COUNTS)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--compare", help="JSON einer früheren Messung")
+    args: argparse.Namespace = parser.parse_args()
+
+    current: Dict = run(args.counts)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(current, file, indent=2)
+    print(f"\ngeschrieben: {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            compare(current, json.load(file))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def app() -> QApplication:
+    """
+    ``QApplication`` auf der ``offscreen`` Plattform, damit die Tests ohne Display laufen.
+    :return: QApplication
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QApplication.instance() or QApplication(sys.argv)
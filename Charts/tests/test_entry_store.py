@@ -0,0 +1,19 @@
+import math
+import random
+
+from DonutCharts._EntryStore import _EntryStore
+
+
+def test_total_does_not_drift():
+    store: _EntryStore = _EntryStore()
+    for row in range(50):
+        store.insert(row, f"entry {row}", 1.0)
+    generator: random.Random = random.Random(7)
+    for _ in range(20000):
+        store.set(f"entry {generator.randrange(50)}", generator.uniform(0, 1000) / 7)
+    assert store.total == math.fsum(store.values)
+
+    for row in range(50):
+        store.set(f"entry {row}", 0.0)
+    assert store.total == 0.0
+    assert not any(store.percents())
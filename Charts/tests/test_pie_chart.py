@@ -0,0 +1,38 @@
+from PySide6.QtCore import QEvent, QPointF
+from PySide6.QtGui import QImage, QMouseEvent, Qt
+
+
+def _click(widget, pos: QPointF) -> None:
+    event: QMouseEvent = QMouseEvent(QEvent.Type.MouseButtonPress, pos, pos, Qt.MouseButton.LeftButton,
+                                     Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
+    widget.mousePressEvent(event)
+
+
+def _render(widget) -> QImage:
+    image: QImage = QImage(widget.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    widget.render(image)
+    return image
+
+
+def test_slice_info_survives_zero_total(app):
+    from DonutCharts import PieChart
+
+    chart: PieChart = PieChart()
+    chart.resize(600, 600)
+    chart.set_entries({"a": 1, "b": 2, "c": 3})
+    center: QPointF = QPointF(chart.pie_rect.center())
+    radius: float = chart.pie_size * 0.45
+    pos: QPointF = next(center + QPointF(radius * dx, radius * dy)
+                        for dx, dy in ((1, 0), (0, 1), (-1, 0), (0, -1))
+                        if chart.slice_at(center + QPointF(radius * dx, radius * dy)) is not None)
+    clicked: str = chart.slice_at(pos).text
+    _click(chart, pos)
+
+    chart.apply_delta({"a": 0, "b": 0, "c": 0})
+
+    assert dict(chart.percentages) == {}
+    _render(chart)
+    chart.update_entry(clicked, 4)
+    assert chart.percentages[clicked] == 100.0
+    _render(chart)
@@ -0,0 +1,16 @@
+import random
+
+
+def test_live_series_maximum_matches_windows(app):
+    from BarCharts import CubeItem
+    from utils.series import LiveSeries
+
+    items = {key: CubeItem() for key in range(12)}
+    series: LiveSeries = LiveSeries(items, 8, duration=0)
+    generator: random.Random = random.Random(11)
+    for step in range(3000):
+        # In der zweiten Hälfte fallen die Werte, die Maxima der Reihen verlassen ihre Fenster
+        scale: float = 1.0 if step < 1500 else 0.1
+        series.push({key: generator.uniform(-5, 100) * scale for key in generator.sample(range(12), 3)})
+        windows = [series.series(key) for key in items]
+        assert series.maximum == max((window.maximum for window in windows if len(window)), default=0.0)
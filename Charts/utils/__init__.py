@@ -1 +1,2 @@
-from .helpers import *
\ No newline at end of file
+from .helpers import *
+from .shadow import ShadowMode
\ No newline at end of file
@@ -1 +1,4 @@
-from .behavior import Behavior
\ No newline at end of file
+from .behavior import Behavior
+from .engine import AnimationEngine
+from .registry import AnimationRegistry
+from .tween import Tween
@@ -1,55 +1,49 @@
+import logging
 from typing import Any
 
-from PySide6.QtCore import QPropertyAnimation, QAbstractAnimation, QEasingCurve
+from PySide6.QtCore import QAbstractAnimation, QEasingCurve
 from PySide6.QtWidgets import QWidget
 
+from .engine import AnimationEngine
+from .registry import AnimationRegistry
+from .tween import Tween
 
-
-
+logger: logging.Logger = logging.getLogger(__name__)
 
 
 class Behavior:
-    def __init__(self, target: QWidget, property_name: str, *, end_value: Any):
-
-        if not hasattr(target, "_animations"):
-            target._animations = {}
-
-        if property_name not in target._animations:
-            anim = QPropertyAnimation(target, property_name.encode("utf-8"))
-            anim.setDuration(300)
-            anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
-            target._animations[property_name] = anim
+    """
+    Animiert ``property_name`` von ``target`` vom aktuellen Wert zu ``end_value``.\n
+    Der ``Tween`` kommt aus der ``AnimationRegistry`` und wird für dasselbe Widget und dieselbe Property
+    wiederverwendet. Der aktuelle Wert wird nur gelesen, wenn sich ``end_value`` ändert.
+    """
+    __slots__ = ("_tween",)
 
-        self._anim = target._animations[property_name]
-        print(target.property(property_name))
-        #self._anim.valueChanged.connect(lambda v: print(v))
+    _tween: Tween
 
-        current_value: Any = getattr(target, property_name)
+    def __init__(self, target: QWidget, property_name: str, *, end_value: Any):
+        self._tween = AnimationRegistry.shared().tween(target, property_name)
 
-        if self._anim.endValue() != end_value:
-            if self._anim.state() == QAbstractAnimation.State.Running:
-                self._anim.stop()
-            self._anim.setStartValue(current_value)
-            self._anim.setEndValue(end_value)
+        if self._tween.end_value != end_value:
+            if self._tween.running:
+                AnimationEngine.shared().stop(self._tween)
+            current_value: Any = getattr(target, property_name)
+            logger.debug("%s.%s: %s -> %s", type(target).__name__, property_name, current_value, end_value)
+            self._tween.set_range(current_value, end_value)
 
     def easing(self, easing: QEasingCurve.Type=QEasingCurve.Type.InOutQuad, /):
-        self._anim.setEasingCurve(easing)
+        self._tween.easing = easing
         return self
 
     def duration(self, value=300, /):
-        self._anim.setDuration(value)
+        self._tween.duration = value
         return self
 
     def start(self):
-        self._anim.start()
+        AnimationEngine.shared().start(self._tween)
 
     def forward(self):
-        self._anim.setDirection(QAbstractAnimation.Direction.Forward)
-        self._anim.start()
+        AnimationEngine.shared().start(self._tween, QAbstractAnimation.Direction.Forward)
 
     def backward(self):
-        self._anim.setDirection(QAbstractAnimation.Direction.Backward)
-        self._anim.start()
-
-
-
+        AnimationEngine.shared().start(self._tween, QAbstractAnimation.Direction.Backward)
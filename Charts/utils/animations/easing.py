@@ -0,0 +1,73 @@
+from typing import Callable, Dict, List, Sequence
+
+from PySide6.QtCore import QEasingCurve
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Ab dieser Anzahl lohnt sich die Auswertung mit numpy
+VECTOR_THRESHOLD: int = 32
+
+_BACK: float = 1.70158
+
+_curves: Dict[QEasingCurve.Type, QEasingCurve] = dict()
+
+
+def _in_out_quad(t: "numpy.ndarray") -> "numpy.ndarray":
+    return numpy.where(t < 0.5, 2 * t * t, 1 - (2 - 2 * t) ** 2 / 2)
+
+
+def _in_out_cubic(t: "numpy.ndarray") -> "numpy.ndarray":
+    return numpy.where(t < 0.5, 4 * t ** 3, 1 + (2 * t - 2) ** 3 / 2)
+
+
+def _in_back(t: "numpy.ndarray") -> "numpy.ndarray":
+    return t * t * ((_BACK + 1) * t - _BACK)
+
+
+def _out_back(t: "numpy.ndarray") -> "numpy.ndarray":
+    t = t - 1
+    return t * t * ((_BACK + 1) * t + _BACK) + 1
+
+
+def _in_out_back(t: "numpy.ndarray") -> "numpy.ndarray":
+    s: float = _BACK * 1.525
+    t = t * 2
+    u: "numpy.ndarray" = t - 2
+    return numpy.where(t < 1, t * t * ((s + 1) * t - s) / 2, (u * u * ((s + 1) * u + s) + 2) / 2)
+
+
+_VECTORISED: Dict[QEasingCurve.Type, Callable[["numpy.ndarray"], "numpy.ndarray"]] = {
+    QEasingCurve.Type.Linear: lambda t: t,
+    QEasingCurve.Type.InQuad: lambda t: t * t,
+    QEasingCurve.Type.OutQuad: lambda t: t * (2 - t),
+    QEasingCurve.Type.InOutQuad: _in_out_quad,
+    QEasingCurve.Type.InCubic: lambda t: t ** 3,
+    QEasingCurve.Type.OutCubic: lambda t: (t - 1) ** 3 + 1,
+    QEasingCurve.Type.InOutCubic: _in_out_cubic,
+    QEasingCurve.Type.InBack: _in_back,
+    QEasingCurve.Type.OutBack: _out_back,
+    QEasingCurve.Type.InOutBack: _in_out_back,
+}
+
+
+def ease(easing: QEasingCurve.Type, progress: Sequence[float]) -> List[float]:
+    """
+    Wertet die Easing-Kurve ``easing`` für alle Fortschritte in ``progress`` (0 bis 1) aus.\n
+    Ist numpy installiert, werden ab ``VECTOR_THRESHOLD`` Werten die gängigen Kurven in einem Schritt berechnet.
+    Sonst, und für alle übrigen Kurven, wird ``QEasingCurve.valueForProgress`` verwendet.
+    :param easing:
+    :param progress:
+    :return: List[float]
+    """
+    if numpy is not None and len(progress) >= VECTOR_THRESHOLD:
+        function: Callable = _VECTORISED.get(easing)
+        if function is not None:
+            return function(numpy.asarray(progress, dtype=float)).tolist()
+
+    curve: QEasingCurve = _curves.get(easing)
+    if curve is None:
+        curve = _curves[easing] = QEasingCurve(easing)
+    return [curve.valueForProgress(t) for t in progress]
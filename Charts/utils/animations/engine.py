@@ -0,0 +1,125 @@
+import time
+from typing import Any, Dict, List, Optional
+
+import shiboken6
+from PySide6.QtCore import QAbstractAnimation, QEasingCurve, QObject, QTimer, Qt, Signal
+
+from .easing import ease
+from .tween import Tween
+
+
+class AnimationEngine(QObject):
+    """
+    Zentrale Animations-Engine mit einem einzigen Frame-Timer.\n
+    Pro Frame werden alle aktiven ``Tweens`` gemeinsam weitergeschaltet. Die Easing-Kurven werden pro
+    Kurventyp in einem Schritt ausgewertet (``utils.animations.easing.ease``), danach werden die Properties gesetzt.
+    Da alle Setter innerhalb desselben Frames ``update()`` aufrufen, fasst Qt sie zu einem Repaint pro Widget
+    zusammen.\n
+    Der Timer läuft nur, solange mindestens ein ``Tween`` aktiv ist.
+    """
+    __FRAME_INTERVAL: int = 16
+
+    _shared: Optional["AnimationEngine"] = None
+
+    activeCountChanged: Signal = Signal(int)
+
+    __active: Dict[int, Tween]
+    __frames: int
+    __last_frame: float
+    __timer: QTimer
+
+    def __init__(self, parent: QObject=None):
+        super().__init__(parent)
+        self.__active = dict()
+        self.__frames = 0
+        self.__last_frame = 0.0
+
+        self.__timer = QTimer(self)
+        self.__timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.__timer.setInterval(AnimationEngine.__FRAME_INTERVAL)
+        self.__timer.timeout.connect(self.__on_frame)
+
+    @classmethod
+    def shared(cls) -> "AnimationEngine":
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @property
+    def active_count(self) -> int:
+        """
+        Anzahl der gerade laufenden ``Tweens``.
+        :return: int
+        """
+        return len(self.__active)
+
+    @property
+    def frames(self) -> int:
+        """
+        Anzahl der bisher berechneten Frames.
+        :return: int
+        """
+        return self.__frames
+
+    def start(self, tween: Tween, direction: Optional[QAbstractAnimation.Direction]=None) -> None:
+        """
+        Startet ``tween``. Wie bei ``QAbstractAnimation`` beginnt ein gestoppter ``Tween`` am Anfang bzw. bei
+        ``Backward`` am Ende. Läuft er bereits, wird nur die Richtung übernommen.
+        :param tween:
+        :param direction:
+        :return:
+        """
+        if direction is not None:
+            tween.direction = direction
+        if tween.running:
+            return
+        if tween.start_value is None:
+            raise ValueError(f"Für '{tween.property_name}' wurde kein Start- und Endwert gesetzt.")
+
+        tween.running = True
+        tween.progress = 0.0 if tween.direction == QAbstractAnimation.Direction.Forward else 1.0
+        self.__active[id(tween)] = tween
+        if not self.__timer.isActive():
+            self.__last_frame = time.perf_counter()
+            self.__timer.start()
+        self.activeCountChanged.emit(len(self.__active))
+
+    def stop(self, tween: Tween) -> None:
+        tween.running = False
+        if self.__active.pop(id(tween), None) is not None:
+            self.activeCountChanged.emit(len(self.__active))
+            if not self.__active:
+                self.__timer.stop()
+
+    def __on_frame(self) -> None:
+        now: float = time.perf_counter()
+        elapsed: float = (now - self.__last_frame) * 1000
+        self.__last_frame = now
+        self.__frames += 1
+
+        groups: Dict[QEasingCurve.Type, List[Tween]] = dict()
+        finished: List[Tween] = list()
+        for tween in self.__active.values():
+            target: Optional[QObject] = tween.target
+            if target is None or not shiboken6.isValid(target):
+                finished.append(tween)
+                continue
+            if tween.advance(elapsed):
+                finished.append(tween)
+            groups.setdefault(tween.easing, []).append(tween)
+
+        for easing, tweens in groups.items():
+            values: List[float] = ease(easing, [tween.progress for tween in tweens])
+            for tween, eased in zip(tweens, values):
+                value: Any = tween.value_at(eased)
+                setattr(tween.target, tween.property_name, value)
+
+        removed: bool = False
+        for tween in finished:
+            tween.running = False
+            # Ein Property-Setter kann den Tween in diesem Frame bereits gestoppt haben
+            removed = self.__active.pop(id(tween), None) is not None or removed
+        if removed:
+            self.activeCountChanged.emit(len(self.__active))
+            if not self.__active:
+                self.__timer.stop()
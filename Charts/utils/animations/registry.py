@@ -0,0 +1,101 @@
+import weakref
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtCore import QEasingCurve, QObject
+
+from .engine import AnimationEngine
+from .tween import Tween
+
+
+class AnimationRegistry:
+    """
+    Verwaltet die ``Tweens`` der ``Behaviors`` pro (Widget, Property).\n
+    Das Widget wird nur schwach referenziert. Wird es gelöscht (``destroyed``) oder vom Garbage Collector
+    eingesammelt, werden seine ``Tweens`` gestoppt und entfernt. Jeder weitere Zugriff auf dieselbe Property
+    verwendet den vorhandenen ``Tween`` wieder.
+    """
+    _shared: Optional["AnimationRegistry"] = None
+
+    __allocations: int
+    __evictions: int
+    __reuses: int
+    __targets: Dict[int, Tuple["weakref.ReferenceType[QObject]", Dict[str, Tween]]]
+
+    def __init__(self):
+        self.__allocations = 0
+        self.__evictions = 0
+        self.__reuses = 0
+        self.__targets = dict()
+
+    @classmethod
+    def shared(cls) -> "AnimationRegistry":
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def __len__(self) -> int:
+        return sum(len(tweens) for _, tweens in self.__targets.values())
+
+    @property
+    def allocations(self) -> int:
+        return self.__allocations
+
+    @property
+    def evictions(self) -> int:
+        return self.__evictions
+
+    @property
+    def reuses(self) -> int:
+        return self.__reuses
+
+    def evict(self, target: QObject) -> None:
+        """
+        Stoppt und entfernt alle ``Tweens`` von ``target``.
+        :param target:
+        :return:
+        """
+        self.__evict(id(target))
+
+    def tween(self, target: QObject, property_name: str) -> Tween:
+        """
+        Gibt den ``Tween`` für ``property_name`` von ``target`` wieder und legt ihn bei Bedarf an.
+        :param target:
+        :param property_name:
+        :return: Tween
+        """
+        key: int = id(target)
+        entry: Optional[Tuple["weakref.ReferenceType[QObject]", Dict[str, Tween]]] = self.__targets.get(key)
+        if entry is None or entry[0]() is not target:
+            if entry is not None:
+                self.__evict(key)
+            reference: "weakref.ReferenceType[QObject]" = weakref.ref(target, lambda r: self.__evict(key, r))
+            entry = (reference, dict())
+            self.__targets[key] = entry
+            target.destroyed.connect(lambda *_: self.__evict(key, reference))
+
+        tweens: Dict[str, Tween] = entry[1]
+        tween: Optional[Tween] = tweens.get(property_name)
+        if tween is None:
+            tween = tweens[property_name] = Tween(
+                target, property_name, duration=300, easing=QEasingCurve.Type.InOutQuad)
+            self.__allocations += 1
+        else:
+            self.__reuses += 1
+        return tween
+
+    def __evict(self, key: int, reference: Optional["weakref.ReferenceType[QObject]"]=None) -> None:
+        """
+        Entfernt den Eintrag ``key``. Mit ``reference`` nur, wenn der Eintrag noch zu diesem Widget gehört,
+        da ``id()`` nach dem Löschen eines Widgets neu vergeben werden kann.
+        :param key:
+        :param reference:
+        :return:
+        """
+        entry: Optional[Tuple["weakref.ReferenceType[QObject]", Dict[str, Tween]]] = self.__targets.get(key)
+        if entry is None or (reference is not None and entry[0] is not reference):
+            return
+        del self.__targets[key]
+        engine: AnimationEngine = AnimationEngine.shared()
+        for tween in entry[1].values():
+            engine.stop(tween)
+            self.__evictions += 1
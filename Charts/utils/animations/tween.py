@@ -0,0 +1,108 @@
+import weakref
+from typing import Any, Callable, Optional, Tuple
+
+from PySide6.QtCore import QAbstractAnimation, QEasingCurve, QObject, QPoint, QPointF
+from PySide6.QtGui import QColor
+
+
+class Tween:
+    """
+    Animiert die Property ``property_name`` von ``target`` zwischen ``start_value`` und ``end_value``.\n
+    Ein ``Tween`` tickt nicht selbst, sondern wird von der ``AnimationEngine`` gestartet und pro Frame
+    zusammen mit allen anderen aktiven ``Tweens`` weitergeschaltet.
+    Unterstützt werden ``float``, ``int``, ``QPoint``, ``QPointF`` und ``QColor``.\n
+    ``target`` wird nur schwach referenziert, ein ``Tween`` hält sein Widget also nicht am Leben.
+    """
+    __slots__ = ("_target", "property_name", "duration", "easing", "direction", "progress", "running",
+                 "start_value", "end_value", "_build", "_delta", "_origin")
+
+    _target: "weakref.ReferenceType[QObject]"
+    property_name: str
+    duration: int
+    easing: QEasingCurve.Type
+    direction: QAbstractAnimation.Direction
+    progress: float
+    running: bool
+    start_value: Any
+    end_value: Any
+    _build: Optional[Callable[..., Any]]
+    _delta: Tuple[float, ...]
+    _origin: Tuple[float, ...]
+
+    def __init__(self, target: QObject, property_name: str, *, duration: int=300,
+                 easing: QEasingCurve.Type=QEasingCurve.Type.Linear):
+        self._target = weakref.ref(target)
+        self.property_name = property_name
+        self.duration = duration
+        self.easing = easing
+        self.direction = QAbstractAnimation.Direction.Forward
+        self.progress = 0.0
+        self.running = False
+        self.start_value = None
+        self.end_value = None
+        self._build = None
+        self._delta = ()
+        self._origin = ()
+
+    @property
+    def target(self) -> Optional[QObject]:
+        return self._target()
+
+    @target.setter
+    def target(self, target: QObject) -> None:
+        # Erlaubt das Wiederverwenden eines gestoppten ``Tweens`` für ein anderes Objekt
+        self._target = weakref.ref(target)
+
+    def set_range(self, start_value: Any, end_value: Any) -> None:
+        """
+        Setzt Start- und Endwert. Beide Werte müssen vom selben Typ sein.
+        :param start_value:
+        :param end_value:
+        :return:
+        """
+        self.start_value = start_value
+        self.end_value = end_value
+        self._build, self._origin = Tween.__components(start_value)
+        _, end = Tween.__components(end_value)
+        self._delta = tuple(e - s for s, e in zip(self._origin, end))
+
+    def advance(self, elapsed: float) -> bool:
+        """
+        Schaltet den Fortschritt um ``elapsed`` Millisekunden in Richtung ``direction`` weiter.
+        :param elapsed:
+        :return: bool ``True``, wenn der ``Tween`` sein Ende erreicht hat.
+        """
+        step: float = elapsed / self.duration if self.duration > 0 else 1.0
+        if self.direction == QAbstractAnimation.Direction.Forward:
+            self.progress = min(1.0, self.progress + step)
+            return self.progress >= 1.0
+        self.progress = max(0.0, self.progress - step)
+        return self.progress <= 0.0
+
+    def value_at(self, eased: float) -> Any:
+        """
+        Gibt den Wert für den bereits per Easing-Kurve umgerechneten Fortschritt ``eased`` wieder.
+        An den Enden werden ``start_value`` und ``end_value`` unverändert zurückgegeben.
+        :param eased:
+        :return: Any
+        """
+        if eased == 0.0:
+            return self.start_value
+        if eased == 1.0:
+            return self.end_value
+        return self._build(*(s + d * eased for s, d in zip(self._origin, self._delta)))
+
+    @staticmethod
+    def __components(value: Any) -> Tuple[Callable[..., Any], Tuple[float, ...]]:
+        if isinstance(value, QColor):
+            return (lambda r, g, b, a: QColor(round(r), round(g), round(b), round(a)),
+                    (value.red(), value.green(), value.blue(), value.alpha()))
+        if isinstance(value, QPoint):
+            return lambda x, y: QPoint(round(x), round(y)), (value.x(), value.y())
+        if isinstance(value, QPointF):
+            return QPointF, (value.x(), value.y())
+        if isinstance(value, int):
+            return round, (value,)
+        if isinstance(value, float):
+            return float, (value,)
+        raise TypeError(f"Der Typ '{type(value).__name__}' kann nicht animiert werden.")
@@ -0,0 +1,4 @@
+from .brush_cache import BrushCache
+from .layer_cache import LayerCache
+from .shadow_cache import ShadowCache
+from .text_cache import TextCache
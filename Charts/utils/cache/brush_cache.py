@@ -0,0 +1,144 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, TypeVar, Union
+
+from PySide6.QtCore import QPointF, QRect
+from PySide6.QtGui import QBrush, QColor, QGradient, QLinearGradient, QPen
+
+T = TypeVar("T", QBrush, QPen)
+
+
+class BrushCache:
+    """
+    Gemeinsamer LRU-Cache für fertige ``QBrush``- und ``QPen``-Objekte.\n
+    Verläufe werden pro (Grundfarbe, Helligkeit, Rechteck) bzw. im ``ObjectBoundingMode`` nur pro
+    (Grundfarbe, Helligkeit) erzeugt, die abgeleiteten Farben (``lighter``/``darker``) nur beim ersten Zugriff.\n
+    Mit ``quantise=True`` wird die Grundfarbe auf eine Palette mit Schrittweite ``QUANTUM`` gerundet. So teilen
+    sich die Zwischenframes einer Farbanimation wenige Einträge, statt pro Frame neue Objekte anzulegen.
+    """
+    QUANTUM: int = 8
+
+    _local: threading.local = threading.local()
+
+    __capacity: int
+    __entries: "OrderedDict[Hashable, Union[QBrush, QPen]]"
+    __hits: int
+    __misses: int
+
+    def __init__(self, capacity: int=512):
+        self.__capacity = capacity
+        self.__entries = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    @classmethod
+    def shared(cls) -> "BrushCache":
+        """
+        Gibt die Instanz des aktuellen Threads wieder. Jeder Thread hat seine eigene, damit Ebenen auch in
+        einem Worker-Thread gezeichnet werden können (siehe ``LayerCache.set_thread_pool``).
+        :return: BrushCache
+        """
+        shared: Optional["BrushCache"] = getattr(cls._local, "shared", None)
+        if shared is None:
+            shared = cls._local.shared = cls()
+        return shared
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def clear(self) -> None:
+        self.__entries.clear()
+
+    def bounding_gradient(self, base_color: QColor, lighter: int=100, quantise: bool=False) -> QBrush:
+        """
+        Vertikaler Verlauf für ``base_color.lighter(lighter)`` im ``ObjectBoundingMode``. Er passt sich dem Rect
+        der gezeichneten Form an, ein Brush wird so für beliebig viele Formen gleicher Farbe verwendet.
+        :param base_color:
+        :param lighter: Faktor wie bei ``QColor.lighter``, unter 100 wird die Farbe dunkler
+        :param quantise:
+        :return: QBrush
+        """
+        color: QColor = self.__color(base_color, quantise)
+        return self.__get(("bounding", color.rgba(), lighter), lambda: self.__gradient(
+            BrushCache.__shade(color, lighter),
+            QPointF(0.5, 1),
+            QPointF(0.5, 0),
+            QGradient.CoordinateMode.ObjectBoundingMode
+        ))
+
+    def linear_gradient(self, base_color: QColor, rect: QRect, lighter: int=100, quantise: bool=False) -> QBrush:
+        """
+        Verlauf wie ``utils.linear_gradient`` für ``base_color.lighter(lighter)`` über ``rect``.
+        :param base_color:
+        :param rect:
+        :param lighter: Faktor wie bei ``QColor.lighter``, unter 100 wird die Farbe dunkler
+        :param quantise:
+        :return: QBrush
+        """
+        color: QColor = self.__color(base_color, quantise)
+        key: Hashable = ("linear", color.rgba(), lighter, rect.x(), rect.y(), rect.width(), rect.height())
+        return self.__get(key, lambda: self.__gradient(
+            BrushCache.__shade(color, lighter),
+            QPointF(rect.center().x(), rect.bottom()),
+            QPointF(rect.center().x(), rect.top()),
+            QGradient.CoordinateMode.LogicalMode
+        ))
+
+    def outline_pen(self, base_color: QColor, width: int, quantise: bool=False) -> QPen:
+        """
+        Heller, halbtransparenter Rahmen der Cubes: ``fromHsv(h, s, v, 40).lighter(200)``.
+        :param base_color:
+        :param width:
+        :param quantise:
+        :return: QPen
+        """
+        color: QColor = self.__color(base_color, quantise)
+        return self.__get(("outline", color.rgba(), width), lambda: QPen(
+            QColor.fromHsv(color.hue(), color.saturation(), color.value(), 40).lighter(200), width))
+
+    @staticmethod
+    def quantised(color: QColor) -> QColor:
+        """
+        Rundet jeden Kanal von ``color`` auf ein Vielfaches von ``QUANTUM``.
+        :param color:
+        :return: QColor
+        """
+        q: int = BrushCache.QUANTUM
+        return QColor(*(min(255, (channel + q // 2) // q * q) for channel in color.getRgb()))
+
+    def __color(self, color: QColor, quantise: bool) -> QColor:
+        return BrushCache.quantised(color) if quantise else color
+
+    def __get(self, key: Hashable, create: Callable[[], T]) -> T:
+        entry: Optional[T] = self.__entries.get(key)
+        if entry is not None:
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return entry
+
+        self.__misses += 1
+        entry = self.__entries[key] = create()
+        if len(self.__entries) > self.__capacity:
+            self.__entries.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def __shade(color: QColor, lighter: int) -> QColor:
+        # ``lighter(100)`` rechnet über HSV und liefert nicht exakt dieselbe Farbe
+        return color if lighter == 100 else color.lighter(lighter)
+
+    @staticmethod
+    def __gradient(color: QColor, start: QPointF, stop: QPointF, mode: QGradient.CoordinateMode) -> QBrush:
+        gradient: QLinearGradient = QLinearGradient(start, stop)
+        gradient.setCoordinateMode(mode)
+        gradient.setColorAt(0, color.lighter(200))
+        gradient.setColorAt(1, color.darker(200))
+        return QBrush(gradient)
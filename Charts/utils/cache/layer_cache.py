@@ -0,0 +1,259 @@
+import logging
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import shiboken6
+from PySide6.QtCore import QObject, QRunnable, QSize, QRect, QRectF, QThreadPool, Signal
+from PySide6.QtGui import QImage, QPainter, QPixmap, Qt
+from PySide6.QtWidgets import QWidget
+
+Render = Callable[[QPainter], Optional[QRect]]
+Prepare = Callable[[], Tuple[Render, Optional[Callable[[], None]]]]
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class _Layer:
+    __slots__ = ("bounds", "image", "size", "device_pixel_ratio", "version")
+
+    def __init__(self, image: Union[QPixmap, QImage], size: QSize, device_pixel_ratio: float, bounds: QRect,
+                 version: int):
+        self.bounds = bounds
+        self.image = image
+        self.size = size
+        self.device_pixel_ratio = device_pixel_ratio
+        self.version = version
+
+
+class _LayerRelay(QObject):
+    """
+    Lebt im GUI-Thread. Signale aus dem Worker-Thread werden dadurch per ``QueuedConnection`` zugestellt.
+    """
+    failed: Signal = Signal(object)
+    rendered: Signal = Signal(object)
+
+
+class _LayerJob(QRunnable):
+    """
+    Zeichnet eine Ebene in einem Worker-Thread in ein ``QImage`` und meldet sie über ``_LayerRelay.rendered``.
+    Wirft die Render-Funktion eine Exception, wird sie geloggt und der Auftrag über ``_LayerRelay.failed`` gemeldet.
+    """
+    bounds: Optional[QRect]
+    cancelled: bool
+    device_pixel_ratio: float
+    finish: Optional[Callable[[], None]]
+    image: Optional[QImage]
+    name: str
+    size: QSize
+    version: int
+
+    def __init__(self, relay: _LayerRelay, name: str, version: int, size: QSize, device_pixel_ratio: float,
+                 render: Render, finish: Optional[Callable[[], None]]):
+        super().__init__()
+        self.bounds = None
+        self.cancelled = False
+        self.device_pixel_ratio = device_pixel_ratio
+        self.finish = finish
+        self.image = None
+        self.name = name
+        self.size = QSize(size)
+        self.version = version
+        self.__relay = relay
+        self.__render = render
+
+    def run(self) -> None:
+        if self.cancelled:
+            return
+        image: QImage = QImage(self.size * self.device_pixel_ratio, QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(self.device_pixel_ratio)
+        image.fill(Qt.GlobalColor.transparent)
+
+        painter: QPainter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        try:
+            self.bounds = self.__render(painter)
+        except Exception:
+            painter.end()
+            if not shiboken6.isValid(self.__relay):
+                # Das Widget wurde inzwischen gelöscht
+                return
+            logger.exception("Die Ebene '%s' konnte nicht im Hintergrund gezeichnet werden.", self.name)
+            self.__relay.failed.emit(self)
+            return
+
+        painter.end()
+        self.image = image
+        if shiboken6.isValid(self.__relay):
+            self.__relay.rendered.emit(self)
+
+
+class LayerCache:
+    """
+    Cache für statische Ebenen eines Widgets (z.B. Title, Legende).\n
+    Jede Ebene wird einmalig in eine ``QPixmap`` in Widget-Größe gezeichnet (HiDPI-fähig) und
+    so lange wiederverwendet, bis sie per ``invalidate`` verworfen wird oder sich Größe bzw.
+    ``devicePixelRatio`` des Widgets ändern.\n
+    Die Render-Funktion darf den belegten Bereich der Ebene als ``QRect`` zurückgeben. Ebenen, deren
+    Bereich außerhalb des neu zu zeichnenden Bereichs liegt, werden beim Zeichnen übersprungen.\n
+    Mit ``set_thread_pool`` werden per ``invalidate(deferred=True)`` verworfene Ebenen im Hintergrund in ein
+    ``QImage`` gezeichnet. Bis das Ergebnis zurückkommt, bleibt die bisherige Ebene sichtbar.
+    Jede Ebene hat eine Version, die mit jedem ``invalidate`` steigt. Veraltete Aufträge werden abgebrochen,
+    sofern sie noch nicht laufen, und ihre Ergebnisse verworfen. Schlägt ein Auftrag fehl, wird die Ebene beim
+    nächsten Zeichnen im GUI-Thread erzeugt.
+    """
+    __jobs: Dict[str, _LayerJob]
+    __layers: Dict[str, _Layer]
+    __pool: Optional[QThreadPool]
+    __relay: Optional[_LayerRelay]
+    __versions: Dict[str, int]
+    __widget: QWidget
+
+    def __init__(self, widget: QWidget):
+        self.__jobs = dict()
+        self.__layers = dict()
+        self.__pool = None
+        self.__relay = None
+        self.__versions = dict()
+        self.__widget = widget
+
+    def draw(self, painter: QPainter, name: str, render: Render, clip: Optional[QRect]=None,
+             prepare: Optional[Prepare]=None) -> None:
+        """
+        Zeichnet die Ebene ``name``. Ist sie nicht (mehr) gültig, wird sie vorher mit ``render`` erzeugt.\n
+        Mit ``clip`` wird nur der Teil der Ebene gezeichnet, der in diesem Bereich liegt.\n
+        ``prepare`` wird im GUI-Thread aufgerufen und gibt eine Render-Funktion wieder, die nur noch auf einer
+        Momentaufnahme arbeitet und damit in einem Worker-Thread laufen darf, sowie optional eine Funktion, die
+        im GUI-Thread aufgerufen wird, sobald die Ebene übernommen wurde.
+        :param painter:
+        :param name:
+        :param render:
+        :param clip:
+        :param prepare: Ohne Angabe wird die Ebene immer im GUI-Thread gezeichnet
+        :return:
+        """
+        layer: _Layer = self.__layer(name, render, prepare)
+        target: QRect = layer.bounds if clip is None else layer.bounds.intersected(clip)
+        if target.isEmpty():
+            return
+
+        dpr: float = layer.device_pixel_ratio
+        source: QRectF = QRectF(target.x() * dpr, target.y() * dpr, target.width() * dpr, target.height() * dpr)
+        if isinstance(layer.image, QImage):
+            painter.drawImage(QRectF(target), layer.image, source)
+        else:
+            painter.drawPixmap(QRectF(target), layer.image, source)
+
+    def invalidate(self, *names: str, deferred: bool=False) -> None:
+        """
+        Verwirft die angegebenen Ebenen. Ohne Angabe werden alle Ebenen verworfen.
+        :param names:
+        :param deferred: Mit ``set_thread_pool`` bleiben die Ebenen sichtbar, bis sie im Hintergrund neu
+            gezeichnet sind
+        :return:
+        """
+        for name in names or set(self.__layers).union(self.__jobs):
+            self.__versions[name] = self.__versions.get(name, 0) + 1
+            if not deferred or self.__pool is None:
+                self.__layers.pop(name, None)
+
+    def layer(self, name: str, render: Render) -> Union[QPixmap, QImage]:
+        return self.__layer(name, render, None).image
+
+    def set_thread_pool(self, pool: Optional[QThreadPool]) -> None:
+        """
+        Legt den ``QThreadPool`` für das Zeichnen im Hintergrund fest. ``None`` zeichnet wieder im GUI-Thread.
+        :param pool: z.B. ``QThreadPool.globalInstance()``
+        :return:
+        """
+        if pool is self.__pool:
+            return
+        for job in self.__jobs.values():
+            job.cancelled = True
+        self.__jobs.clear()
+        self.__pool = pool
+        if pool is not None and self.__relay is None:
+            self.__relay = _LayerRelay(self.__widget)
+            self.__relay.failed.connect(self.__fail)
+            self.__relay.rendered.connect(self.__adopt)
+
+    @property
+    def thread_pool(self) -> Optional[QThreadPool]:
+        return self.__pool
+
+    def __adopt(self, job: _LayerJob) -> None:
+        """
+        Übernimmt das Ergebnis eines Auftrags im GUI-Thread, sofern es noch aktuell ist.
+        :param job:
+        :return:
+        """
+        if self.__jobs.get(job.name) is not job:
+            return
+        del self.__jobs[job.name]
+        previous: Optional[_Layer] = self.__layers.get(job.name)
+        if job.version != self.__versions.get(job.name, 0) or (previous is not None and
+                                                               previous.version == job.version):
+            return
+        if job.size != self.__widget.size() or job.device_pixel_ratio != self.__widget.devicePixelRatioF():
+            return
+
+        full: QRect = QRect(0, 0, job.size.width(), job.size.height())
+        layer: _Layer = _Layer(job.image, job.size, job.device_pixel_ratio,
+                               full if job.bounds is None else job.bounds.intersected(full), job.version)
+        self.__layers[job.name] = layer
+        if job.finish is not None:
+            job.finish()
+        self.__widget.update(layer.bounds if previous is None else layer.bounds.united(previous.bounds))
+
+    def __fail(self, job: _LayerJob) -> None:
+        """
+        Verwirft die Ebene eines fehlgeschlagenen Auftrags, damit sie beim nächsten ``draw`` synchron gezeichnet
+        wird, statt dass die veraltete Ebene stehen bleibt.
+        :param job:
+        :return:
+        """
+        if self.__jobs.get(job.name) is not job:
+            return
+        del self.__jobs[job.name]
+        previous: Optional[_Layer] = self.__layers.get(job.name)
+        if previous is not None and previous.version != self.__versions.get(job.name, 0):
+            del self.__layers[job.name]
+            self.__widget.update()
+
+    def __layer(self, name: str, render: Render, prepare: Optional[Prepare]) -> _Layer:
+        size: QSize = self.__widget.size()
+        dpr: float = self.__widget.devicePixelRatioF()
+        version: int = self.__versions.get(name, 0)
+
+        layer: Optional[_Layer] = self.__layers.get(name)
+        if layer is not None and layer.size == size and layer.device_pixel_ratio == dpr:
+            if layer.version == version:
+                return layer
+            if prepare is not None and self.__pool is not None:
+                self.__submit(name, version, size, dpr, prepare)
+                return layer
+
+        pixmap: QPixmap = QPixmap(size * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter: QPainter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        bounds: Optional[QRect] = render(painter)
+        painter.end()
+
+        full: QRect = QRect(0, 0, size.width(), size.height())
+        layer = _Layer(pixmap, QSize(size), dpr, full if bounds is None else bounds.intersected(full), version)
+        self.__layers[name] = layer
+        return layer
+
+    def __submit(self, name: str, version: int, size: QSize, dpr: float, prepare: Prepare) -> None:
+        job: Optional[_LayerJob] = self.__jobs.get(name)
+        if job is not None:
+            if job.version == version and job.size == size and job.device_pixel_ratio == dpr:
+                return
+            # Ein veralteter Auftrag wird abgebrochen, läuft er bereits, wird sein Ergebnis verworfen
+            job.cancelled = True
+
+        render, finish = prepare()
+        job = _LayerJob(self.__relay, name, version, size, dpr, render, finish)
+        self.__jobs[name] = job
+        self.__pool.start(job)
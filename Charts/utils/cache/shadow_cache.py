@@ -0,0 +1,139 @@
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from PySide6.QtCore import QRect, QRectF, QSize
+from PySide6.QtGui import QColor, QImage, QPainter, QPainterPath, QPixmap, Qt
+from PySide6.QtWidgets import QGraphicsBlurEffect, QGraphicsPixmapItem, QGraphicsScene
+
+
+class ShadowCache:
+    """
+    Gemeinsamer LRU-Cache für vorgerenderte, weichgezeichnete Schatten.\n
+    Rechteckige Schatten werden als Nine-Patch abgelegt und sind damit unabhängig von der Größe des Widgets.
+    Schatten beliebiger Form werden pro (Form, Größe, Radius, Farbe) einmalig gerendert.
+    """
+    _shared: Optional["ShadowCache"] = None
+
+    __capacity: int
+    __pixmaps: "OrderedDict[Hashable, QPixmap]"
+
+    def __init__(self, capacity: int=128):
+        self.__capacity = capacity
+        self.__pixmaps = OrderedDict()
+
+    @classmethod
+    def shared(cls) -> "ShadowCache":
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def __len__(self) -> int:
+        return len(self.__pixmaps)
+
+    def clear(self) -> None:
+        self.__pixmaps.clear()
+
+    def draw_rect_shadow(self, painter: QPainter, rect: QRect, radius: int, color: QColor, dpr: float) -> None:
+        """
+        Zeichnet den Schatten für ``rect`` als Nine-Patch. Der Schatten ragt ``radius`` Pixel über ``rect`` hinaus.
+        :param painter:
+        :param rect:
+        :param radius:
+        :param color:
+        :param dpr:
+        :return:
+        """
+        corner: int = 2 * radius
+        target: QRect = rect.adjusted(-radius, -radius, radius, radius)
+        if target.width() < 2 * corner or target.height() < 2 * corner:
+            path: QPainterPath = QPainterPath()
+            path.addRect(QRectF(radius, radius, rect.width(), rect.height()))
+            painter.drawPixmap(target.topLeft(), self.shape_shadow("rect", path, target.size(), radius, color, dpr))
+            return
+
+        pixmap: QPixmap = self.rect_shadow(radius, color, dpr)
+        # (x, Breite) im Ziel und in der Quelle für die drei Spalten bzw. Zeilen des Nine-Patch
+        columns: Tuple[Tuple[int, int, int, int], ...] = (
+            (target.left(), corner, 0, corner),
+            (target.left() + corner, target.width() - 2 * corner, corner, 1),
+            (target.right() + 1 - corner, corner, corner + 1, corner),
+        )
+        rows: Tuple[Tuple[int, int, int, int], ...] = (
+            (target.top(), corner, 0, corner),
+            (target.top() + corner, target.height() - 2 * corner, corner, 1),
+            (target.bottom() + 1 - corner, corner, corner + 1, corner),
+        )
+        scale: float = pixmap.devicePixelRatio()
+        for x, width, source_x, source_width in columns:
+            for y, height, source_y, source_height in rows:
+                painter.drawPixmap(
+                    QRectF(x, y, width, height),
+                    pixmap,
+                    QRectF(source_x * scale, source_y * scale, source_width * scale, source_height * scale)
+                )
+
+    def rect_shadow(self, radius: int, color: QColor, dpr: float) -> QPixmap:
+        """
+        Gibt die Nine-Patch-Vorlage für rechteckige Schatten wieder.
+        Ecken sind ``2 * radius`` groß, die Mitte ist ein Pixel breit und wird gestreckt.
+        :param radius:
+        :param color:
+        :param dpr:
+        :return: QPixmap
+        """
+        corner: int = 2 * radius
+        path: QPainterPath = QPainterPath()
+        path.addRect(QRectF(radius, radius, 2 * radius + 1, 2 * radius + 1))
+        return self.shape_shadow("nine-patch", path, QSize(2 * corner + 1, 2 * corner + 1), radius, color, dpr)
+
+    def shape_shadow(self, shape: Hashable, path: QPainterPath, size: QSize, radius: int, color: QColor,
+                     dpr: float) -> QPixmap:
+        """
+        Gibt den weichgezeichneten Schatten von ``path`` in einer ``QPixmap`` der Größe ``size`` wieder.\n
+        ``shape`` identifiziert die Form. Für gleiche (``shape``, ``size``) muss ``path`` gleich sein.
+        :param shape:
+        :param path:
+        :param size:
+        :param radius:
+        :param color:
+        :param dpr:
+        :return: QPixmap
+        """
+        key: Hashable = (shape, size.width(), size.height(), radius, color.rgba(), dpr)
+        pixmap: Optional[QPixmap] = self.__pixmaps.get(key)
+        if pixmap is not None:
+            self.__pixmaps.move_to_end(key)
+            return pixmap
+
+        pixmap = QPixmap.fromImage(ShadowCache.__render(path, size, radius, color, dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        self.__pixmaps[key] = pixmap
+        if len(self.__pixmaps) > self.__capacity:
+            self.__pixmaps.popitem(last=False)
+        return pixmap
+
+    @staticmethod
+    def __render(path: QPainterPath, size: QSize, radius: int, color: QColor, dpr: float) -> QImage:
+        image: QImage = QImage(size * dpr, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter: QPainter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.scale(dpr, dpr)
+        painter.fillPath(path, color)
+        painter.end()
+
+        # Gleiche Weichzeichnung wie ``QGraphicsDropShadowEffect``, aber nur einmal pro Schlüssel
+        scene: QGraphicsScene = QGraphicsScene()
+        item: QGraphicsPixmapItem = QGraphicsPixmapItem(QPixmap.fromImage(image))
+        blur: QGraphicsBlurEffect = QGraphicsBlurEffect()
+        blur.setBlurRadius(radius * dpr)
+        blur.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
+        item.setGraphicsEffect(blur)
+        scene.addItem(item)
+
+        result: QImage = QImage(image.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        result.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(result)
+        scene.render(painter, QRectF(result.rect()), QRectF(image.rect()))
+        painter.end()
+        return result
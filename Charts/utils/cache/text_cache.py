@@ -0,0 +1,184 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from PySide6.QtCore import QPointF, QRect, QRectF, QSizeF
+from PySide6.QtGui import QFont, QFontMetrics, QFontMetricsF, QPainter, QStaticText, QTransform, Qt
+
+
+class _Text:
+    __slots__ = ("ascent", "height", "size", "static_text", "width")
+
+    def __init__(self, static_text: QStaticText, width: int, height: int, ascent: float):
+        self.ascent = ascent
+        self.height = height
+        self.size = static_text.size()
+        self.static_text = static_text
+        self.width = width
+
+
+class TextCache:
+    """
+    Gemeinsamer LRU-Cache für Texte.\n
+    Pro (Text, Schriftfamilie, Größe, Gewicht, ``devicePixelRatio``) wird einmalig ein vorbereiteter
+    ``QStaticText`` samt gemessener Breite und Höhe abgelegt. Beim Zeichnen entfällt damit das erneute
+    Shaping der Glyphen. ``QFont``- und ``QFontMetrics``-Objekte werden ebenfalls nur einmal erzeugt.\n
+    ``width`` und ``height`` entsprechen ``utils.font_metrics``, gezeichnet wird an denselben Positionen
+    wie mit ``QPainter.drawText``.
+    """
+    _local: threading.local = threading.local()
+
+    __capacity: int
+    __fonts: Dict[Tuple[str, int, int], QFont]
+    __hits: int
+    __metrics: Dict[Hashable, Tuple[QFontMetrics, QFontMetricsF]]
+    __misses: int
+    __texts: "OrderedDict[Hashable, _Text]"
+
+    def __init__(self, capacity: int=4096):
+        self.__capacity = capacity
+        self.__fonts = dict()
+        self.__hits = 0
+        self.__metrics = dict()
+        self.__misses = 0
+        self.__texts = OrderedDict()
+
+    @classmethod
+    def shared(cls) -> "TextCache":
+        """
+        Gibt die Instanz des aktuellen Threads wieder. Jeder Thread hat seine eigene, damit Ebenen auch in
+        einem Worker-Thread gezeichnet werden können (siehe ``LayerCache.set_thread_pool``).
+        :return: TextCache
+        """
+        shared: Optional["TextCache"] = getattr(cls._local, "shared", None)
+        if shared is None:
+            shared = cls._local.shared = cls()
+        return shared
+
+    def __len__(self) -> int:
+        return len(self.__texts)
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def clear(self) -> None:
+        self.__texts.clear()
+        self.__metrics.clear()
+        self.__fonts.clear()
+
+    def draw(self, painter: QPainter, font: QFont, rect: QRect, flags: Qt.AlignmentFlag, text: str) -> None:
+        """
+        Zeichnet ``text`` in ``rect`` wie ``QPainter.drawText(rect, flags, text)`` (einzeilig).
+        :param painter:
+        :param font:
+        :param rect:
+        :param flags: Kombination aus horizontaler und vertikaler ``Qt.AlignmentFlag``
+        :param text:
+        :return:
+        """
+        entry: _Text = self.text(painter, font, text)
+        size: QSizeF = entry.size
+        r: QRectF = QRectF(rect)
+        x: float = r.x()
+        y: float = r.y()
+        if flags & Qt.AlignmentFlag.AlignRight:
+            x = r.right() - size.width()
+        elif flags & Qt.AlignmentFlag.AlignHCenter:
+            x = r.x() + (r.width() - size.width()) / 2
+        if flags & Qt.AlignmentFlag.AlignBottom:
+            y = r.bottom() - size.height()
+        elif flags & Qt.AlignmentFlag.AlignVCenter:
+            y = r.y() + (r.height() - size.height()) / 2
+
+        painter.setFont(font)
+        painter.drawStaticText(QPointF(x, y), entry.static_text)
+
+    def draw_at(self, painter: QPainter, font: QFont, x: float, y: float, text: str) -> None:
+        """
+        Zeichnet ``text`` mit der Grundlinie bei ``(x, y)`` wie ``QPainter.drawText(x, y, text)``.
+        :param painter:
+        :param font:
+        :param x:
+        :param y:
+        :param text:
+        :return:
+        """
+        entry: _Text = self.text(painter, font, text)
+        painter.setFont(font)
+        painter.drawStaticText(QPointF(x, y - entry.ascent), entry.static_text)
+
+    def font(self, family: str, size: float, weight: int=-1) -> QFont:
+        """
+        Gibt eine gemeinsame ``QFont`` wieder. ``size`` wird wie bei ``QFont(family, size)`` abgeschnitten.
+        :param family:
+        :param size: Punktgröße
+        :param weight:
+        :return: QFont
+        """
+        key: Tuple[str, int, int] = (family, int(size), weight)
+        font: Optional[QFont] = self.__fonts.get(key)
+        if font is None:
+            font = self.__fonts[key] = QFont(family, int(size), weight)
+        return font
+
+    def measure(self, painter: QPainter, font: QFont, text: str) -> Tuple[int, int]:
+        """
+        Gibt Breite und Höhe von ``text`` wieder, wie ``utils.font_metrics`` mit ``font``.
+        :param painter:
+        :param font:
+        :param text:
+        :return: Tuple[int, int]
+        """
+        entry: _Text = self.text(painter, font, text)
+        return entry.width, entry.height
+
+    def text_size(self, font: QFont, text: str) -> Tuple[int, int]:
+        """
+        Gibt Breite und Höhe von ``text`` wie ``measure`` wieder, aber ohne Zeichengerät, z.B. für ein Layout
+        im GUI-Thread, das erst später in einem Worker-Thread gezeichnet wird.
+        :param font:
+        :param text:
+        :return: Tuple[int, int]
+        """
+        metrics, _ = self.__font_metrics((font.family(), font.pointSize(), font.weight()), font)
+        return metrics.horizontalAdvance(text), metrics.height()
+
+    def text(self, painter: QPainter, font: QFont, text: str) -> _Text:
+        """
+        Gibt den vorbereiteten Text für ``font`` und das ``devicePixelRatio`` des Zeichengeräts wieder.
+        :param painter:
+        :param font:
+        :param text:
+        :return: _Text
+        """
+        font_key: Tuple[str, int, int] = (font.family(), font.pointSize(), font.weight())
+        key: Tuple = (text, font_key, painter.device().devicePixelRatioF())
+        entry: Optional[_Text] = self.__texts.get(key)
+        if entry is not None:
+            self.__texts.move_to_end(key)
+            self.__hits += 1
+            return entry
+
+        self.__misses += 1
+        metrics, metrics_f = self.__font_metrics(font_key, font)
+        static_text: QStaticText = QStaticText(text)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+        static_text.prepare(QTransform(), font)
+
+        entry = self.__texts[key] = _Text(static_text, metrics.horizontalAdvance(text), metrics.height(),
+                                          metrics_f.ascent())
+        if len(self.__texts) > self.__capacity:
+            self.__texts.popitem(last=False)
+        return entry
+
+    def __font_metrics(self, key: Hashable, font: QFont) -> Tuple[QFontMetrics, QFontMetricsF]:
+        metrics: Optional[Tuple[QFontMetrics, QFontMetricsF]] = self.__metrics.get(key)
+        if metrics is None:
+            metrics = self.__metrics[key] = (QFontMetrics(font), QFontMetricsF(font))
+        return metrics
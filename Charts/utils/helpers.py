@@ -1,14 +1,47 @@
 import math
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from PySide6.QtCore import QPoint, QPointF, QRect
-from PySide6.QtGui import QPainter, QFontMetrics, QColor, QLinearGradient
+from PySide6.QtGui import QPainter, QFontMetrics, QColor
 from PySide6.QtWidgets import QWidget, QGraphicsDropShadowEffect
 
+from .cache.brush_cache import BrushCache
+from .shadow import ShadowMode, _DropShadow
 
-def add_shadow(widget: QWidget):
-    shadow: QGraphicsDropShadowEffect = QGraphicsDropShadowEffect(widget, offset=QPointF(0,0), blurRadius=20)
-    widget.setGraphicsEffect(shadow)
+
+def add_shadow(widget: QWidget, mode: ShadowMode=ShadowMode.Cached, *, radius: int=20,
+               color: Optional[QColor]=None) -> None:
+    """
+    Versieht das Widget mit einem Schatten.\n
+    - ``ShadowMode.Cached`` zeichnet einen vorgerenderten Schatten aus dem ``ShadowCache`` unter das Widget.
+      Angezeigte Widgets ohne Parent (Fenster) bekommen stattdessen einen ``QGraphicsDropShadowEffect``,
+      nie angezeigte (``QWidget.render``, z.B. ``batch_render``) keinen Schatten.
+    - ``ShadowMode.Effect`` verwendet einen ``QGraphicsDropShadowEffect``. Dieser rendert das Widget bei
+      jedem Repaint offscreen und zeichnet es erneut weich.
+
+    Ein erneuter Aufruf ersetzt den bisherigen Schatten.
+    :param widget:
+    :param mode:
+    :param radius:
+    :param color: Default ``R:63`` ``G:63`` ``B:63`` ``A:180``
+    :return:
+    """
+    previous: Optional[_DropShadow] = getattr(widget, "_drop_shadow", None)
+    if previous is not None:
+        previous.detach()
+        widget._drop_shadow = None
+
+    if color is None:
+        color = QColor(63, 63, 63, 180)
+
+    if mode == ShadowMode.Effect:
+        shadow: QGraphicsDropShadowEffect = QGraphicsDropShadowEffect(widget, offset=QPointF(0,0), blurRadius=radius)
+        shadow.setColor(color)
+        widget.setGraphicsEffect(shadow)
+        return
+
+    widget.setGraphicsEffect(None)
+    widget._drop_shadow = _DropShadow(widget, radius, color)
 
 
 def font_metrics(painter: QPainter, text: str):
@@ -18,13 +51,14 @@ def font_metrics(painter: QPainter, text: str):
     return w, h
 
 def linear_gradient(painter: QPainter, base_color: QColor, rect: QRect) -> None:
-    lg: QLinearGradient = QLinearGradient(
-        QPointF(rect.center().x(), rect.bottom()),
-        QPointF(rect.center().x(), rect.top())
-    )
-    lg.setColorAt(0, base_color.lighter(200))
-    lg.setColorAt(1, base_color.darker(200))
-    painter.setBrush(lg)
+    """
+    Setzt einen vertikalen Verlauf über ``rect`` als Brush. Der Brush kommt aus dem ``BrushCache``.
+    :param painter:
+    :param base_color:
+    :param rect:
+    :return:
+    """
+    painter.setBrush(BrushCache.shared().linear_gradient(base_color, rect))
 
 
 def longest_name(entries: Dict[str, float]) -> str:
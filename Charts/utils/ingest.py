@@ -0,0 +1,338 @@
+import csv
+import json
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+Column = Union[str, int]
+FORMATS: Dict[str, str] = {".csv": "csv", ".tsv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+CHUNK_SIZE: int = 32 * 1024 * 1024
+
+
+class _Partial:
+    __slots__ = ("sums", "rows", "skipped", "size")
+
+    sums: Dict[str, float]
+    rows: int
+    skipped: int
+    size: int
+
+    def __init__(self, sums: Dict[str, float], rows: int, skipped: int, size: int):
+        self.sums = sums
+        self.rows = rows
+        self.skipped = skipped
+        self.size = size
+
+
+class _Plan:
+    """
+    Aufteilung einer Datei in Byte-Bereiche samt allem, was ein Worker zum Lesen braucht. Wird an die Prozesse
+    übergeben und enthält deshalb nur einfache Werte.
+    """
+    __slots__ = ("category", "delimiter", "encoding", "file_format", "path", "ranges", "size", "value")
+
+    category: Column
+    delimiter: str
+    encoding: str
+    file_format: str
+    path: str
+    ranges: List[Tuple[int, int]]
+    size: int
+    value: Optional[Column]
+
+    def __init__(self, path: str, category: Column, value: Optional[Column], file_format: Optional[str],
+                 delimiter: Optional[str], encoding: str, header: bool, chunk_size: int):
+        extension: str = os.path.splitext(path)[1].lower()
+        if file_format is None:
+            if extension not in FORMATS:
+                raise ValueError(f"Unbekanntes Format: '{extension}', 'file_format' angeben")
+            file_format = FORMATS[extension]
+        if file_format not in FORMATS.values():
+            raise ValueError(f"Unbekanntes Format: '{file_format}'")
+        if chunk_size <= 0:
+            raise ValueError("'chunk_size' muss größer als 0 sein.")
+
+        self.category = category
+        self.delimiter = delimiter or ("\t" if extension == ".tsv" else ",")
+        self.encoding = encoding
+        self.file_format = file_format
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.value = value
+
+        first: int = 0
+        if file_format == "csv" and header:
+            with open(path, "rb") as file:
+                line: bytes = file.readline()
+            first = len(line)
+            columns: List[str] = next(
+                csv.reader([line.decode(encoding).lstrip("\ufeff")], delimiter=self.delimiter), [])
+            self.category = _column_index(columns, category)
+            self.value = None if value is None else _column_index(columns, value)
+        self.ranges = [(start, min(start + chunk_size, self.size)) for start in range(first, self.size, chunk_size)]
+
+
+def _column_index(columns: List[str], column: Column) -> int:
+    if isinstance(column, int):
+        return column
+    try:
+        return columns.index(column)
+    except ValueError:
+        raise KeyError(f"Die Spalte '{column}' existiert nicht.") from None
+
+
+def _lines(path: str, start: int, end: int) -> Iterator[bytes]:
+    """
+    Gibt alle Zeilen wieder, die im Bereich ``[start, end)`` beginnen. Eine angeschnittene erste Zeile gehört
+    zum vorherigen Bereich, die letzte Zeile wird über ``end`` hinaus zu Ende gelesen.
+    :param path:
+    :param start:
+    :param end:
+    :return: Iterator[bytes]
+    """
+    with open(path, "rb", buffering=1024 * 1024) as file:
+        position: int = start
+        if start > 0:
+            file.seek(start - 1)
+            position = start - 1 + len(file.readline())
+        while position < end:
+            line: bytes = file.readline()
+            if not line:
+                return
+            position += len(line)
+            yield line
+
+
+def _json_record(line: bytes) -> Optional[Dict]:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def _aggregate_range(plan: _Plan, start: int, end: int) -> _Partial:
+    """
+    Summiert den Bereich ``[start, end)`` der Datei. Läuft im Worker (Thread oder Prozess), der Speicher wächst
+    nur mit der Anzahl der Kategorien.
+    :param plan:
+    :param start:
+    :param end:
+    :return: _Partial
+    """
+    lines: Iterable[bytes] = (line for line in _lines(plan.path, start, end) if line.strip())
+    if plan.file_format == "csv":
+        records: Iterable = csv.reader((line.decode(plan.encoding) for line in lines), delimiter=plan.delimiter)
+    else:
+        records: Iterable = map(_json_record, lines)
+
+    sums: Dict[str, float] = dict()
+    rows: int = 0
+    skipped: int = 0
+    category: Column = plan.category
+    value: Optional[Column] = plan.value
+    for record in records:
+        rows += 1
+        try:
+            key: str = str(record[category])
+            amount: float = 1.0 if value is None else float(record[value])
+        except (IndexError, KeyError, TypeError, ValueError):
+            skipped += 1
+            continue
+        sums[key] = sums.get(key, 0.0) + amount
+    return _Partial(sums, rows, skipped, end - start)
+
+
+def _merge(target: Dict[str, float], partial: Dict[str, float]) -> None:
+    for key, amount in partial.items():
+        target[key] = target.get(key, 0.0) + amount
+
+
+def _executor(workers: int) -> Executor:
+    if workers > 1:
+        # ``spawn`` statt ``fork``: Qt ist nach einem ``fork`` nicht zuverlässig nutzbar
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    return ThreadPoolExecutor(max_workers=1)
+
+
+def aggregate_file(path: str, category: Column, value: Optional[Column]=None, *, file_format: Optional[str]=None,
+                   delimiter: Optional[str]=None, encoding: str="utf-8", header: bool=True,
+                   chunk_size: int=CHUNK_SIZE, workers: int=1,
+                   progress: Optional[Callable[[int, int], None]]=None) -> Dict[str, float]:
+    """
+    Liest eine CSV- oder JSON-Lines-Datei in Abschnitten von ``chunk_size`` Bytes und summiert ``value`` pro
+    ``category``. Ohne ``value`` wird pro Zeile 1 gezählt. Blockiert bis zum Ende, siehe ``FileAggregation``
+    für Widgets.\n
+    Mit ``workers`` > 1 werden die Abschnitte auf einen Prozesspool verteilt und die Teilsummen zusammengeführt.
+    Zeilen ohne Kategorie oder mit ungültigem Wert werden übersprungen. Felder mit Zeilenumbrüchen werden nicht
+    unterstützt.
+    :param path:
+    :param category: Spaltenname oder -index (CSV) bzw. Schlüssel (JSON Lines)
+    :param value: wie ``category``
+    :param file_format: ``csv`` oder ``jsonl``, ohne Angabe aus der Dateiendung
+    :param delimiter: Default ``,`` bzw. Tab bei ``.tsv``
+    :param encoding:
+    :param header: CSV mit Kopfzeile
+    :param chunk_size:
+    :param workers:
+    :param progress: Wird nach jedem Abschnitt mit (gelesene Bytes, Dateigröße) aufgerufen
+    :return: Dict[str, float]
+    """
+    plan: _Plan = _Plan(path, category, value, file_format, delimiter, encoding, header, chunk_size)
+    sums: Dict[str, float] = dict()
+    done: int = 0
+    pending: Deque[Future] = deque()
+    with _executor(workers) as executor:
+        ranges: Iterator[Tuple[int, int]] = iter(plan.ranges)
+        while True:
+            # Höchstens zwei Abschnitte pro Worker gleichzeitig, übernommen wird in der Reihenfolge der Datei
+            for start, end in ranges:
+                pending.append(executor.submit(_aggregate_range, plan, start, end))
+                if len(pending) >= workers * 2:
+                    break
+            if not pending:
+                return sums
+            partial: _Partial = pending.popleft().result()
+            _merge(sums, partial.sums)
+            done += partial.size
+            if progress is not None:
+                progress(done, plan.size)
+
+
+class FileAggregation(QObject):
+    """
+    Wie ``aggregate_file``, aber ohne den GUI-Thread zu blockieren.\n
+    Die Abschnitte werden in einem Worker-Thread bzw. mit ``workers`` > 1 auf einem Prozesspool gelesen.
+    Ein ``QTimer`` sammelt die Teilsummen in der Reihenfolge der Datei ein, meldet den Fortschritt per
+    ``progress`` und reicht neue Abschnitte nach. Es sind höchstens zwei Abschnitte pro Worker gleichzeitig
+    unterwegs, der Speicher wächst also mit der Anzahl der Kategorien, nicht mit der Größe der Datei.\n
+    Am Ende wird ``apply`` mit allen Summen aufgerufen (z.B. ``PieChart.set_entries``) und ``finished``
+    gesendet.
+    """
+    failed: Signal = Signal(str)
+    finished: Signal = Signal(dict)
+    progress: Signal = Signal(int, int)
+
+    __POLL_INTERVAL: int = 50
+
+    __apply: Optional[Callable[[Dict[str, float]], None]]
+    __done: int
+    __executor: Optional[Executor]
+    __next: int
+    __pending: Deque[Future]
+    __plan: Optional[_Plan]
+    __plan_args: Tuple
+    __rows: int
+    __skipped: int
+    __sums: Dict[str, float]
+    __timer: QTimer
+    __workers: int
+
+    def __init__(self, path: str, category: Column, value: Optional[Column]=None, *,
+                 apply: Optional[Callable[[Dict[str, float]], None]]=None, file_format: Optional[str]=None,
+                 delimiter: Optional[str]=None, encoding: str="utf-8", header: bool=True,
+                 chunk_size: int=CHUNK_SIZE, workers: int=1, parent: QObject=None):
+        super().__init__(parent)
+        self.__apply = apply
+        self.__done = 0
+        self.__executor = None
+        self.__next = 0
+        self.__pending = deque()
+        self.__plan = None
+        self.__plan_args = (path, category, value, file_format, delimiter, encoding, header, chunk_size)
+        self.__rows = 0
+        self.__skipped = 0
+        self.__sums = dict()
+        self.__workers = max(1, workers)
+
+        self.__timer = QTimer(self)
+        self.__timer.setInterval(FileAggregation.__POLL_INTERVAL)
+        self.__timer.timeout.connect(self.__poll)
+
+    @classmethod
+    def for_pie_chart(cls, chart: "PieChart", path: str, category: Column, value: Optional[Column]=None,
+                      **kwargs) -> "FileAggregation":
+        """
+        Übernimmt die Summen am Ende per ``set_entries`` in ``chart``, mit dessen aktuellem ``sort_type``.
+        :param chart:
+        :param path:
+        :param category:
+        :param value:
+        :param kwargs: siehe ``FileAggregation``
+        :return: FileAggregation
+        """
+        return cls(path, category, value, apply=lambda sums: chart.set_entries(sums, chart.sort_type),
+                   parent=chart, **kwargs)
+
+    @property
+    def rows(self) -> int:
+        """
+        Anzahl der bisher gelesenen Zeilen (ohne Kopfzeile und Leerzeilen).
+        :return: int
+        """
+        return self.__rows
+
+    @property
+    def skipped(self) -> int:
+        """
+        Anzahl der übersprungenen Zeilen.
+        :return: int
+        """
+        return self.__skipped
+
+    def start(self) -> "FileAggregation":
+        """
+        Teilt die Datei auf und startet das Lesen. Fehler beim Öffnen oder in der Kopfzeile werden direkt
+        geworfen.
+        :return: FileAggregation
+        """
+        self.__plan = _Plan(*self.__plan_args)
+        self.__executor = _executor(self.__workers)
+        self.__submit()
+        self.__timer.start()
+        return self
+
+    def cancel(self) -> None:
+        self.__timer.stop()
+        self.__pending.clear()
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+    def __submit(self) -> None:
+        while self.__next < len(self.__plan.ranges) and len(self.__pending) < self.__workers * 2:
+            start, end = self.__plan.ranges[self.__next]
+            self.__pending.append(self.__executor.submit(_aggregate_range, self.__plan, start, end))
+            self.__next += 1
+
+    def __poll(self) -> None:
+        merged: int = self.__done
+        while self.__pending and self.__pending[0].done():
+            try:
+                partial: _Partial = self.__pending.popleft().result()
+            except Exception as error:
+                self.cancel()
+                self.failed.emit(f"{type(error).__name__}: {error}")
+                return
+            _merge(self.__sums, partial.sums)
+            self.__rows += partial.rows
+            self.__skipped += partial.skipped
+            self.__done += partial.size
+        if self.__done != merged:
+            self.progress.emit(self.__done, self.__plan.size)
+
+        self.__submit()
+        if self.__pending:
+            return
+
+        self.cancel()
+        try:
+            if self.__apply is not None:
+                self.__apply(self.__sums)
+        except Exception as error:
+            self.failed.emit(f"{type(error).__name__}: {error}")
+            return
+        self.finished.emit(self.__sums)
@@ -0,0 +1,213 @@
+from array import array
+import heapq
+from collections import deque
+from collections.abc import Mapping
+from itertools import count
+from typing import Deque, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from PySide6.QtCore import QObject, Signal
+
+from utils.animations import Behavior
+
+
+class RingBuffer:
+    """
+    Ringpuffer fester Größe mit den letzten ``capacity`` Werten einer Messreihe.\n
+    Die Werte liegen in einem ``array('d')``, ein neuer Wert überschreibt den ältesten.
+    Das Maximum des Fensters wird in einer monoton fallenden ``deque`` mitgeführt, ``append`` kostet dadurch
+    amortisiert O(1) und ``maximum`` O(1), statt bei jedem Wert das ganze Fenster zu durchsuchen.
+    """
+    __slots__ = ("_capacity", "_count", "_maxima", "_values")
+
+    _capacity: int
+    _count: int
+    _maxima: Deque[Tuple[int, float]]
+    _values: array
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("'capacity' muss mindestens 1 sein.")
+        self._capacity = capacity
+        self._count = 0
+        self._maxima = deque()
+        self._values = array("d", bytes(8 * capacity))
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.values())
+
+    def __len__(self) -> int:
+        return min(self._count, self._capacity)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def latest(self) -> Optional[float]:
+        """
+        Gibt den zuletzt angehängten Wert wieder oder ``None``, solange der Puffer leer ist.
+        :return: Optional[float]
+        """
+        if not self._count:
+            return None
+        return self._values[(self._count - 1) % self._capacity]
+
+    @property
+    def maximum(self) -> Optional[float]:
+        """
+        Gibt das Maximum der Werte im Fenster wieder oder ``None``, solange der Puffer leer ist.
+        :return: Optional[float]
+        """
+        return self._maxima[0][1] if self._maxima else None
+
+    def append(self, value: float) -> None:
+        """
+        Hängt ``value`` an und verdrängt den ältesten Wert, sobald der Puffer voll ist.\n
+        In ``_maxima`` stehen (Position, Wert)-Paare mit fallenden Werten. Kleinere Werte davor können nie mehr
+        das Maximum werden und fallen heraus, vorne fällt höchstens der Wert heraus, der das Fenster verlässt.
+        :param value:
+        :return:
+        """
+        value = float(value)
+        position: int = self._count
+        self._values[position % self._capacity] = value
+        self._count += 1
+
+        maxima: Deque[Tuple[int, float]] = self._maxima
+        while maxima and maxima[-1][1] <= value:
+            maxima.pop()
+        maxima.append((position, value))
+        if maxima[0][0] <= position - self._capacity:
+            maxima.popleft()
+
+    def clear(self) -> None:
+        self._count = 0
+        self._maxima.clear()
+
+    def values(self) -> List[float]:
+        """
+        Gibt die Werte im Fenster vom ältesten zum neuesten wieder.
+        :return: List[float]
+        """
+        if self._count <= self._capacity:
+            return self._values[:self._count].tolist()
+        start: int = self._count % self._capacity
+        return (self._values[start:] + self._values[:start]).tolist()
+
+
+class LiveSeries(QObject):
+    """
+    Bindet Messreihen an die Füllstände (``level``) von ``CubeItem``'s. Übergeben wird ein einzelnes ``CubeItem``
+    (Schlüssel ``None``) oder ``{key: CubeItem}``.\n
+    Pro Schlüssel werden die letzten ``capacity`` Werte in einem ``RingBuffer`` gehalten. Jeder Cube zeigt den
+    letzten Wert seiner Reihe, skaliert auf das Maximum aller Fenster. Ein neuer Wert kostet im ``RingBuffer``
+    amortisiert O(1). Das gemeinsame Maximum kommt aus einem Heap der Maxima der Reihen, der nur einen Eintrag
+    bekommt, wenn sich das Maximum einer Reihe ändert. Veraltete Einträge fallen erst heraus, wenn sie oben liegen.\n
+    Die Höhen werden per ``Behavior`` über ``duration`` Millisekunden animiert, und nur für Cubes, deren
+    Ziel-Füllstand sich ändert.
+    ``CubeItem.set_level`` zeichnet zudem nur neu, wenn sich die Höhe in Pixeln ändert.\n
+    ``push`` passt als ``apply`` zu ``StreamBinding`` (siehe ``StreamBinding.for_live_series``).
+    """
+    maximumChanged: Signal = Signal(float)
+
+    __buffers: Dict[Hashable, RingBuffer]
+    __duration: int
+    __heads: Dict[Hashable, Tuple[float, int]]
+    __heap: List[Tuple[float, int, Hashable]]
+    __items: Dict[Hashable, "CubeItem"]
+    __levels: Dict[Hashable, float]
+    __maximum: float
+    __serial: Iterator[int]
+
+    def __init__(self, items: Union["CubeItem", Mapping[Hashable, "CubeItem"]], capacity: int, *,
+                 duration: int=300, parent: QObject=None):
+        targets: Mapping[Hashable, "CubeItem"] = items if isinstance(items, Mapping) else {None: items}
+        super().__init__(parent if parent is not None else next(iter(targets.values()), None))
+        self.__buffers = {key: RingBuffer(capacity) for key in targets}
+        self.__duration = duration
+        self.__heads = dict()
+        self.__heap = list()
+        self.__items = dict(targets)
+        self.__levels = dict()
+        self.__maximum = 0.0
+        self.__serial = count()
+
+    @property
+    def maximum(self) -> float:
+        """
+        Gemeinsames Maximum aller Fenster, auf das die Cubes skaliert werden.
+        :return: float
+        """
+        return self.__maximum
+
+    def push(self, samples: Union[Mapping[Hashable, float], float]) -> None:
+        """
+        Hängt neue Werte an ihre Reihen an und passt die Füllstände an. Unbekannte Schlüssel werden ignoriert.
+        :param samples: ``{key: value}`` oder bei einem einzelnen ``CubeItem`` nur der Wert
+        :return:
+        """
+        if not isinstance(samples, Mapping):
+            samples = {None: samples}
+        for key, value in samples.items():
+            buffer: Optional[RingBuffer] = self.__buffers.get(key)
+            if buffer is not None:
+                buffer.append(value)
+                self.__track(key, buffer.maximum)
+
+        maximum: float = self.__global_maximum()
+        keys: Iterable[Hashable] = samples
+        if maximum != self.__maximum:
+            # Ändert sich das Maximum, ändern sich die Füllstände aller Cubes
+            self.__maximum = maximum
+            self.maximumChanged.emit(maximum)
+            keys = self.__buffers
+
+        for key in keys:
+            buffer = self.__buffers.get(key)
+            if buffer is None or not len(buffer):
+                continue
+            item: "CubeItem" = self.__items[key]
+            item.set_value(buffer.latest)
+
+            level: float = max(0.0, buffer.latest / maximum) if maximum > 0 else 0.0
+            if self.__levels.get(key) != level:
+                self.__levels[key] = level
+                Behavior(item, "level", end_value=level).duration(self.__duration).start()
+
+    def __global_maximum(self) -> float:
+        """
+        Gibt das größte Maximum aller Reihen wieder. Einträge, die nicht mehr zum Maximum ihrer Reihe gehören,
+        werden dabei oben vom Heap entfernt.
+        :return: float
+        """
+        heap: List[Tuple[float, int, Hashable]] = self.__heap
+        while heap and self.__heads[heap[0][2]][1] != heap[0][1]:
+            heapq.heappop(heap)
+        return -heap[0][0] if heap else 0.0
+
+    def __track(self, key: Hashable, maximum: float) -> None:
+        """
+        Legt das Maximum der Reihe ``key`` auf den Heap, wenn es sich geändert hat.
+        :param key:
+        :param maximum:
+        :return:
+        """
+        head: Optional[Tuple[float, int]] = self.__heads.get(key)
+        if head is not None and head[0] == maximum:
+            return
+        serial: int = next(self.__serial)
+        self.__heads[key] = (maximum, serial)
+        if len(self.__heap) > 2 * len(self.__buffers) + 16:
+            # Zu viele veraltete Einträge, der Heap wird aus den aktuellen Maxima neu aufgebaut
+            self.__heap = [(-value, serial, key) for key, (value, serial) in self.__heads.items()]
+            heapq.heapify(self.__heap)
+        else:
+            heapq.heappush(self.__heap, (-maximum, serial, key))
+
+    def series(self, key: Hashable=None) -> RingBuffer:
+        """
+        Gibt den ``RingBuffer`` der Reihe ``key`` wieder.
+        :param key:
+        :return: RingBuffer
+        """
+        return self.__buffers[key]
@@ -0,0 +1,144 @@
+from enum import Enum, auto
+from typing import Optional
+
+import shiboken6
+from PySide6.QtCore import QEvent, QObject, QPoint, QPointF, QRect
+from PySide6.QtGui import QColor, QPainter, QPainterPath, Qt
+from PySide6.QtWidgets import QGraphicsDropShadowEffect, QWidget
+
+from .cache import ShadowCache
+
+
+class ShadowMode(Enum):
+    Cached = auto()
+    Effect = auto()
+
+
+class _ShadowWidget(QWidget):
+    """
+    Zeichnet den Schatten eines Widgets aus dem ``ShadowCache``.\n
+    Liegt als Geschwister-Widget direkt unter dem Ziel, ``_DropShadow`` hält Geometrie und Sichtbarkeit aktuell.
+    Bietet das Ziel eine Methode ``shadow_path() -> QPainterPath`` an, wird deren Form verwendet
+    (sie darf nur von der Größe des Ziels abhängen), sonst das Rechteck des Ziels.
+    """
+    __color: QColor
+    __radius: int
+    __target: QWidget
+
+    def __init__(self, target: QWidget, radius: int, color: QColor):
+        super().__init__(target.parentWidget())
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.__color = color
+        self.__radius = radius
+        self.__target = target
+        target.destroyed.connect(self.deleteLater)
+
+    def paintEvent(self, event, /):
+        painter: QPainter = QPainter(self)
+        cache: ShadowCache = ShadowCache.shared()
+        dpr: float = self.devicePixelRatioF()
+        shadow_path = getattr(self.__target, "shadow_path", None)
+        if shadow_path is None:
+            target: QRect = self.rect().adjusted(self.__radius, self.__radius, -self.__radius, -self.__radius)
+            cache.draw_rect_shadow(painter, target, self.__radius, self.__color, dpr)
+            return
+
+        path: QPainterPath = shadow_path().translated(self.__radius, self.__radius)
+        shape: str = type(self.__target).__qualname__
+        painter.drawPixmap(QPoint(0, 0), cache.shape_shadow(shape, path, self.size(), self.__radius, self.__color, dpr))
+
+    def sync(self) -> None:
+        r: int = self.__radius
+        self.setGeometry(self.__target.geometry().adjusted(-r, -r, r, r))
+        self.stackUnder(self.__target)
+        self.setVisible(self.__target.isVisible())
+
+
+class _DropShadow(QObject):
+    """
+    Schatten eines Widgets für ``ShadowMode.Cached``. Folgt Geometrie, Sichtbarkeit und Parent des Ziels.\n
+    Mit Parent zeichnet ein ``_ShadowWidget`` den Schatten aus dem ``ShadowCache`` als Geschwister unter das Ziel.
+    Ohne Parent gibt es kein Geschwister-Widget. Solange ein solches Ziel (z.B. ein Fenster) angezeigt wird,
+    bekommt es deshalb wie bei ``ShadowMode.Effect`` einen ``QGraphicsDropShadowEffect``. Nie angezeigte Widgets,
+    die nur per ``QWidget.render`` gezeichnet werden (z.B. ``batch_render``), bekommen keinen, da
+    ``QWidget.render`` ein Widget mit Effekt nicht in ein ``QImage`` zeichnet.
+    """
+    __color: QColor
+    __effect: Optional[QGraphicsDropShadowEffect]
+    __radius: int
+    __target: QWidget
+    __widget: Optional[_ShadowWidget]
+
+    def __init__(self, target: QWidget, radius: int, color: QColor):
+        super().__init__(target)
+        self.__color = color
+        self.__effect = None
+        self.__radius = radius
+        self.__target = target
+        self.__widget = None
+
+        target.installEventFilter(self)
+        self.__reparent(target.isVisible())
+
+    def detach(self) -> None:
+        self.__target.removeEventFilter(self)
+        self.__set_effect(False)
+        self.__set_widget(False)
+        self.deleteLater()
+
+    def eventFilter(self, watched: QObject, event: QEvent, /) -> bool:
+        match event.type():
+            case QEvent.Type.ParentChange:
+                self.__reparent(self.__target.isVisible())
+            case QEvent.Type.Show | QEvent.Type.Hide:
+                if self.__widget is None:
+                    self.__set_effect(event.type() == QEvent.Type.Show)
+                else:
+                    self.__widget.sync()
+            case QEvent.Type.Move | QEvent.Type.Resize | QEvent.Type.ZOrderChange:
+                if self.__widget is not None:
+                    self.__widget.sync()
+        return False
+
+    def __reparent(self, visible: bool) -> None:
+        parentless: bool = self.__target.parentWidget() is None
+        self.__set_widget(not parentless)
+        self.__set_effect(parentless and visible)
+
+    def __set_effect(self, enabled: bool) -> None:
+        """
+        Wird nur beim Wechsel von Parent oder Sichtbarkeit aufgerufen. Ein von außen per ``setGraphicsEffect``
+        ersetzter oder entfernter Effekt bleibt so bis zum nächsten Wechsel unangetastet.
+        :param enabled:
+        :return:
+        """
+        if self.__effect is not None and not shiboken6.isValid(self.__effect):
+            self.__effect = None
+        if enabled and self.__effect is None and self.__target.graphicsEffect() is None:
+            self.__effect = QGraphicsDropShadowEffect(self.__target, offset=QPointF(0, 0), blurRadius=self.__radius)
+            self.__effect.setColor(self.__color)
+            self.__target.setGraphicsEffect(self.__effect)
+        elif not enabled and self.__effect is not None:
+            if self.__target.graphicsEffect() is self.__effect:
+                self.__target.setGraphicsEffect(None)
+            self.__effect = None
+
+    def __set_widget(self, enabled: bool) -> None:
+        """
+        Erzeugt das ``_ShadowWidget`` unter dem Parent des Ziels oder entfernt es. Ohne Parent wird keines
+        angelegt, es wäre sonst ein verstecktes Top-Level-Widget.
+        :param enabled:
+        :return:
+        """
+        if self.__widget is not None and not shiboken6.isValid(self.__widget):
+            self.__widget = None
+        if enabled:
+            if self.__widget is None:
+                self.__widget = _ShadowWidget(self.__target, self.__radius, self.__color)
+            else:
+                self.__widget.setParent(self.__target.parentWidget())
+            self.__widget.sync()
+        elif self.__widget is not None:
+            self.__widget.hide()
+            self.__widget.deleteLater()
+            self.__widget = None
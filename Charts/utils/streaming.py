@@ -0,0 +1,221 @@
+import asyncio
+import time
+from collections.abc import AsyncIterable, Iterable, Iterator, Mapping
+from typing import Any, Callable, Dict, Hashable, Optional, Union
+
+from PySide6.QtCore import QObject, QTimer, Qt, Signal
+
+Source = Union[Iterable, AsyncIterable, asyncio.Queue]
+
+
+class StreamBinding(QObject):
+    """
+    Bindet eine Datenquelle an ein Chart und fasst alle Updates eines Frames zusammen.\n
+    Quelle kann ein (nicht blockierender) Iterator, ein Async-Iterator oder eine ``asyncio.Queue`` sein.
+    Ein Element ist entweder ein ``Mapping`` ``{key: value}``, ein Tupel ``(key, value)`` oder ein einzelner
+    Wert (Schlüssel ``None``). Pro Schlüssel gilt der letzte Wert eines Frames.\n
+    Höchstens ``max_fps`` Mal pro Sekunde wird ``apply`` mit allen gesammelten Werten aufgerufen, das Chart
+    wird also einmal pro Frame aktualisiert und neu gezeichnet.\n
+    Backpressure: Pro Frame werden höchstens ``max_items_per_frame`` Elemente gelesen. Asynchrone Quellen
+    warten danach auf den nächsten Frame, eine begrenzte ``asyncio.Queue`` blockiert so ihren Producer.
+    Asynchrone Quellen brauchen eine in Qt integrierte asyncio-Eventloop (z.B. ``QtAsyncio`` oder ``qasync``).
+    """
+    applied: Signal = Signal(int)
+    finished: Signal = Signal()
+
+    __apply: Callable[[Dict[Hashable, Any]], None]
+    __exhausted: bool
+    __frame_event: Optional[asyncio.Event]
+    __frame_items: int
+    __iterator: Optional[Iterator]
+    __loop: Optional[asyncio.AbstractEventLoop]
+    __max_items_per_frame: int
+    __pending: Dict[Hashable, Any]
+    __received: int
+    __frames: int
+    __source: Source
+    __task: Optional[asyncio.Future]
+    __timer: QTimer
+
+    def __init__(self, source: Source, apply: Callable[[Dict[Hashable, Any]], None], *, max_fps: float=60.0,
+                 max_items_per_frame: int=10_000, loop: Optional[asyncio.AbstractEventLoop]=None,
+                 parent: QObject=None):
+        super().__init__(parent)
+        self.__apply = apply
+        self.__exhausted = False
+        self.__frame_event = None
+        self.__frame_items = 0
+        self.__frames = 0
+        self.__iterator = None
+        self.__loop = loop
+        self.__max_items_per_frame = max_items_per_frame
+        self.__pending = dict()
+        self.__received = 0
+        self.__source = source
+        self.__task = None
+
+        self.__timer = QTimer(self)
+        self.__timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.__timer.timeout.connect(self.__on_frame)
+        self.set_max_fps(max_fps)
+
+    @classmethod
+    def for_cube_items(cls, items: Union["CubeItem", Mapping[Hashable, "CubeItem"]], source: Source,
+                       **kwargs) -> "StreamBinding":
+        """
+        Bindet ``source`` an den ``value`` eines oder mehrerer ``CubeItem``'s.
+        Bei einem einzelnen ``CubeItem`` liefert die Quelle nur Werte.
+        :param items:
+        :param source:
+        :param kwargs: siehe ``StreamBinding``
+        :return: StreamBinding
+        """
+        targets: Mapping[Hashable, "CubeItem"] = items if isinstance(items, Mapping) else {None: items}
+
+        def apply(batch: Dict[Hashable, Any]) -> None:
+            for key, value in batch.items():
+                item = targets.get(key)
+                if item is not None:
+                    item.set_value(value)
+
+        return cls(source, apply, parent=next(iter(targets.values()), None), **kwargs)
+
+    @classmethod
+    def for_live_series(cls, series: "LiveSeries", source: Source, **kwargs) -> "StreamBinding":
+        """
+        Bindet ``source`` an eine ``LiveSeries``. Pro Frame und Schlüssel wird der letzte Wert angehängt.
+        :param series:
+        :param source:
+        :param kwargs: siehe ``StreamBinding``
+        :return: StreamBinding
+        """
+        return cls(source, series.push, parent=series, **kwargs)
+
+    @classmethod
+    def for_pie_chart(cls, chart: "PieChart", source: Source, **kwargs) -> "StreamBinding":
+        """
+        Bindet ``source`` an die Einträge eines ``PieChart``'s. Jeder Frame wird per ``apply_delta`` übernommen.
+        :param chart:
+        :param source:
+        :param kwargs: siehe ``StreamBinding``
+        :return: StreamBinding
+        """
+        return cls(source, chart.apply_delta, parent=chart, **kwargs)
+
+    @property
+    def frames(self) -> int:
+        """
+        Anzahl der Frames, in denen Werte übernommen wurden.
+        :return: int
+        """
+        return self.__frames
+
+    @property
+    def received(self) -> int:
+        """
+        Anzahl der gelesenen Elemente.
+        :return: int
+        """
+        return self.__received
+
+    def set_max_fps(self, max_fps: float) -> None:
+        if max_fps <= 0:
+            raise ValueError("'max_fps' muss größer als 0 sein.")
+        self.__timer.setInterval(max(1, int(1000 / max_fps)))
+
+    def start(self) -> "StreamBinding":
+        source: Source = self.__source
+        if isinstance(source, asyncio.Queue):
+            self.__task = self.__event_loop().create_task(self.__consume_queue(source))
+        elif isinstance(source, AsyncIterable):
+            self.__task = self.__event_loop().create_task(self.__consume_async(source))
+        else:
+            self.__iterator = iter(source)
+        self.__timer.start()
+        return self
+
+    def stop(self) -> None:
+        self.__timer.stop()
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+        self.__iterator = None
+
+    def __event_loop(self) -> asyncio.AbstractEventLoop:
+        if self.__loop is None:
+            try:
+                self.__loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise RuntimeError(
+                    "Asynchrone Quellen brauchen eine laufende asyncio-Eventloop (z.B. QtAsyncio oder qasync)."
+                ) from None
+        return self.__loop
+
+    def __on_frame(self) -> None:
+        if self.__iterator is not None:
+            self.__pull(self.__iterator)
+
+        if self.__pending:
+            batch: Dict[Hashable, Any] = self.__pending
+            self.__pending = dict()
+            self.__apply(batch)
+            self.__frames += 1
+            self.applied.emit(len(batch))
+
+        self.__frame_items = 0
+        if self.__frame_event is not None:
+            self.__frame_event.set()
+
+        if self.__exhausted:
+            self.__timer.stop()
+            self.finished.emit()
+
+    def __pull(self, iterator: Iterator) -> None:
+        """
+        Liest synchron aus ``iterator``, bis ``max_items_per_frame`` erreicht ist oder ein Viertel des Frames
+        verbraucht wurde.
+        :param iterator:
+        :return:
+        """
+        deadline: float = time.perf_counter() + self.__timer.interval() / 4000
+        for i in range(self.__max_items_per_frame):
+            try:
+                self.__put(next(iterator))
+            except StopIteration:
+                self.__iterator = None
+                self.__exhausted = True
+                return
+            if i % 64 == 63 and time.perf_counter() > deadline:
+                return
+
+    def __put(self, item: Any) -> None:
+        self.__received += 1
+        self.__frame_items += 1
+        if isinstance(item, Mapping):
+            self.__pending.update(item)
+        elif isinstance(item, tuple) and len(item) == 2:
+            self.__pending[item[0]] = item[1]
+        else:
+            self.__pending[None] = item
+
+    async def __backpressure(self) -> None:
+        if self.__frame_items < self.__max_items_per_frame:
+            return
+        if self.__frame_event is None:
+            self.__frame_event = asyncio.Event()
+        self.__frame_event.clear()
+        await self.__frame_event.wait()
+
+    async def __consume_async(self, source: AsyncIterable) -> None:
+        try:
+            async for item in source:
+                self.__put(item)
+                await self.__backpressure()
+        finally:
+            self.__exhausted = True
+
+    async def __consume_queue(self, queue: asyncio.Queue) -> None:
+        while True:
+            self.__put(await queue.get())
+            queue.task_done()
+            await self.__backpressure()